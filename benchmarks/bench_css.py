@@ -0,0 +1,45 @@
+"""CSS color string parsing benchmark, against the hex string path.
+
+Run with:
+
+    python -m benchmarks.bench_css
+"""
+
+import timeit
+
+from colorisator import Colorisator
+from colorisator.css import parse_css
+
+
+VALUES = [
+    ("hex", "#3543CA"),
+    ("hex_alpha", "#3543CA80"),
+    ("named", "RebeccaPurple"),
+    ("transparent", "transparent"),
+    ("rgb", "rgb(53 67 202)"),
+    ("rgb_alpha", "rgb(53 67 202 / 50%)"),
+    ("rgba_legacy", "rgba(53, 67, 202, 0.5)"),
+    ("rgb_percent", "rgb(21% 26% 79%)"),
+    ("hsl", "hsl(235 58% 50%)"),
+    ("hsla_legacy", "hsla(235deg, 58%, 50%, 0.5)"),
+]
+
+
+def per_second(func, number=100_000):
+    return number / min(timeit.repeat(func, number=number, repeat=5))
+
+
+def main():
+    hex_rate = per_second(lambda: Colorisator("#3543CA"))
+    print(f"{'input':<12} {'value':<30} {'constructions/s':>16} {'vs hex':>7} {'cached/s':>10} {'parse_css/s':>12}")
+    for name, value in VALUES:
+        rate = per_second(lambda: Colorisator(value))
+        Colorisator.enable_parse_cache()
+        cached = per_second(lambda: Colorisator(value))
+        Colorisator.disable_parse_cache()
+        css = "" if value.startswith("#") else f"{per_second(lambda: parse_css(value)):,.0f}"
+        print(f"{name:<12} {value:<30} {rate:>16,.0f} {rate / hex_rate:>6.0%} {cached:>10,.0f} {css:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Nearest-color benchmark: PaletteIndex k-d tree against a brute force scan.
+
+Run with:
+
+    python -m benchmarks.bench_palette_index
+"""
+
+import random
+import time
+
+from colorisator import Colorisator, PaletteIndex
+
+
+def brute_force(palette, color):
+    return min(
+        range(len(palette)),
+        key=lambda i: (palette[i].r - color.r) ** 2 + (palette[i].g - color.g) ** 2 + (palette[i].b - color.b) ** 2,
+    )
+
+
+def random_colors(n, seed):
+    rng = random.Random(seed)
+    return [Colorisator((rng.random(), rng.random(), rng.random())) for _ in range(n)]
+
+
+def queries_per_second(func, queries):
+    start = time.perf_counter()
+    for q in queries:
+        func(q)
+    return len(queries) / (time.perf_counter() - start)
+
+
+def main():
+    queries = random_colors(500, seed=1)
+    print(f"{'palette':>8} {'build ms':>9} {'brute q/s':>11} {'index q/s':>11} {'speedup':>8}")
+    for size in (16, 256, 1024, 4096, 16384):
+        palette = random_colors(size, seed=size)
+        start = time.perf_counter()
+        index = PaletteIndex(palette)
+        build = (time.perf_counter() - start) * 1000
+        brute = queries_per_second(lambda q: brute_force(palette, q), queries)
+        tree = queries_per_second(index.nearest_index, queries)
+        print(f"{size:>8} {build:>9.1f} {brute:>11,.0f} {tree:>11,.0f} {tree / brute:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
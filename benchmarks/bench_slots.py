@@ -0,0 +1,51 @@
+"""Memory and construction benchmark for Colorisator.
+
+Compares the current ``__slots__`` / lazy HLS layout with the previous layout
+(per-instance ``__dict__`` and HLS computed eagerly in ``__init__``).
+
+Run with:
+
+    python -m benchmarks.bench_slots
+"""
+
+import colorsys
+import timeit
+import tracemalloc
+
+from colorisator import Colorisator
+
+
+class EagerColorisator:
+    """Previous Colorisator layout: seven attributes in a __dict__, eager HLS."""
+
+    def __init__(self, value, alpha=1.0):
+        self.r, self.g, self.b, self.a = Colorisator._parse_input(None, value, alpha)
+        self.h, self.l, self.s = colorsys.rgb_to_hls(self.r, self.g, self.b)
+
+
+def bytes_per_instance(cls, n=100_000):
+    values = [(i % 256, (i // 256) % 256, 128) for i in range(n)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(v) for v in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Subtract the list holding the objects, only the instances are measured.
+    return (after - before - objects.__sizeof__()) / n
+
+
+def constructions_per_second(cls, value="#3543CA", number=200_000):
+    seconds = timeit.timeit(lambda: cls(value), number=number)
+    return number / seconds
+
+
+def main():
+    print(f"{'layout':<8} {'bytes/instance':>15} {'constructions/s':>16}")
+    for name, cls in (("before", EagerColorisator), ("after", Colorisator)):
+        size = bytes_per_instance(cls)
+        rate = constructions_per_second(cls)
+        print(f"{name:<8} {size:>15.1f} {rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Benchmark suite: parsing, operations, palettes, gradients and output formats.
+
+Every case reports calls per second (best of several timeit repeats) and the
+peak memory allocated by one call (tracemalloc). Results can be saved as a
+JSON baseline; when compared with a previous baseline, the run fails (exit
+status 1) if a case is slower, or allocates more, beyond the threshold.
+
+Run with:
+
+    python -m benchmarks.bench_suite
+    python -m benchmarks.bench_suite --save baseline.json
+    python -m benchmarks.bench_suite --compare baseline.json --threshold 0.25
+    python -m benchmarks.bench_suite --filter gradient --quick
+
+Timings are only comparable between runs on the same machine and Python version.
+"""
+
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import timeit
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from colorisator import (
+    ColorArray, Colorisator, ColorisatorFormat,
+    palette_hue_shifts_many, palette_material_many, palette_monochromatic_many,
+)
+
+
+HEX = "#3543CA"
+ARRAY_SIZE = 1000
+
+# Allocation differences below this many bytes are ignored (interpreter noise).
+ALLOC_SLACK = 512
+
+
+@contextmanager
+def parse_cache():
+    Colorisator.enable_parse_cache()
+    try:
+        yield
+    finally:
+        Colorisator.disable_parse_cache()
+
+
+def random_hex(n, seed=0):
+    rng = random.Random(seed)
+    return [f"#{rng.randrange(1 << 24):06X}" for _ in range(n)]
+
+
+def parse_cases():
+    buffer = bytes((53, 67, 202, 255))
+    cases = [
+        ("hex", lambda: Colorisator(HEX)),
+        ("hex_short", lambda: Colorisator("#35C")),
+        ("hex_alpha", lambda: Colorisator("#3543CA80")),
+        ("hex_bare", lambda: Colorisator("3543CA")),
+        ("rgb255", lambda: Colorisator((53, 67, 202))),
+        ("rgba255", lambda: Colorisator((53, 67, 202, 128))),
+        ("rgb", lambda: Colorisator((0.2, 0.26, 0.79))),
+        ("rgba", lambda: Colorisator((0.2, 0.26, 0.79, 0.5))),
+        ("list", lambda: Colorisator([53, 67, 202])),
+        ("css_named", lambda: Colorisator("rebeccapurple")),
+        ("css_rgb", lambda: Colorisator("rgb(53 67 202 / 50%)")),
+        ("css_hsl", lambda: Colorisator("hsl(235deg 58% 50%)")),
+        ("buffer", lambda: Colorisator.from_buffer(buffer)),
+        ("oklab", lambda: Colorisator.from_oklab(0.5, 0.02, -0.2)),
+        ("oklch", lambda: Colorisator.from_oklch(0.5, 0.2, 270)),
+        ("lab", lambda: Colorisator.from_lab(35, 30, -70)),
+    ]
+    cases = [(name, func, None) for name, func in cases]
+    cases.append(("hex_cached", lambda: Colorisator(HEX), parse_cache))
+    values = random_hex(ARRAY_SIZE)
+    cases.append((f"array_{ARRAY_SIZE}", lambda: ColorArray(values), None))
+    return cases
+
+
+OPERATIONS = [
+    ("lighten", (0.1,)),
+    ("darken", (0.1,)),
+    ("saturate", (0.1,)),
+    ("desaturate", (0.1,)),
+    ("adjust_hue", (0.1,)),
+    ("tint", (0.1,)),
+    ("shade", (0.1,)),
+    ("grayscale", ()),
+    ("complement", ()),
+    ("invert", ()),
+]
+
+
+def operation_cases():
+    color = Colorisator(HEX)
+    other = Colorisator("#F0A030")
+    colors = ColorArray(random_hex(ARRAY_SIZE))
+    cases = []
+    for name, args in OPERATIONS:
+        method = getattr(color, name)
+        cases.append((name, lambda method=method, args=args: method(*args), None))
+        static = getattr(Colorisator, name)
+        cases.append((f"{name}_hex", lambda static=static, args=args: static(HEX, *args, output="hex"), None))
+        batch = getattr(colors, name)
+        cases.append((f"{name}_array_{ARRAY_SIZE}", lambda batch=batch, args=args: batch(*args), None))
+    cases.append(("mix", lambda: color.mix(other), None))
+    cases.append(("mix_hex", lambda: Colorisator.mix(HEX, "#F0A030", output="hex"), None))
+    pipeline = Colorisator.pipeline().lighten(0.1).saturate(0.1).adjust_hue(0.05)
+    cases.append((f"pipeline_array_{ARRAY_SIZE}", lambda: pipeline.apply_many(colors), None))
+    return cases
+
+
+PALETTES = [
+    ("hue_shifts", (5,)),
+    ("triadic", ()),
+    ("tetradic", ()),
+    ("split_complementary", ()),
+    ("analogous", ()),
+    ("monochromatic", ()),
+    ("material", ()),
+]
+
+
+def palette_cases():
+    color = Colorisator(HEX)
+    cases = []
+    for name, args in PALETTES:
+        method = getattr(color, f"palette_{name}")
+        cases.append((name, lambda method=method, args=args: method(*args), None))
+        cases.append((f"{name}_hex", lambda method=method, args=args: method(*args, output="hex"), None))
+    colors = ColorArray(random_hex(ARRAY_SIZE))
+    for name, func, args in (
+        ("hue_shifts", palette_hue_shifts_many, (5,)),
+        ("monochromatic", palette_monochromatic_many, ()),
+        ("material", palette_material_many, ()),
+    ):
+        cases.append((f"{name}_many_{ARRAY_SIZE}", lambda func=func, args=args: func(colors, *args), None))
+    return cases
+
+
+def gradient_cases(max_steps):
+    start, end = Colorisator(HEX), Colorisator("#F0A030")
+    stops = [start, Colorisator("#FFFFFF"), end]
+    cases = []
+    for steps in (10, 1000, 100_000, 1_000_000):
+        if steps > max_steps:
+            break
+        for output in (None, "hex"):
+            suffix = "" if output is None else f"_{output}"
+            cases.append((
+                f"{steps}{suffix}",
+                lambda steps=steps, output=output: Colorisator.gradient(start, end, steps, output=output),
+                None,
+            ))
+        cases.append((
+            f"stops_{steps}_hex",
+            lambda steps=steps: Colorisator.gradient_stops(stops, steps=steps, output="hex"),
+            None,
+        ))
+    cases.append(("oklab_1000", lambda: Colorisator.gradient(start, end, 1000, space="oklab"), None))
+    return cases
+
+
+def format_cases():
+    color = Colorisator("#3543CA80")
+    colors = ColorArray(random_hex(ARRAY_SIZE))
+    cases = []
+    for output in ColorisatorFormat:
+        name = output.value
+        cases.append((name, lambda output=output: Colorisator._format_output(color, output), None))
+        cases.append((f"{name}_array_{ARRAY_SIZE}", lambda output=output: colors._format_output(output), None))
+    return cases
+
+
+def all_cases(quick=False):
+    groups = [
+        ("parse", parse_cases()),
+        ("operation", operation_cases()),
+        ("palette", palette_cases()),
+        ("gradient", gradient_cases(10_000 if quick else 1_000_000)),
+        ("format", format_cases()),
+    ]
+    return [(f"{group}.{name}", func, context) for group, cases in groups for name, func, context in cases]
+
+
+def calls_per_second(func, repeat):
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat, number))
+
+
+def allocated_bytes(func):
+    """Peak memory allocated by one call, result included."""
+    func()  # Warm up caches (lookup tables, formatters...) first.
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        func()  # The peak is read after the call returns, so it includes the returned object.
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+
+def run(cases, repeat):
+    """Yield (name, result) for every case, as soon as it is measured."""
+    for name, func, context in cases:
+        with context() if context is not None else nullcontext():
+            yield name, {"ops_per_sec": calls_per_second(func, repeat), "alloc_bytes": allocated_bytes(func)}
+
+
+def regressions(results, baseline, threshold):
+    """List the cases slower, or allocating more, than the baseline beyond threshold.
+
+    Speed is compared in ops/s, like the change printed by main: a threshold of
+    0.25 flags cases that lost more than 25% of their baseline ops/s.
+    """
+    found = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+            found.append(f"{name}: {result['ops_per_sec']:,.0f} ops/s ({change:+.1%}), baseline {base['ops_per_sec']:,.0f}")
+        extra = result["alloc_bytes"] - base["alloc_bytes"]
+        if extra > ALLOC_SLACK and result["alloc_bytes"] > base["alloc_bytes"] * (1 + threshold):
+            found.append(f"{name}: {result['alloc_bytes']:,} bytes allocated, baseline {base['alloc_bytes']:,}")
+    return found
+
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path, results):
+    data = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_suite", description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", help="Only run cases whose name matches this regular expression")
+    parser.add_argument("--quick", action="store_true", help="Fewer repeats, gradients up to 10^4 steps")
+    parser.add_argument("--repeat", type=int, help="Timing repeats per case (default: 5, 1 with --quick)")
+    parser.add_argument("--save", metavar="FILE", help="Save the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="Compare with a JSON baseline, fail on regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Tolerated ops/s drop or allocation growth, as a fraction (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    cases = all_cases(args.quick)
+    if args.filter:
+        pattern = re.compile(args.filter)
+        cases = [case for case in cases if pattern.search(case[0])]
+    repeat = args.repeat or (1 if args.quick else 5)
+    baseline = load_baseline(args.compare) if args.compare else {}
+
+    width = max((len(case[0]) for case in cases), default=4)
+    print(f"{'case':<{width}} {'ops/s':>14} {'alloc bytes':>12} {'vs baseline':>12}")
+    results = {}
+    for name, result in run(cases, repeat):
+        results[name] = result
+        base = baseline.get(name)
+        change = f"{result['ops_per_sec'] / base['ops_per_sec'] - 1:+.1%}" if base else ""
+        print(f"{name:<{width}} {result['ops_per_sec']:>14,.1f} {result['alloc_bytes']:>12,} {change:>12}")
+
+    if args.save:
+        save_baseline(args.save, results)
+    if args.compare:
+        found = regressions(results, baseline, args.threshold)
+        if found:
+            print(f"\n{len(found)} regression(s) beyond {args.threshold:.0%}:", file=sys.stderr)
+            for line in found:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,45 @@
 """Colorisator - A powerful Python library for color manipulation."""
 
 from .colorisator import Colorisator, ColorisatorFormat
+from .color_array import ColorArray
+from .gradient_sampler import GradientSampler
+from .pipeline import Pipeline
+from .lut import GradientLUT
+from .colormap import Colormap
+from .image import recolor_buffer, recolor_image
+from .palette_index import PaletteIndex
+from .quantize import quantize
+from .palettes import palette_hue_shifts_many, palette_material_many, palette_monochromatic_many
+from .packed import PackedArray, PackedColor
+from .dedup import group_by_equal, unique
+from .delta_e import close_pairs, delta_e, delta_e_many, delta_e_matrix
+from .formats import ColorFormatter, register_format, write_colors
 
 __version__ = "1.0.4"
-__all__ = ["Colorisator", "ColorisatorFormat"]
+__all__ = [
+    "Colorisator",
+    "ColorisatorFormat",
+    "ColorArray",
+    "GradientSampler",
+    "Pipeline",
+    "GradientLUT",
+    "Colormap",
+    "PaletteIndex",
+    "quantize",
+    "palette_hue_shifts_many",
+    "palette_monochromatic_many",
+    "palette_material_many",
+    "PackedColor",
+    "PackedArray",
+    "unique",
+    "group_by_equal",
+    "delta_e",
+    "delta_e_many",
+    "delta_e_matrix",
+    "close_pairs",
+    "ColorFormatter",
+    "register_format",
+    "write_colors",
+    "recolor_buffer",
+    "recolor_image",
+]
@@ -0,0 +1,100 @@
+from functools import lru_cache
+from math import gcd
+
+
+# Normalized value of every 8-bit channel, shared by every module (the floats Colorisator parses from hex).
+_BYTE_VALUES = tuple(i / 255 for i in range(256))
+
+
+def exact_bytes(r, g, b, a):
+    """Return (r, g, b, a) as integers between 0 and 255 if every channel is exactly i / 255, else None."""
+    ri, gi, bi, ai = round(r * 255), round(g * 255), round(b * 255), round(a * 255)
+    bv = _BYTE_VALUES
+    try:
+        # Negative indexes wrap around but can never match: table values are not negative.
+        if bv[ri] == r and bv[gi] == g and bv[bi] == b and bv[ai] == a:
+            return ri, gi, bi, ai
+    except IndexError:
+        pass
+    return None
+
+
+def _ramp(s, e, count, stop):
+    """Bytes of channel s -> e at steps j / count for j in range(stop).
+
+    Matches round((s / 255 + (e / 255 - s / 255) * (j / count)) * 255) as computed
+    by the float path: values are rounded half up in integers, and the rare exact
+    ties (only possible when count is even) are recomputed with the float formula.
+    """
+    if not stop:
+        return []
+    d = e - s
+    c2 = 2 * count
+    base = 2 * s * count + count
+    values = [(base + 2 * d * j) // c2 for j in range(stop)]
+    half = count // 2
+    if d and not count % 2:
+        # Ties are the j with d * j = count / 2 (mod count): an arithmetic progression.
+        g = gcd(d, count)
+        if half % g == 0:
+            m = count // g
+            first = (half // g) * pow(d // g, -1, m) % m
+            fs = _BYTE_VALUES[s]
+            fd = _BYTE_VALUES[e] - fs
+            for j in range(first, stop, m):
+                values[j] = round((fs + fd * (j / count)) * 255)
+    return values
+
+
+def gradient_bytes(stops, segment_steps):
+    """Interpolate gradient segments between 8-bit colors, like Colorisator._segments_data.
+
+    Args:
+        stops: List of (r, g, b, a) integer tuples
+        segment_steps: Number of steps of each segment
+
+    Returns:
+        List of (r, g, b, a) integer tuples
+    """
+    out = []
+    last = len(stops) - 2
+    for i, count in enumerate(segment_steps):
+        s, e = stops[i], stops[i + 1]
+        # Each segment but the last drops its end color, which starts the next one.
+        stop = count if i < last else count + 1
+        out.extend(zip(*[_ramp(s[c], e[c], count, stop) for c in range(4)]))
+    return out
+
+
+@lru_cache(maxsize=64)
+def _tint_table(amount):
+    return [round((c + (1 - c) * amount) * 255) for c in _BYTE_VALUES]
+
+
+@lru_cache(maxsize=64)
+def _shade_table(amount):
+    return [round(c * (1 - amount) * 255) for c in _BYTE_VALUES]
+
+
+@lru_cache(maxsize=128)
+def _clamped(table, amount):
+    """Bytes of table(amount) clamped between 0 and 255, for storage in 8-bit channels."""
+    return bytes(min(255, max(0, v)) for v in table(amount))
+
+
+def tint_bytes(color, amount):
+    """Tint an 8-bit color like Colorisator.tint (the result is opaque)."""
+    table = _tint_table(amount)
+    return table[color[0]], table[color[1]], table[color[2]], 255
+
+
+def shade_bytes(color, amount):
+    """Shade an 8-bit color like Colorisator.shade (the result is opaque)."""
+    table = _shade_table(amount)
+    return table[color[0]], table[color[1]], table[color[2]], 255
+
+
+def mix_bytes(start, end, t):
+    """Mix two 8-bit colors like Colorisator.mix."""
+    bv = _BYTE_VALUES
+    return tuple(round((bv[s] + (bv[e] - bv[s]) * t) * 255) for s, e in zip(start, end))
@@ -0,0 +1,313 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .colorisator import Colorisator
+from .color_array import ColorArray
+from .formats import ColorisatorFormat, get_formatter
+from .palettes import palette_hue_shifts_many, palette_material_many, palette_monochromatic_many
+from .spaces import get_space
+
+
+# Operations that map one color to one color, as (option, pipeline method, takes an amount).
+_OPERATIONS = [
+    ("lighten", "lighten", True),
+    ("darken", "darken", True),
+    ("saturate", "saturate", True),
+    ("desaturate", "desaturate", True),
+    ("adjust-hue", "adjust_hue", True),
+    ("tint", "tint", True),
+    ("shade", "shade", True),
+    ("grayscale", "grayscale", False),
+    ("complement", "complement", False),
+    ("invert", "invert", False),
+]
+
+# Fixed hue shifts of the named hue palettes (see the Colorisator.palette_* methods).
+_HUE_PALETTES = {
+    "triadic": 3,
+    "tetradic": 4,
+    "split_complementary": (0, 5/12, 0.5),
+    "analogous": (0, 1/12, 2/12),
+}
+
+_PALETTES = ["hue_shifts", *_HUE_PALETTES, "monochromatic", "material"]
+
+
+class _AppendOperation(argparse.Action):
+    """Record operations in command-line order."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        operations = list(getattr(namespace, "operations", None) or [])
+        operations.append((self.const, values))
+        namespace.operations = operations
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="colorisator",
+        description="Convert and transform colors read from files or stdin, one result per input color.",
+    )
+    parser.add_argument("files", nargs="*", help="Input files (default: stdin, '-' also reads stdin)")
+    parser.add_argument("-f", "--from", dest="input", choices=["lines", "jsonl", "csv"], default="lines",
+                        help="Input format: one color per line, JSON lines or CSV (default: lines)")
+    parser.add_argument("--field", help="JSONL key or CSV column (name or index) holding the color "
+                                        "(default: 'color' for JSON objects, first CSV column)")
+    parser.add_argument("-t", "--to", default=ColorisatorFormat.HEX.value,
+                        help="Output format: " + ", ".join(f.value for f in ColorisatorFormat) + " (default: hex)")
+    parser.add_argument("-o", "--out", help="Output file (default: stdout)")
+
+    ops = parser.add_argument_group("operations", "Applied in command-line order")
+    for option, method, takes_amount in _OPERATIONS:
+        if takes_amount:
+            ops.add_argument(f"--{option}", type=float, metavar="AMOUNT", action=_AppendOperation, const=method,
+                             dest="operations")
+        else:
+            ops.add_argument(f"--{option}", nargs=0, action=_AppendOperation, const=method, dest="operations")
+
+    expand = parser.add_argument_group("expansion", "Turn each color into a palette or gradient (one line per color)")
+    group = expand.add_mutually_exclusive_group()
+    group.add_argument("--palette", choices=_PALETTES, help="Palette generated from each color")
+    group.add_argument("--gradient", nargs=2, metavar=("END", "STEPS"), help="Gradient from each color to END")
+    expand.add_argument("-n", type=int, default=5, help="Number of palette colors (default: 5)")
+    expand.add_argument("--max-delta", type=float, help="Lightness variation of monochromatic and material palettes")
+    expand.add_argument("--space", default="rgb", help="Gradient interpolation space (default: rgb)")
+
+    run = parser.add_argument_group("execution")
+    run.add_argument("--workers", type=int, help="Number of worker processes (default: current process only)")
+    run.add_argument("--chunk-size", type=int, default=4096, help="Colors per batch (default: 4096)")
+    run.add_argument("--skip-invalid", action="store_true", help="Ignore invalid colors instead of failing")
+    return parser
+
+
+class _InputError(Exception):
+    """An input cannot be read (missing file, missing CSV column...); reported without a traceback."""
+
+
+def _read_lines(stream, name):
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if line:
+            yield f"{name}:{number}", line
+
+
+def _read_jsonl(stream, name, field):
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        where = f"{name}:{number}"
+        try:
+            value = json.loads(line)
+            if isinstance(value, dict):
+                value = value[field or "color"]
+        except (ValueError, KeyError):
+            value = line.strip()
+        yield where, value
+
+
+def _read_csv(stream, name, field):
+    rows = csv.reader(stream)
+    if field is None or field.isdigit():
+        column = int(field or 0)
+    else:
+        header = next(rows, [])
+        if field not in header:
+            raise _InputError(f"{name}: no column {field!r} in the CSV header")
+        column = header.index(field)
+    for number, row in enumerate(rows, 1 if field is None or field.isdigit() else 2):
+        if not row:
+            continue
+        where = f"{name}:{number}"
+        yield where, row[column] if column < len(row) else ""
+
+
+def _records(files, input_format, field):
+    """Yield (location, value) for every color of every input, lazily."""
+    for path in files or ["-"]:
+        if path == "-":
+            stream, name, close = sys.stdin, "<stdin>", False
+        else:
+            try:
+                stream = open(path, newline="" if input_format == "csv" else None)
+            except OSError as e:
+                raise _InputError(f"{path}: {e.strerror or e}") from None
+            name, close = path, True
+        try:
+            if input_format == "jsonl":
+                yield from _read_jsonl(stream, name, field)
+            elif input_format == "csv":
+                yield from _read_csv(stream, name, field)
+            else:
+                yield from _read_lines(stream, name)
+        finally:
+            if close:
+                stream.close()
+
+
+def _parse(value):
+    # JSON arrays decode as lists, which Colorisator accepts like tuples.
+    return Colorisator(tuple(value) if isinstance(value, list) else value)
+
+
+def _expand(colors, expansion):
+    """Turn a ColorArray into one ColorArray row per color."""
+    kind, args = expansion
+    if kind == "gradient":
+        end, steps, space = args
+        return [ColorArray(Colorisator.gradient(c, end, steps, space=space)) for c in colors]
+    name, n, max_delta = args
+    if name in _HUE_PALETTES:
+        return palette_hue_shifts_many(colors, _HUE_PALETTES[name])
+    if name == "hue_shifts":
+        return palette_hue_shifts_many(colors, n)
+    if name == "monochromatic":
+        return palette_monochromatic_many(colors, n, 0.1 if max_delta is None else max_delta)
+    return palette_material_many(colors, n, 0.2 if max_delta is None else max_delta)
+
+
+def _convert_chunk(records, pipeline, expansion, output):
+    """Convert a batch of (location, value) records.
+
+    Returns:
+        Tuple (rows, errors): rows is a list of encoded value lists, one per valid
+        color; errors lists the (location, value) of invalid colors
+    """
+    formatter = get_formatter(output)
+    colors, errors = [], []
+    for where, value in records:
+        try:
+            colors.append(_parse(value))
+        except (ValueError, TypeError):
+            errors.append((where, value))
+    colors = ColorArray(colors)
+    if len(pipeline):
+        colors = pipeline.apply_many(colors)
+    if expansion is None:
+        data, hls = colors._data, colors._get_hls() if formatter.needs_hls else None
+        return [[value] for value in formatter.encode(data, hls)], errors
+    rows = []
+    for row in _expand(colors, expansion):
+        rows.append(formatter.encode(row._data, row._get_hls() if formatter.needs_hls else None))
+    return rows, errors
+
+
+def _map_chunks(chunks, args, workers):
+    """Yield converted chunks in order, keeping at most 2 chunks per worker in flight."""
+    if not workers or workers < 2:
+        for chunk in chunks:
+            yield _convert_chunk(chunk, *args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_convert_chunk, chunk, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _chunks(records, size):
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write(stream, converted, formatter, skip_invalid):
+    """Write converted chunks to a stream. Returns the (location, value) of the first invalid color, or None."""
+    declaration = formatter.head is not None
+    if declaration:
+        stream.write(formatter.head)
+    first = True
+    for rows, errors in converted:
+        if errors and not skip_invalid:
+            return errors[0]
+        if declaration:
+            values = [v for row in rows for v in row]
+            if values:
+                stream.write(("" if first else formatter.sep) + formatter.sep.join(values))
+                first = False
+        else:
+            text = formatter.text
+            stream.write("".join(" ".join(text(v) for v in row) + "\n" for row in rows))
+    if declaration:
+        stream.write(formatter.tail + "\n")
+    return None
+
+
+def main(argv=None):
+    """Run the colorisator command-line tool.
+
+    Args:
+        argv: Command-line arguments. Defaults to None (sys.argv[1:]).
+
+    Returns:
+        Exit status: 0 on success, 1 if an input color is invalid, 2 if an input or
+        output file cannot be opened or a --field column is missing from a CSV header
+
+    Raises:
+        SystemExit: With status 2 on invalid arguments
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        formatter = get_formatter(args.to)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    pipeline = Colorisator.pipeline()
+    for method, amount in getattr(args, "operations", None) or []:
+        step = getattr(pipeline, method)
+        pipeline = step(amount) if isinstance(amount, float) else step()
+
+    expansion = None
+    if args.gradient:
+        end, steps = args.gradient
+        try:
+            expansion = ("gradient", (Colorisator(end), int(steps), args.space))
+        except ValueError:
+            parser.error(f"invalid --gradient arguments: {end} {steps}")
+        if int(steps) < 2:
+            parser.error("--gradient needs at least 2 steps")
+        try:
+            get_space(args.space)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.palette:
+        expansion = ("palette", (args.palette, args.n, args.max_delta))
+
+    chunks = _chunks(_records(args.files, args.input, args.field), args.chunk_size)
+    converted = _map_chunks(chunks, (pipeline, expansion, args.to), args.workers)
+    try:
+        stream = open(args.out, "w") if args.out else sys.stdout
+    except OSError as e:
+        print(f"colorisator: {args.out}: {e.strerror or e}", file=sys.stderr)
+        return 2
+    try:
+        error = _write(stream, converted, formatter, args.skip_invalid)
+    except _InputError as e:
+        print(f"colorisator: {e}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # The reader went away (e.g. piped to head): silence the final flush of stdout.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if args.out:
+            stream.close()
+    if error is not None:
+        where, value = error
+        print(f"colorisator: {where}: invalid color {value!r}", file=sys.stderr)
+        return 1
+    return 0
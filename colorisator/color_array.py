@@ -0,0 +1,453 @@
+from array import array
+
+from .colorisator import (
+    Colorisator, _BYTE_VALUES, _buffer_layout, _hls_to_rgb_array, _rgb_to_hls_array, _to_byte
+)
+from .formats import ColorisatorFormat, get_formatter
+from .spaces import to_space_array
+
+
+class ColorArray:
+    def __init__(self, colors=None, alpha=1.0):
+        """Initialize a ColorArray from a sequence of colors.
+
+        A ColorArray stores N colors as a flat N×4 array of floats (RGBA,
+        normalized between 0.0 and 1.0) and applies every operation in a
+        batched loop over it, without creating one Colorisator per color.
+
+        Args:
+            colors: Iterable of colors (Colorisator instances or any valid color format),
+                    or another ColorArray instance. Defaults to None (empty array).
+            alpha: Opacity used for colors that do not define their own alpha. Defaults to 1.0.
+        """
+        self._hls = None
+        if colors is None:
+            self._data = array("d")
+        elif isinstance(colors, ColorArray):
+            self._data = array("d", colors._data)
+            if colors._hls is not None:
+                self._hls = array("d", colors._hls)
+        else:
+            data = array("d")
+            for value in colors:
+                c = value if isinstance(value, Colorisator) else Colorisator(value, alpha)
+                data.extend((c.r, c.g, c.b, c.a))
+            self._data = data
+
+    @classmethod
+    def _from_data(cls, data, hls=None):
+        obj = cls.__new__(cls)
+        obj._data = data
+        obj._hls = hls
+        return obj
+
+    @classmethod
+    def frombuffer(cls, buffer, layout="rgba", alpha=1.0):
+        """Create a ColorArray from a packed 8-bit pixel buffer.
+
+        Channels are read straight from the buffer through strided memoryview
+        slices, without building a Python object per pixel.
+
+        Args:
+            buffer: Any object supporting the buffer protocol (bytes, bytearray,
+                    memoryview, array.array...) holding packed 8-bit channels
+            layout: Channel order: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+            alpha: Opacity used when the layout has no alpha channel. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the layout is unknown or the buffer size is not a multiple of the pixel size
+
+        Returns:
+            New ColorArray instance
+        """
+        offsets, size = _buffer_layout(layout)
+        view = memoryview(buffer).cast("B")
+        if len(view) % size:
+            raise ValueError(f"Buffer size must be a multiple of {size} bytes for layout {layout!r}")
+        n = len(view) // size
+        data = array("d", bytes(32 * n))
+        values = _BYTE_VALUES.__getitem__
+        for channel, offset in enumerate(offsets):
+            if offset is None:
+                data[channel::4] = array("d", [alpha]) * n
+            else:
+                data[channel::4] = array("d", map(values, view[offset::size]))
+        return cls._from_data(data)
+
+    def tobytes(self, layout="rgba"):
+        """Export colors as a packed 8-bit pixel buffer.
+
+        Args:
+            layout: Channel order: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+
+        Raises:
+            ValueError: If the layout is unknown
+
+        Returns:
+            Bytes object of 3 or 4 bytes per color
+        """
+        _, size = _buffer_layout(layout)
+        out = bytearray(size * len(self))
+        self.into(out, layout)
+        return bytes(out)
+
+    def into(self, buffer, layout="rgba", offset=0):
+        """Write colors as packed 8-bit channels into an existing writable buffer.
+
+        Args:
+            buffer: Writable object supporting the buffer protocol (bytearray,
+                    memoryview, array.array...)
+            layout: Channel order: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+            offset: Index of the first pixel to write in the buffer. Defaults to 0.
+
+        Raises:
+            ValueError: If the layout is unknown or the buffer is too small
+
+        Returns:
+            The buffer
+        """
+        offsets, size = _buffer_layout(layout)
+        view = memoryview(buffer).cast("B")
+        start = offset * size
+        end = start + size * len(self)
+        if offset < 0 or end > len(view):
+            raise ValueError("Buffer too small for this ColorArray")
+        for channel, channel_offset in enumerate(offsets):
+            if channel_offset is not None:
+                view[start + channel_offset:end:size] = bytes(map(_to_byte, self._data[channel::4]))
+        return buffer
+
+    @staticmethod
+    def _from_any(value):
+        if isinstance(value, ColorArray):
+            return value
+        return ColorArray(value)
+
+    def __len__(self):
+        return len(self._data) // 4
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            data = array("d")
+            hls = None if self._hls is None else array("d")
+            for i in indices:
+                data.extend(self._data[4 * i:4 * i + 4])
+                if hls is not None:
+                    hls.extend(self._hls[3 * i:3 * i + 3])
+            return ColorArray._from_data(data, hls)
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("ColorArray index out of range")
+        i = 4 * index
+        hls = None
+        if self._hls is not None:
+            hls = tuple(self._hls[3 * index:3 * index + 3])
+        return Colorisator._from_normalized(*self._data[i:i + 4], hls)
+
+    def __repr__(self):
+        return f"ColorArray({self.get_hex()!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, ColorArray) or len(self) != len(other):
+            return False
+        return all(round(x, 4) == round(y, 4) for x, y in zip(self._data, other._data))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def _get_hls(self):
+        if self._hls is None:
+            self._hls = _rgb_to_hls_array(self._data)
+        return self._hls
+
+    def _update_from_hls(self, hls):
+        return ColorArray._from_data(_hls_to_rgb_array(hls, self._data), hls)
+
+    def _map_hls(self, func):
+        """Apply func(h, l, s) -> (h, l, s) to every color in a batched loop, one call per color."""
+        src = self._get_hls()
+        hls = array("d", src)
+        for j in range(0, len(hls), 3):
+            hls[j], hls[j + 1], hls[j + 2] = func(src[j], src[j + 1], src[j + 2])
+        return self._update_from_hls(hls)
+
+    def _format_output(self, output=None):
+        if output is None:
+            return self
+        formatter = get_formatter(output)
+        return formatter.finish(formatter.encode(self._data, self._get_hls() if formatter.needs_hls else None))
+
+    def get_rgb(self):
+        """Get RGB color values normalized between 0.0 and 1.0.
+
+        Returns:
+            List of (red, green, blue) tuples as floats between 0.0 and 1.0
+        """
+        return self._format_output(ColorisatorFormat.RGB)
+
+    def get_rgba(self):
+        """Get RGBA color values normalized between 0.0 and 1.0.
+
+        Returns:
+            List of (red, green, blue, alpha) tuples as floats between 0.0 and 1.0
+        """
+        return self._format_output(ColorisatorFormat.RGBA)
+
+    def get_rgb255(self):
+        """Get RGB color values as integers between 0 and 255.
+
+        Returns:
+            List of (red, green, blue) tuples as integers between 0 and 255
+        """
+        return self._format_output(ColorisatorFormat.RGB255)
+
+    def get_hex(self):
+        """Get colors as hexadecimal strings (without alpha).
+
+        Returns:
+            List of hex color strings in format #RRGGBB
+        """
+        return self._format_output(ColorisatorFormat.HEX)
+
+    def get_hex_alpha(self):
+        """Get colors as hexadecimal strings including alpha channel.
+
+        Returns:
+            List of hex color strings in format #RRGGBBAA
+        """
+        return self._format_output(ColorisatorFormat.HEXALPHA)
+
+    def get_web(self):
+        """Get colors as web-optimized hex strings (shorthand when possible).
+
+        Returns:
+            List of hex color strings in format #RGB or #RRGGBB
+        """
+        return self._format_output(ColorisatorFormat.WEB)
+
+    def get_hsl(self):
+        """Get colors as HSL (Hue, Saturation, Lightness) values.
+
+        Returns:
+            List of (hue, saturation, lightness) tuples as floats between 0.0 and 1.0
+        """
+        return self._format_output(ColorisatorFormat.HSL)
+
+    def _space_tuples(self, space):
+        channels = to_space_array(self._data, space)
+        return [tuple(channels[i:i + 3]) for i in range(0, len(channels), 3)]
+
+    def get_oklab(self):
+        """Get colors as OKLab values (see Colorisator.get_oklab).
+
+        Returns:
+            List of (L, a, b) tuples
+        """
+        return self._space_tuples("oklab")
+
+    def get_oklch(self):
+        """Get colors as OKLCH values (see Colorisator.get_oklch).
+
+        Returns:
+            List of (L, C, h) tuples, hue in degrees
+        """
+        return self._space_tuples("oklch")
+
+    def get_lab(self):
+        """Get colors as CIELAB values (see Colorisator.get_lab).
+
+        Returns:
+            List of (L, a, b) tuples
+        """
+        return self._space_tuples("lab")
+
+    def to_unity(self):
+        """Export colors as a Unity C# list of Color declarations.
+
+        Returns:
+            String containing Unity C# code to declare this palette
+        """
+        return self._format_output(ColorisatorFormat.UNITY)
+
+    def to_processing(self):
+        """Export colors as a Processing color array declaration.
+
+        Returns:
+            String containing Processing code to declare this palette
+        """
+        return self._format_output(ColorisatorFormat.PROCESSING)
+
+    def lighten(self, amount=0.1, output=None):
+        """Increase the lightness of every color.
+
+        Args:
+            amount: Amount to lighten (0.0 to 1.0). Defaults to 0.1.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Lightened colors in the specified output format
+        """
+        return self._map_hls(lambda h, l, s: (h, min(1, l + amount), s))._format_output(output)
+
+    def darken(self, amount=0.1, output=None):
+        """Decrease the lightness of every color.
+
+        Args:
+            amount: Amount to darken (0.0 to 1.0). Defaults to 0.1.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Darkened colors in the specified output format
+        """
+        return self._map_hls(lambda h, l, s: (h, max(0, l - amount), s))._format_output(output)
+
+    def saturate(self, amount=0.1, output=None):
+        """Increase the saturation of every color.
+
+        Args:
+            amount: Amount to increase saturation (0.0 to 1.0). Defaults to 0.1.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            More saturated colors in the specified output format
+        """
+        return self._map_hls(lambda h, l, s: (h, l, min(1, s + amount)))._format_output(output)
+
+    def desaturate(self, amount=0.1, output=None):
+        """Decrease the saturation of every color.
+
+        Args:
+            amount: Amount to decrease saturation (0.0 to 1.0). Defaults to 0.1.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Less saturated colors in the specified output format
+        """
+        return self._map_hls(lambda h, l, s: (h, l, max(0, s - amount)))._format_output(output)
+
+    def adjust_hue(self, amount, output=None):
+        """Shift the hue of every color on the color wheel.
+
+        Args:
+            amount: Amount to shift hue (0.0 to 1.0, wraps around)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Colors with adjusted hue in the specified output format
+        """
+        return self._map_hls(lambda h, l, s: ((h + amount) % 1.0, l, s))._format_output(output)
+
+    def grayscale(self, output=None):
+        """Convert every color to grayscale by removing all saturation.
+
+        Args:
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Grayscale colors in the specified output format
+        """
+        return self._map_hls(lambda h, l, s: (h, l, 0))._format_output(output)
+
+    def complement(self, output=None):
+        """Get the complementary colors (opposite on the color wheel).
+
+        Args:
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Complementary colors in the specified output format
+        """
+        return self.adjust_hue(0.5, output)
+
+    def invert(self, output=None):
+        """Invert every color by subtracting each RGB component from 1.0.
+
+        Args:
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Inverted colors in the specified output format
+        """
+        data = array("d", self._data)
+        for i in range(0, len(data), 4):
+            data[i] = 1 - data[i]
+            data[i + 1] = 1 - data[i + 1]
+            data[i + 2] = 1 - data[i + 2]
+        return ColorArray._from_data(data)._format_output(output)
+
+    def tint(self, amount=0.1, output=None):
+        """Mix every color with white to create tints.
+
+        Like Colorisator.tint, the resulting colors are fully opaque.
+
+        Args:
+            amount: Amount of white to mix (0.0 to 1.0). Defaults to 0.1.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Tinted colors in the specified output format
+        """
+        data = array("d", self._data)
+        for i in range(0, len(data), 4):
+            data[i] = data[i] + (1 - data[i]) * amount
+            data[i + 1] = data[i + 1] + (1 - data[i + 1]) * amount
+            data[i + 2] = data[i + 2] + (1 - data[i + 2]) * amount
+            data[i + 3] = 1.0
+        return ColorArray._from_data(data)._format_output(output)
+
+    def shade(self, amount=0.1, output=None):
+        """Mix every color with black to create shades.
+
+        Like Colorisator.shade, the resulting colors are fully opaque.
+
+        Args:
+            amount: Amount of black to mix (0.0 to 1.0). Defaults to 0.1.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Shaded colors in the specified output format
+        """
+        data = array("d", self._data)
+        for i in range(0, len(data), 4):
+            data[i] = data[i] * (1 - amount)
+            data[i + 1] = data[i + 1] * (1 - amount)
+            data[i + 2] = data[i + 2] * (1 - amount)
+            data[i + 3] = 1.0
+        return ColorArray._from_data(data)._format_output(output)
+
+    def _lerp(self, other, t, output=None):
+        """Linearly interpolate every color towards another color.
+
+        Args:
+            other: Target color(s): a ColorArray of the same length, or a single
+                   color (Colorisator instance or any valid color format)
+            t: Interpolation factor (0.0 returns these colors, 1.0 returns the targets)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Raises:
+            ValueError: If other is a ColorArray of a different length
+
+        Returns:
+            Interpolated colors in the specified output format
+        """
+        src = self._data
+        if isinstance(other, ColorArray):
+            if len(other) != len(self):
+                raise ValueError("ColorArray lengths must match for _lerp")
+            dst = other._data
+        else:
+            end = Colorisator._from_any(other)
+            dst = array("d", (end.r, end.g, end.b, end.a)) * len(self)
+
+        data = array("d", src)
+        for i in range(len(data)):
+            data[i] = src[i] + (dst[i] - src[i]) * t
+        return ColorArray._from_data(data)._format_output(output)
@@ -1,30 +1,181 @@
 import colorsys
-from enum import Enum
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from itertools import chain
 
+from . import byte_kernels, spaces
+from .byte_kernels import _BYTE_VALUES
+from .css import parse_css
+from .formats import ColorisatorFormat, _pack, get_formatter, iter_encode
 
-class ColorisatorFormat(Enum):
-    RGB = "rgb"
-    RGBA = "rgba"
-    RGB255 = "rgb255"
-    HEX = "hex"
-    HEXALPHA = "hexalpha"
-    HSL = "hsl"
-    WEB = "web"
-    PROCESSING = "processing"
-    UNITY = "unity"
+
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
+# Every two-digit hex string (any case) mapped to its normalized channel value.
+_HEX_PAIRS = {x + y: int(x + y, 16) / 255 for x in _HEX_DIGITS for y in _HEX_DIGITS}
+
+# Byte offsets of the (red, green, blue, alpha) channels in a packed pixel.
+_BUFFER_LAYOUTS = {
+    "rgb": (0, 1, 2, None),
+    "rgba": (0, 1, 2, 3),
+    "argb": (1, 2, 3, 0),
+    "bgra": (2, 1, 0, 3),
+}
+
+
+def _buffer_layout(layout):
+    """Return the channel offsets and pixel size (in bytes) of a packed layout."""
+    try:
+        offsets = _BUFFER_LAYOUTS[layout.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"Unsupported buffer layout: {layout!r}") from None
+    return offsets, 3 if offsets[3] is None else 4
+
+
+def _to_byte(c):
+    return min(255, max(0, int(round(c * 255))))
+
+
+def _quantize(c):
+    """Map a channel to the integer grid used by equality (4 decimals)."""
+    return round(round(c, 4) * 10000)
+
+
+def _rgb_to_hls_array(data):
+    """Convert a flat RGBA array to a flat HLS array (3 floats per color).
+
+    A batched loop: colorsys.rgb_to_hls is still called once per color, only the
+    per-color Colorisator objects are avoided.
+    """
+    rgb_to_hls = colorsys.rgb_to_hls
+    hls = array("d", bytes(8 * 3 * (len(data) // 4)))
+    j = 0
+    for i in range(0, len(data), 4):
+        hls[j], hls[j + 1], hls[j + 2] = rgb_to_hls(data[i], data[i + 1], data[i + 2])
+        j += 3
+    return hls
+
+
+def _hls_to_rgb_array(hls, data):
+    """Convert a flat HLS array back to a flat RGBA array, keeping the alpha of ``data``.
+
+    A batched loop calling colorsys.hls_to_rgb once per color.
+    """
+    hls_to_rgb = colorsys.hls_to_rgb
+    out = array("d", data)
+    i = 0
+    for j in range(0, len(hls), 3):
+        out[i], out[i + 1], out[i + 2] = hls_to_rgb(hls[j], hls[j + 1], hls[j + 2])
+        i += 4
+    return out
+
+
+ParseCacheInfo = namedtuple("ParseCacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class _ParseCache:
+    """Thread-safe LRU cache of parsed hex strings, keyed on (normalized hex, alpha)."""
+
+    def __init__(self, maxsize):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._evict()
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return ParseCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def _evict(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+
+_parse_cache = None
 
 
 class Colorisator:
+    __slots__ = ("r", "g", "b", "a", "_h", "_l", "_s")
+
     def __init__(self, value, alpha=1.0):
         """Initialize a Colorisator object from various color formats.
 
+        HLS values are computed lazily, on first access to ``h``, ``l`` or ``s``.
+
         Args:
-            value: Color value as hex string (#RGB, #RRGGBB, #RGBA, #RRGGBBAA),
+            value: Color value as hex string (#RGB, #RRGGBB, #RGBA, #RRGGBBAA), CSS color
+                   string (named color, "transparent", rgb()/rgba(), hsl()/hsla()),
                    tuple/list of RGB values (0-1 or 0-255), or another Colorisator instance
             alpha: Opacity value between 0.0 (transparent) and 1.0 (opaque). Defaults to 1.0.
         """
         self.r, self.g, self.b, self.a = self._parse_input(value, alpha)
-        self.h, self.l, self.s = colorsys.rgb_to_hls(self.r, self.g, self.b)
+        self._h = None
+
+    def _compute_hls(self):
+        self._h, self._l, self._s = colorsys.rgb_to_hls(self.r, self.g, self.b)
+
+    @property
+    def h(self):
+        if self._h is None:
+            self._compute_hls()
+        return self._h
+
+    @h.setter
+    def h(self, value):
+        if self._h is None:
+            self._compute_hls()
+        self._h = value
+
+    @property
+    def l(self):
+        if self._h is None:
+            self._compute_hls()
+        return self._l
+
+    @l.setter
+    def l(self, value):
+        if self._h is None:
+            self._compute_hls()
+        self._l = value
+
+    @property
+    def s(self):
+        if self._h is None:
+            self._compute_hls()
+        return self._s
+
+    @s.setter
+    def s(self, value):
+        if self._h is None:
+            self._compute_hls()
+        self._s = value
 
     def __repr__(self):
         return f'Colorisator("{self.get_hex()}")'
@@ -42,37 +193,182 @@ class Colorisator:
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        # Equal colors (channels equal to 4 decimals) share the same quantized key.
+        # Like any hash of a mutable object, it changes if the color is modified.
+        return hash((_quantize(self.r), _quantize(self.g), _quantize(self.b), _quantize(self.a)))
+
+    @classmethod
+    def _from_normalized(cls, r, g, b, a=1.0, hls=None):
+        """Build a color from trusted channels already normalized between 0.0 and 1.0.
+
+        Bypasses _parse_input, so derived colors are never reinterpreted as 0-255 values.
+        """
+        obj = cls.__new__(cls)
+        obj.r, obj.g, obj.b, obj.a = r, g, b, a
+        if hls is None:
+            obj._h = None
+        else:
+            obj._h, obj._l, obj._s = hls
+        return obj
+
+    @staticmethod
+    def pipeline():
+        """Start a lazy chain of color operations.
+
+        Example:
+            .. code-block:: python
+
+                theme = Colorisator.pipeline().lighten(0.1).saturate(0.2).adjust_hue(0.05)
+                print(theme.apply("#3543CA", output=ColorisatorFormat.HEX))
+
+        Returns:
+            Empty Pipeline instance
+        """
+        from .pipeline import Pipeline
+        return Pipeline()
+
+    @classmethod
+    def from_buffer(cls, buffer, layout="rgba", index=0, alpha=1.0):
+        """Create a color from one pixel of a packed 8-bit buffer.
+
+        Args:
+            buffer: Any object supporting the buffer protocol (bytes, bytearray,
+                    memoryview, array.array...) holding packed 8-bit channels
+            layout: Channel order: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+            index: Index of the pixel to read. Defaults to 0.
+            alpha: Opacity used when the layout has no alpha channel. Defaults to 1.0.
+
+        Raises:
+            ValueError: If the layout is unknown
+            IndexError: If the pixel is outside the buffer
+
+        Returns:
+            New Colorisator instance
+        """
+        (ro, go, bo, ao), size = _buffer_layout(layout)
+        view = memoryview(buffer).cast("B")
+        start = index * size
+        if index < 0 or start + size > len(view):
+            raise IndexError("Pixel index out of range")
+        values = _BYTE_VALUES
+        a = alpha if ao is None else values[view[start + ao]]
+        return cls._from_normalized(
+            values[view[start + ro]], values[view[start + go]], values[view[start + bo]], a
+        )
+
+    def tobytes(self, layout="rgba"):
+        """Export color as packed 8-bit channels.
+
+        Args:
+            layout: Channel order: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+
+        Raises:
+            ValueError: If the layout is unknown
+
+        Returns:
+            Bytes object of 3 or 4 bytes
+        """
+        offsets, size = _buffer_layout(layout)
+        out = bytearray(size)
+        for offset, c in zip(offsets, (self.r, self.g, self.b, self.a)):
+            if offset is not None:
+                out[offset] = _to_byte(c)
+        return bytes(out)
+
     @staticmethod
     def _from_any(value):
         if isinstance(value, Colorisator):
             return value
         return Colorisator(value)
 
-    def _parse_input(self, value, alpha):
-        if isinstance(value, str):
-            v = value.strip().lstrip("#")
+    @classmethod
+    def enable_parse_cache(cls, maxsize=1024):
+        """Enable (or resize) the LRU cache used when parsing hex strings.
+
+        The cache is disabled by default. Calling this method again while the
+        cache is enabled resizes it, evicting the least recently used entries.
+
+        Args:
+            maxsize: Maximum number of parsed hex strings to keep. Defaults to 1024.
+
+        Raises:
+            ValueError: If maxsize is not a positive integer
+        """
+        global _parse_cache
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        if _parse_cache is None:
+            _parse_cache = _ParseCache(maxsize)
+        else:
+            _parse_cache.resize(maxsize)
+
+    @classmethod
+    def disable_parse_cache(cls):
+        """Disable the hex string parse cache and drop its entries."""
+        global _parse_cache
+        _parse_cache = None
+
+    @classmethod
+    def clear_parse_cache(cls):
+        """Remove every entry from the parse cache and reset its counters."""
+        if _parse_cache is not None:
+            _parse_cache.clear()
+
+    @classmethod
+    def parse_cache_info(cls):
+        """Get parse cache statistics.
+
+        Returns:
+            ParseCacheInfo named tuple (hits, misses, evictions, maxsize, currsize),
+            or None if the cache is disabled
+        """
+        if _parse_cache is None:
+            return None
+        return _parse_cache.info()
+
+    @staticmethod
+    def _parse_hex(v, alpha):
+        pairs = _HEX_PAIRS
+        try:
             if len(v) == 3:  # #RGB
-                r = int(v[0]*2, 16) / 255
-                g = int(v[1]*2, 16) / 255
-                b = int(v[2]*2, 16) / 255
-                return r, g, b, alpha
+                return pairs[v[0]*2], pairs[v[1]*2], pairs[v[2]*2], alpha
             elif len(v) == 4:  # #RGBA
-                r = int(v[0]*2, 16) / 255
-                g = int(v[1]*2, 16) / 255
-                b = int(v[2]*2, 16) / 255
-                a = int(v[3]*2, 16) / 255
-                return r, g, b, a
+                return pairs[v[0]*2], pairs[v[1]*2], pairs[v[2]*2], pairs[v[3]*2]
             elif len(v) == 6:  # #RRGGBB
-                r = int(v[0:2], 16) / 255
-                g = int(v[2:4], 16) / 255
-                b = int(v[4:6], 16) / 255
-                return r, g, b, alpha
+                return pairs[v[0:2]], pairs[v[2:4]], pairs[v[4:6]], alpha
             elif len(v) == 8:  # #RRGGBBAA
-                r = int(v[0:2], 16) / 255
-                g = int(v[2:4], 16) / 255
-                b = int(v[4:6], 16) / 255
-                a = int(v[6:8], 16) / 255
-                return r, g, b, a
+                return pairs[v[0:2]], pairs[v[2:4]], pairs[v[4:6]], pairs[v[6:8]]
+        except KeyError:
+            raise ValueError(f"Invalid hex color: {v!r}") from None
+        return None
+
+    @staticmethod
+    def _parse_string(text, alpha):
+        v = text.lstrip("#")
+        if len(v) == len(text):
+            # No "#": CSS syntax first, so names such as "red" are not read as invalid hex.
+            result = parse_css(text, alpha)
+            if result is not None:
+                return result
+        return Colorisator._parse_hex(v, alpha)
+
+    def _parse_input(self, value, alpha):
+        if isinstance(value, str):
+            text = value.strip()
+            cache = _parse_cache
+            if cache is None:
+                result = Colorisator._parse_string(text, alpha)
+            else:
+                # Keyed on the text with its "#": "#add" is hex, "add" could be a CSS name.
+                key = (text.upper(), alpha)
+                result = cache.get(key)
+                if result is None:
+                    result = Colorisator._parse_string(text, alpha)
+                    if result is not None:
+                        cache.put(key, result)
+            if result is not None:
+                return result
 
         if isinstance(value, (list, tuple)):
             if len(value) == 3:
@@ -90,53 +386,66 @@ class Colorisator:
 
     def _update_from_hls(self, h, l, s):
         r, g, b = colorsys.hls_to_rgb(h, l, s)
-        obj = Colorisator((r, g, b, self.a))
-        obj.h, obj.l, obj.s = h, l, s
-        return obj
+        return Colorisator._from_normalized(r, g, b, self.a, (h, l, s))
 
     @staticmethod
     def _format_output(colors, output: ColorisatorFormat = None):
-        single = False
+        if output is None:
+            return colors
+        formatter = get_formatter(output)
+
         if not isinstance(colors, (list, tuple)):
-            colors = [colors]
-            single = True
-
-        if isinstance(output, str):
-            output = ColorisatorFormat(output.lower())
-
-        if output == ColorisatorFormat.HEX:
-            result = [c.get_hex() for c in colors]
-        elif output == ColorisatorFormat.HEXALPHA:
-            result = [c.get_hex_alpha() for c in colors]
-        elif output == ColorisatorFormat.WEB:
-            result = [c.get_web() for c in colors]
-        elif output == ColorisatorFormat.RGB:
-            result = [c.get_rgb() for c in colors]
-        elif output == ColorisatorFormat.RGBA:
-            result = [c.get_rgba() for c in colors]
-        elif output == ColorisatorFormat.RGB255:
-            result = [c.get_rgb255() for c in colors]
-        elif output == ColorisatorFormat.HSL:
-            result = [c.get_hsl() for c in colors]
-
-        elif output == ColorisatorFormat.UNITY:
-            if single:
-                return colors[0].to_unity()
-            result = [c._unity_value() for c in colors]
-            return f"private List<Color> palette = new() {{ " + ", ".join(result) + " };"
-
-        elif output == ColorisatorFormat.PROCESSING:
-            if single:
-                return colors[0].to_processing()
-            result = [c._processing_value() for c in colors]
-            return f"color[] palette = {{ " + ", ".join(result) + " };"
+            value = formatter.encode(*_pack((colors,), formatter.needs_hls))[0]
+            return formatter.declare(value)
+        return formatter.finish(formatter.encode(*_pack(colors, formatter.needs_hls)))
 
-        else:
-            result = colors
+    @staticmethod
+    def _format_data(data, hls, output):
+        """Format a flat RGBA array (and its HLS array, if known) without building Colorisator objects."""
+        formatter = get_formatter(output)
+        if formatter.needs_hls and hls is None:
+            hls = _rgb_to_hls_array(data)
+        return formatter.finish(formatter.encode(data, hls))
+
+    @staticmethod
+    def _byte_path(colors, output):
+        """Return (formatter, 8-bit channels of colors) when the output format only needs
+        8-bit channels and every color is exactly 8-bit, else None."""
+        if output is None:
+            return None
+        formatter = get_formatter(output)
+        if formatter.encode_bytes is None:
+            return None
+        channels = [byte_kernels.exact_bytes(c.r, c.g, c.b, c.a) for c in colors]
+        if None in channels:
+            return None
+        return formatter, channels
+
+    def _hls_palette(self, hls_values, output):
+        """Build colors from (h, l, s) tuples, keeping this color's alpha.
+
+        With an output format, channels are encoded directly from a flat array.
+        """
+        if output is None:
+            return [self._update_from_hls(h, l, s) for h, l, s in hls_values]
+        hls_to_rgb = colorsys.hls_to_rgb
+        a = self.a
+        data = array("d")
+        hls = array("d")
+        for h, l, s in hls_values:
+            data.extend(hls_to_rgb(h, l, s))
+            data.append(a)
+            hls.extend((h, l, s))
+        return Colorisator._format_data(data, hls, output)
 
-        if single:
-            return result[0]
-        return result
+    @staticmethod
+    def _iter_format_output(colors, output: ColorisatorFormat = None):
+        """Lazily format an iterable of colors.
+
+        List formats yield one value per color. UNITY and PROCESSING yield string
+        chunks whose concatenation is the palette declaration returned by _format_output.
+        """
+        return iter_encode(colors, output)
 
     def _lerp(self_or_start, other, t, output=None):
         if isinstance(self_or_start, Colorisator):
@@ -149,7 +458,7 @@ class Colorisator:
         g = start.g + (end.g - start.g) * t
         b = start.b + (end.b - start.b) * t
         a = start.a + (end.a - start.a) * t
-        new_color = Colorisator((r, g, b, a))
+        new_color = Colorisator._from_normalized(r, g, b, a)
         return Colorisator._format_output(new_color, output)
 
     def _unity_value(self):
@@ -239,6 +548,82 @@ class Colorisator:
         """
         return (self.h, self.s, self.l)
 
+    def get_oklab(self):
+        """Get color as OKLab values (perceptually uniform).
+
+        Returns:
+            Tuple of (L, a, b), L between 0.0 and 1.0, a and b roughly between -0.4 and 0.4
+        """
+        return spaces.rgb_to_oklab(self.r, self.g, self.b)
+
+    def get_oklch(self):
+        """Get color as OKLCH values (cylindrical OKLab).
+
+        Returns:
+            Tuple of (L, C, h), L between 0.0 and 1.0, hue in degrees between 0 and 360
+        """
+        return spaces.rgb_to_oklch(self.r, self.g, self.b)
+
+    def get_lab(self):
+        """Get color as CIELAB values (D65 white point).
+
+        Returns:
+            Tuple of (L, a, b), L between 0 and 100
+        """
+        return spaces.rgb_to_lab(self.r, self.g, self.b)
+
+    @classmethod
+    def _from_space(cls, convert, x, y, z, alpha):
+        r, g, b = convert(x, y, z)
+        return cls._from_normalized(spaces._clip(r), spaces._clip(g), spaces._clip(b), alpha)
+
+    @classmethod
+    def from_oklab(cls, L, a, b, alpha=1.0):
+        """Create a color from OKLab values.
+
+        Colors outside of the sRGB gamut are clipped channel by channel.
+
+        Args:
+            L: Lightness between 0.0 and 1.0
+            a: Green-red axis
+            b: Blue-yellow axis
+            alpha: Alpha between 0.0 and 1.0. Defaults to 1.0.
+
+        Returns:
+            New Colorisator instance
+        """
+        return cls._from_space(spaces.oklab_to_rgb, L, a, b, alpha)
+
+    @classmethod
+    def from_oklch(cls, L, C, h, alpha=1.0):
+        """Create a color from OKLCH values (see from_oklab).
+
+        Args:
+            L: Lightness between 0.0 and 1.0
+            C: Chroma
+            h: Hue in degrees
+            alpha: Alpha between 0.0 and 1.0. Defaults to 1.0.
+
+        Returns:
+            New Colorisator instance
+        """
+        return cls._from_space(spaces.oklch_to_rgb, L, C, h, alpha)
+
+    @classmethod
+    def from_lab(cls, L, a, b, alpha=1.0):
+        """Create a color from CIELAB values, D65 white point (see from_oklab).
+
+        Args:
+            L: Lightness between 0 and 100
+            a: Green-red axis
+            b: Blue-yellow axis
+            alpha: Alpha between 0.0 and 1.0. Defaults to 1.0.
+
+        Returns:
+            New Colorisator instance
+        """
+        return cls._from_space(spaces.lab_to_rgb, L, a, b, alpha)
+
     """ 
     
     """
@@ -311,10 +696,15 @@ class Colorisator:
         else:
             color = Colorisator(self_or_color)
 
+        fast = Colorisator._byte_path((color,), output)
+        if fast is not None:
+            formatter, (channels,) = fast
+            return formatter.declare(formatter.encode_bytes([byte_kernels.tint_bytes(channels, amount)])[0])
+
         r = color.r + (1 - color.r) * amount
         g = color.g + (1 - color.g) * amount
         b = color.b + (1 - color.b) * amount
-        new_color = Colorisator((r, g, b))
+        new_color = Colorisator._from_normalized(r, g, b)
         return Colorisator._format_output(new_color, output)
 
 
@@ -336,12 +726,37 @@ class Colorisator:
         else:
             color = Colorisator(self_or_color)
 
+        fast = Colorisator._byte_path((color,), output)
+        if fast is not None:
+            formatter, (channels,) = fast
+            return formatter.declare(formatter.encode_bytes([byte_kernels.shade_bytes(channels, amount)])[0])
+
         r = color.r * (1 - amount)
         g = color.g * (1 - amount)
         b = color.b * (1 - amount)
-        new_color = Colorisator((r, g, b))
+        new_color = Colorisator._from_normalized(r, g, b)
         return Colorisator._format_output(new_color, output)
 
+    def mix(self_or_color, other, weight=0.5, output=None):
+        """Mix two colors, alpha included.
+
+        Args:
+            self_or_color: First color (Colorisator instance or any valid color format)
+            other: Second color (Colorisator instance or any valid color format)
+            weight: Proportion of the second color (0.0 keeps the first one, 1.0 gives
+                    the second one). Defaults to 0.5.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns Colorisator).
+
+        Returns:
+            Mixed color in the specified output format
+        """
+        start, end = Colorisator._from_any(self_or_color), Colorisator._from_any(other)
+        fast = Colorisator._byte_path((start, end), output)
+        if fast is not None:
+            formatter, (a, b) = fast
+            return formatter.declare(formatter.encode_bytes([byte_kernels.mix_bytes(a, b, weight)])[0])
+        return start._lerp(end, weight, output)
+
     def saturate(self_or_color, amount=0.1, output=None):
         """Increase the saturation of a color.
 
@@ -492,7 +907,7 @@ class Colorisator:
             color = self_or_color
         else:
             color = Colorisator(self_or_color)
-        new_color = Colorisator((1 - color.r, 1 - color.g, 1 - color.b, color.a))
+        new_color = Colorisator._from_normalized(1 - color.r, 1 - color.g, 1 - color.b, color.a)
         return Colorisator._format_output(new_color, output)
 
     def palette_hue_shifts(self_or_color, shifts, output=None):
@@ -524,8 +939,7 @@ class Colorisator:
             n = shifts
             shifts = [(i / n) for i in range(n)]
 
-        colors = [color._update_from_hls((h + shift) % 1.0, l, s) for shift in shifts]
-        return Colorisator._format_output(colors, output)
+        return color._hls_palette([((h + shift) % 1.0, l, s) for shift in shifts], output)
 
     def palette_triadic(self_or_color, output=None):
         """Generate a triadic color scheme (3 colors evenly spaced on the color wheel).
@@ -617,8 +1031,7 @@ class Colorisator:
         else:
             step = 2 * max_delta / (n - 1)
             shades = [min(1, max(0, l - max_delta + i * step)) for i in range(n)]
-        colors = [color._update_from_hls(h, new_l, s) for new_l in shades]
-        return Colorisator._format_output(colors, output)
+        return color._hls_palette([(h, new_l, s) for new_l in shades], output)
 
     def palette_material(self_or_color, n=5, max_delta=0.2, output=None):
         """Generate a Material Design-style color palette with varying lightness.
@@ -642,13 +1055,10 @@ class Colorisator:
             color = Colorisator(self_or_color)
         h, l, s = color.h, color.l, color.s
         step_size = (2 * max_delta) / (n - 1) if n > 1 else 0
-        colors = []
-        for i in range(n):
-            new_l = min(1, max(0, l - max_delta + i * step_size))
-            colors.append(color._update_from_hls(h, new_l, s))
-        return Colorisator._format_output(colors, output)
+        shades = [min(1, max(0, l - max_delta + i * step_size)) for i in range(n)]
+        return color._hls_palette([(h, new_l, s) for new_l in shades], output)
 
-    def gradient(self_or_start, end=None, steps=10, output=None):
+    def gradient(self_or_start, end=None, steps=10, output=None, space="rgb"):
         """Generate a smooth color gradient between two colors.
 
         .. image:: _static/gradient.png
@@ -660,26 +1070,58 @@ class Colorisator:
             end: Ending color (Colorisator instance or any valid color format). Defaults to None.
             steps: Number of color steps in the gradient. Defaults to 5.
             output: Output format (ColorisatorFormat or string). Defaults to None (returns list of Colorisator).
+            space: Interpolation space: "rgb", "hls", "oklab", "oklch" or "lab". Perceptual
+                   spaces give evenly spaced steps. Defaults to "rgb".
 
         Raises:
-            ValueError: If end color is not provided
+            ValueError: If end color is not provided, or the space is unknown
 
         Returns:
             List of colors forming a smooth gradient from start to end
         """
-        if isinstance(self_or_start, Colorisator) and end is not None:
-            start = self_or_start
-            end = Colorisator._from_any(end)
-        elif not isinstance(self_or_start, Colorisator) and end is not None:
-            start = Colorisator._from_any(self_or_start)
-            end = Colorisator._from_any(end)
+        start, end = Colorisator._gradient_ends(self_or_start, end)
+        spaces.get_space(space)
+        if output is not None:
+            return Colorisator._format_segments([start, end], [steps - 1], space, output)
+        if space != "rgb":
+            return list(Colorisator._iter_segments([start, end], [steps - 1], space))
+        return [start._lerp(end, i/(steps-1)) for i in range(steps)]
+
+    def iter_gradient(self_or_start, end=None, steps=10, output=None, space="rgb"):
+        """Lazily generate a smooth color gradient between two colors.
+
+        Same as gradient, but yields one value at a time so memory use does not
+        depend on steps. With UNITY or PROCESSING output, yields string chunks
+        that join into the declaration returned by gradient.
+
+        Args:
+            self_or_start: Starting color (Colorisator instance or any valid color format)
+            end: Ending color (Colorisator instance or any valid color format). Defaults to None.
+            steps: Number of color steps in the gradient. Defaults to 10.
+            output: Output format (ColorisatorFormat or string). Defaults to None (yields Colorisator).
+            space: Interpolation space (see gradient). Defaults to "rgb".
+
+        Raises:
+            ValueError: If end color is not provided, or the space is unknown
+
+        Returns:
+            Generator of colors forming a smooth gradient from start to end
+        """
+        start, end = Colorisator._gradient_ends(self_or_start, end)
+        spaces.get_space(space)
+        if space != "rgb":
+            colors = Colorisator._iter_segments([start, end], [steps - 1], space)
         else:
-            raise ValueError("End must be provided for the static call or instance")
+            colors = (start._lerp(end, i/(steps-1)) for i in range(steps))
+        return Colorisator._iter_format_output(colors, output)
 
-        grad = [start._lerp(end, i/(steps-1)) for i in range(steps)]
-        return Colorisator._format_output(grad, output)
+    @staticmethod
+    def _gradient_ends(self_or_start, end):
+        if end is None:
+            raise ValueError("End must be provided for the static call or instance")
+        return Colorisator._from_any(self_or_start), Colorisator._from_any(end)
 
-    def gradient_stops(self_or_start, stops=None, steps=10, output=None):
+    def gradient_stops(self_or_start, stops=None, steps=10, output=None, space="rgb"):
         """Generate a multi-stop gradient passing through multiple colors.
 
         .. image:: _static/gradient_stops.png
@@ -691,13 +1133,99 @@ class Colorisator:
             stops: List of intermediate/ending colors. Defaults to None.
             steps: Total number of color steps in the gradient. Defaults to 5.
             output: Output format (ColorisatorFormat or string). Defaults to None (returns list of Colorisator).
+            space: Interpolation space (see gradient). Hues in "hls" and "oklch" take the
+                   shortest way around the color wheel. Defaults to "rgb".
 
         Raises:
-            ValueError: If stops is None when calling on an instance, or if less than 2 colors provided
+            ValueError: If stops is None when calling on an instance, if less than 2 colors provided,
+                        or if the space is unknown
 
         Returns:
             List of colors forming a smooth gradient through all color stops
         """
+        colors, segment_steps = Colorisator._gradient_segments(self_or_start, stops, steps)
+        spaces.get_space(space)
+        if output is not None:
+            return Colorisator._format_segments(colors, segment_steps, space, output)
+        return list(Colorisator._iter_segments(colors, segment_steps, space))
+
+    def iter_gradient_stops(self_or_start, stops=None, steps=10, output=None, space="rgb"):
+        """Lazily generate a multi-stop gradient passing through multiple colors.
+
+        Same as gradient_stops, but yields one value at a time so memory use does
+        not depend on steps. With UNITY or PROCESSING output, yields string chunks
+        that join into the declaration returned by gradient_stops.
+
+        Args:
+            self_or_start: Starting color or list of all colors (Colorisator instances or any valid color formats)
+            stops: List of intermediate/ending colors. Defaults to None.
+            steps: Total number of color steps in the gradient. Defaults to 10.
+            output: Output format (ColorisatorFormat or string). Defaults to None (yields Colorisator).
+            space: Interpolation space (see gradient_stops). Defaults to "rgb".
+
+        Raises:
+            ValueError: If stops is None when calling on an instance, if less than 2 colors provided,
+                        or if the space is unknown
+
+        Returns:
+            Generator of colors forming a smooth gradient through all color stops
+        """
+        colors, segment_steps = Colorisator._gradient_segments(self_or_start, stops, steps)
+        spaces.get_space(space)
+        return Colorisator._iter_format_output(Colorisator._iter_segments(colors, segment_steps, space), output)
+
+    @staticmethod
+    def _segment_positions(colors, segment_steps):
+        """Yield the (segment index, t) pair of every gradient step."""
+        last = len(colors) - 2
+        for i, count in enumerate(segment_steps):
+            # Each segment but the last drops its end color, which starts the next one.
+            for j in range(count if i < last else count + 1):
+                yield i, j/count
+
+    @staticmethod
+    def _iter_segments(colors, segment_steps, space="rgb"):
+        if space != "rgb":
+            positions = Colorisator._segment_positions(colors, segment_steps)
+            for r, g, b, a in spaces.interpolate(colors, positions, space):
+                yield Colorisator._from_normalized(r, g, b, a)
+            return
+        last = len(colors) - 2
+        for i, count in enumerate(segment_steps):
+            start, end = colors[i], colors[i + 1]
+            # Each segment but the last drops its end color, which starts the next one.
+            for j in range(count if i < last else count + 1):
+                yield start._lerp(end, j/count)
+
+    @staticmethod
+    def _format_segments(colors, segment_steps, space, output):
+        """Format gradient segments, in integers when both stops and output are 8-bit."""
+        if space == "rgb":
+            fast = Colorisator._byte_path(colors, output)
+            if fast is not None:
+                formatter, stops = fast
+                return formatter.finish(formatter.encode_bytes(byte_kernels.gradient_bytes(stops, segment_steps)))
+        return Colorisator._format_data(Colorisator._segments_data(colors, segment_steps, space), None, output)
+
+    @staticmethod
+    def _segments_data(colors, segment_steps, space="rgb"):
+        """Interpolate gradient segments straight into a flat RGBA array, like _iter_segments."""
+        if space != "rgb":
+            positions = Colorisator._segment_positions(colors, segment_steps)
+            return array("d", chain.from_iterable(spaces.interpolate(colors, positions, space)))
+        data = array("d")
+        last = len(colors) - 2
+        for i, count in enumerate(segment_steps):
+            start, end = colors[i], colors[i + 1]
+            r, g, b, a = start.r, start.g, start.b, start.a
+            dr, dg, db, da = end.r - r, end.g - g, end.b - b, end.a - a
+            for j in range(count if i < last else count + 1):
+                t = j/count
+                data.extend((r + dr * t, g + dg * t, b + db * t, a + da * t))
+        return data
+
+    @staticmethod
+    def _gradient_segments(self_or_start, stops, steps):
         if isinstance(self_or_start, Colorisator):
             if stops is None:
                 raise ValueError("You must provide a list of stops when calling on an instance")
@@ -710,14 +1238,4 @@ class Colorisator:
             raise ValueError("At least two colors are needed for gradient_stops")
 
         segment_steps = [int(round((steps - 1) * (i + 1) / (n - 1))) - int(round((steps - 1) * i / (n - 1))) for i in range(n - 1)]
-
-        grad = []
-        for i in range(n - 1):
-            start = colors[i]
-            end = colors[i + 1]
-            segment = Colorisator.gradient(start, end, segment_steps[i] + 1, output=None)
-            if i < n - 2:
-                segment = segment[:-1]
-            grad.extend(segment)
-
-        return Colorisator._format_output(grad, output)
+        return colors, segment_steps
@@ -0,0 +1,185 @@
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .colorisator import Colorisator
+from .lut import GradientLUT
+
+
+def _as_flat(values):
+    """Return a flat, indexable view of values (buffer-protocol objects are not copied)."""
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return values
+    if view.ndim != 1:
+        view = view.cast("B").cast(view.format)
+    return view
+
+
+def _chunk(values, start, end):
+    """Copy values[start:end] into a picklable sequence."""
+    chunk = values[start:end]
+    return chunk.tolist() if isinstance(chunk, memoryview) else chunk
+
+
+def _encode_chunk(cmap, chunk, vmin, vmax):
+    return cmap._encode(chunk, 0, len(chunk), vmin, vmax)
+
+
+def _map_chunks(cmap, chunks, vmin, vmax, workers):
+    """Yield encoded chunks in order, keeping at most 2 chunks per worker in flight."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_encode_chunk, cmap, chunk, vmin, vmax))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class Colormap:
+    def __init__(self, stops, positions=None, size=256, space="rgb", norm="linear",
+                 vmin=None, vmax=None, clip=True, under=None, over=None, bad="#00000000"):
+        """Initialize a colormap that turns numeric data into RGBA pixels.
+
+        The gradient is baked once into a GradientLUT; each value is then
+        normalized and mapped to its nearest table entry.
+
+        Args:
+            stops: List of colors (Colorisator instances or any valid color formats)
+            positions: Optional list of stop positions between 0.0 and 1.0. Defaults to None (evenly spaced).
+            size: Number of entries in the lookup table. Defaults to 256.
+            space: Interpolation space of the gradient (see GradientLUT). Defaults to "rgb".
+            norm: Normalization: "linear" or "log" (values <= 0 are bad). Defaults to "linear".
+            vmin: Value mapped to the first stop. Defaults to None (minimum of the data).
+            vmax: Value mapped to the last stop. Defaults to None (maximum of the data).
+            clip: If True, values outside [vmin, vmax] use the end colors, else the
+                  under/over colors. Defaults to True.
+            under: Color for values below vmin when clip is False. Defaults to None (first stop).
+            over: Color for values above vmax when clip is False. Defaults to None (last stop).
+            bad: Color for NaN (and non-positive values with log norm). Defaults to transparent black.
+
+        Infinite values are below or above any limit: -inf uses the under color
+        and inf the over color, and neither is used to compute missing limits.
+
+        Raises:
+            ValueError: If norm is unknown, or vmin/vmax are not finite or are invalid for the norm
+        """
+        if norm not in ("linear", "log"):
+            raise ValueError(f"Unsupported norm: {norm!r}")
+        if any(v is not None and not math.isfinite(v) for v in (vmin, vmax)):
+            raise ValueError("vmin and vmax must be finite")
+        if norm == "log" and ((vmin is not None and vmin <= 0) or (vmax is not None and vmax <= 0)):
+            raise ValueError("vmin and vmax must be positive with log norm")
+
+        self.lut = GradientLUT(stops, size, positions, space)
+        table = self.lut.tobytes()
+        self._entries = [table[i:i + 4] for i in range(0, len(table), 4)]
+        self.norm = norm
+        self.vmin = vmin
+        self.vmax = vmax
+        self.clip = clip
+        self._under = self._entries[0] if clip or under is None else Colorisator._from_any(under).tobytes()
+        self._over = self._entries[-1] if clip or over is None else Colorisator._from_any(over).tobytes()
+        self._bad = Colorisator._from_any(bad).tobytes()
+
+    def __repr__(self):
+        return f"Colormap(size={len(self._entries)}, norm={self.norm!r}, vmin={self.vmin!r}, vmax={self.vmax!r})"
+
+    def _limits(self, values):
+        """Return (vmin, vmax), computing missing ones from the valid, finite data values."""
+        vmin, vmax = self.vmin, self.vmax
+        if vmin is not None and vmax is not None:
+            return vmin, vmax
+        log = self.norm == "log"
+        isfinite = math.isfinite
+        lo, hi = math.inf, -math.inf
+        for v in values:
+            if isfinite(v) and not (log and v <= 0):
+                if v < lo:
+                    lo = v
+                if v > hi:
+                    hi = v
+        if lo > hi:
+            lo = hi = 1.0
+        return (lo if vmin is None else vmin), (hi if vmax is None else vmax)
+
+    def _encode(self, values, start, end, vmin, vmax):
+        """Encode values[start:end] as packed RGBA bytes."""
+        entries, bad, under, over = self._entries, self._bad, self._under, self._over
+        last = len(entries) - 1
+        log = math.log if self.norm == "log" else None
+        if log is not None:
+            vmin, vmax = log(vmin), log(vmax)
+        scale = last / (vmax - vmin) if vmax > vmin else 0.0
+        inf = math.inf
+
+        out = []
+        append = out.append
+        for i in range(start, end):
+            v = values[i]
+            if log is not None:
+                v = log(v) if v > 0 else math.nan
+            if v != v:
+                append(bad)
+            elif v < vmin or v == -inf:
+                append(under)
+            elif v > vmax or v == inf:
+                append(over)
+            else:
+                append(entries[int((v - vmin) * scale + 0.5)])
+        return b"".join(out)
+
+    def apply(self, values, out=None, workers=None, chunk_size=65536):
+        """Colorize numeric data.
+
+        Args:
+            values: Flat sequence of numbers: array.array, NumPy array (any shape,
+                    read through the buffer protocol without a copy), list...
+            out: Optional writable buffer of at least 4 bytes per value to fill
+                 with RGBA pixels. Defaults to None (a new bytearray).
+            workers: Number of worker processes encoding chunks. Defaults to None (current process only).
+                     Chunks are copied to the workers, so this only pays off on multi-core
+                     machines with large inputs.
+            chunk_size: Number of values encoded at once, which bounds the extra memory. Defaults to 65536.
+
+        Raises:
+            ValueError: If out is too small
+
+        Returns:
+            The RGBA buffer (out, or a new bytearray)
+        """
+        values = _as_flat(values)
+        n = len(values)
+        if out is None:
+            out = bytearray(4 * n)
+        view = memoryview(out).cast("B")
+        if len(view) < 4 * n:
+            raise ValueError("Output buffer too small: 4 bytes per value are needed")
+        vmin, vmax = self._limits(values)
+
+        starts = range(0, n, chunk_size)
+        if workers and workers > 1:
+            chunks = (_chunk(values, start, start + chunk_size) for start in starts)
+            encoded = _map_chunks(self, chunks, vmin, vmax, workers)
+        else:
+            encoded = (self._encode(values, start, min(n, start + chunk_size), vmin, vmax) for start in starts)
+        for start, pixels in zip(starts, encoded):
+            view[4 * start:4 * start + len(pixels)] = pixels
+        return out
+
+    def __call__(self, value, output=None):
+        """Colorize a single value.
+
+        Args:
+            value: Number to map
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns Colorisator).
+
+        Returns:
+            Color in the specified output format
+        """
+        vmin, vmax = self._limits([value])
+        color = Colorisator.from_buffer(self._encode([value], 0, 1, vmin, vmax))
+        return Colorisator._format_output(color, output)
@@ -0,0 +1,224 @@
+import colorsys
+from types import MappingProxyType
+
+from .byte_kernels import _BYTE_VALUES
+
+
+# The 148 CSS Color Level 4 named colors, as "name rrggbb" pairs.
+_NAMES = """
+aliceblue f0f8ff antiquewhite faebd7 aqua 00ffff aquamarine 7fffd4 azure f0ffff beige f5f5dc
+bisque ffe4c4 black 000000 blanchedalmond ffebcd blue 0000ff blueviolet 8a2be2 brown a52a2a
+burlywood deb887 cadetblue 5f9ea0 chartreuse 7fff00 chocolate d2691e coral ff7f50
+cornflowerblue 6495ed cornsilk fff8dc crimson dc143c cyan 00ffff darkblue 00008b darkcyan 008b8b
+darkgoldenrod b8860b darkgray a9a9a9 darkgreen 006400 darkgrey a9a9a9 darkkhaki bdb76b
+darkmagenta 8b008b darkolivegreen 556b2f darkorange ff8c00 darkorchid 9932cc darkred 8b0000
+darksalmon e9967a darkseagreen 8fbc8f darkslateblue 483d8b darkslategray 2f4f4f
+darkslategrey 2f4f4f darkturquoise 00ced1 darkviolet 9400d3 deeppink ff1493 deepskyblue 00bfff
+dimgray 696969 dimgrey 696969 dodgerblue 1e90ff firebrick b22222 floralwhite fffaf0
+forestgreen 228b22 fuchsia ff00ff gainsboro dcdcdc ghostwhite f8f8ff gold ffd700
+goldenrod daa520 gray 808080 green 008000 greenyellow adff2f grey 808080 honeydew f0fff0
+hotpink ff69b4 indianred cd5c5c indigo 4b0082 ivory fffff0 khaki f0e68c lavender e6e6fa
+lavenderblush fff0f5 lawngreen 7cfc00 lemonchiffon fffacd lightblue add8e6 lightcoral f08080
+lightcyan e0ffff lightgoldenrodyellow fafad2 lightgray d3d3d3 lightgreen 90ee90
+lightgrey d3d3d3 lightpink ffb6c1 lightsalmon ffa07a lightseagreen 20b2aa lightskyblue 87cefa
+lightslategray 778899 lightslategrey 778899 lightsteelblue b0c4de lightyellow ffffe0
+lime 00ff00 limegreen 32cd32 linen faf0e6 magenta ff00ff maroon 800000
+mediumaquamarine 66cdaa mediumblue 0000cd mediumorchid ba55d3 mediumpurple 9370db
+mediumseagreen 3cb371 mediumslateblue 7b68ee mediumspringgreen 00fa9a mediumturquoise 48d1cc
+mediumvioletred c71585 midnightblue 191970 mintcream f5fffa mistyrose ffe4e1 moccasin ffe4b5
+navajowhite ffdead navy 000080 oldlace fdf5e6 olive 808000 olivedrab 6b8e23 orange ffa500
+orangered ff4500 orchid da70d6 palegoldenrod eee8aa palegreen 98fb98 paleturquoise afeeee
+palevioletred db7093 papayawhip ffefd5 peachpuff ffdab9 peru cd853f pink ffc0cb plum dda0dd
+powderblue b0e0e6 purple 800080 rebeccapurple 663399 red ff0000 rosybrown bc8f8f
+royalblue 4169e1 saddlebrown 8b4513 salmon fa8072 sandybrown f4a460 seagreen 2e8b57
+seashell fff5ee sienna a0522d silver c0c0c0 skyblue 87ceeb slateblue 6a5acd slategray 708090
+slategrey 708090 snow fffafa springgreen 00ff7f steelblue 4682b4 tan d2b48c teal 008080
+thistle d8bfd8 tomato ff6347 turquoise 40e0d0 violet ee82ee wheat f5deb3 white ffffff
+whitesmoke f5f5f5 yellow ffff00 yellowgreen 9acd32
+""".split()
+
+# Lowercase color name -> normalized (r, g, b), built once at import time and read-only.
+NAMED_COLORS = MappingProxyType({
+    name: tuple(_BYTE_VALUES[int(value[i:i + 2], 16)] for i in (0, 2, 4))
+    for name, value in zip(_NAMES[::2], _NAMES[1::2])
+})
+
+# Turns per unit of the CSS <angle> type (a bare number is in degrees).
+_ANGLE_UNITS = {"deg": 1 / 360, "grad": 1 / 400, "rad": 1 / 6.283185307179586, "turn": 1.0}
+
+# Characters of a CSS <number> ("1", "-0.5", "+.25", "1e3"); float() validates the rest.
+_NUMBER_CHARS = frozenset("0123456789.+-e")
+
+
+def _tokenize(body):
+    """Split the lowercase arguments of a color function into tokens.
+
+    Returns:
+        List of tokens: "," and "/" separators, and every other whitespace-delimited value
+    """
+    if "," in body or "/" in body:
+        body = body.replace(",", " , ").replace("/", " / ")
+    return body.split()
+
+
+def _number(token):
+    """Parse a CSS <number> token; None if invalid."""
+    if _NUMBER_CHARS.issuperset(token):
+        try:
+            return float(token)
+        except ValueError:
+            pass
+    return None
+
+
+def _fraction(token, scale):
+    """Parse a number (divided by scale) or a percentage, clamped between 0.0 and 1.0.
+
+    Returns:
+        Tuple (value, is_percentage), or None if the token is invalid
+    """
+    if token[-1:] == "%":
+        n, scale, percent = _number(token[:-1]), 100, True
+    elif token == "none":
+        return 0.0, False
+    else:
+        n, percent = _number(token), False
+    if n is None:
+        return None
+    n /= scale
+    return (0.0 if n < 0.0 else 1.0 if n > 1.0 else n), percent
+
+
+def _hue(token):
+    """Parse a CSS <hue> (degrees or <angle>) into turns between 0.0 and 1.0; None if invalid."""
+    if token == "none":
+        return 0.0
+    scale = 1 / 360
+    if token[-1:] > "9":
+        for suffix, scale in _ANGLE_UNITS.items():
+            if token.endswith(suffix):
+                token = token[:-len(suffix)]
+                break
+        else:
+            return None
+    n = _number(token)
+    return None if n is None else n * scale % 1.0
+
+
+def _split_arguments(body):
+    """Split function arguments into 3 components and an optional alpha token.
+
+    Accepts the modern syntax "a b c [/ alpha]" and the legacy comma syntax
+    "a, b, c[, alpha]".
+
+    Returns:
+        Tuple (components, alpha, legacy), or None if the syntax is invalid
+    """
+    tokens = _tokenize(body)
+    count = len(tokens)
+    if count == 3:
+        values, alpha, legacy = tokens, None, False
+    elif count == 5 and tokens[1] == "," and tokens[3] == ",":
+        values, alpha, legacy = tokens[::2], None, True
+    elif count == 5 and tokens[3] == "/":
+        values, alpha, legacy = tokens[:3], tokens[4], False
+    elif count == 7 and tokens[1] == "," and tokens[3] == "," and tokens[5] == ",":
+        values, alpha, legacy = tokens[:5:2], tokens[6], True
+    else:
+        return None
+    if "," in values or "/" in values or alpha in (",", "/"):
+        return None
+    return values, alpha, legacy
+
+
+def _alpha(token, default):
+    if token is None:
+        return default
+    value = _fraction(token, 1)
+    return None if value is None else value[0]
+
+
+def _rgb(body, alpha):
+    parsed = _split_arguments(body)
+    if parsed is None:
+        return None
+    tokens, alpha_token, legacy = parsed
+    channels = []
+    percents = 0
+    for token in tokens:
+        if token.isdigit() and token.isascii():
+            # Fast path for the common 0-255 integers, exact like the hex path.
+            n = int(token)
+            channels.append(_BYTE_VALUES[n] if n < 256 else 1.0)
+            continue
+        value = _fraction(token, 255)
+        if value is None:
+            return None
+        channels.append(value[0])
+        percents += value[1]
+    if legacy and percents % 3:
+        # Legacy rgb() does not mix numbers and percentages.
+        return None
+    a = _alpha(alpha_token, alpha)
+    if a is None:
+        return None
+    return channels[0], channels[1], channels[2], a
+
+
+def _hsl(body, alpha):
+    parsed = _split_arguments(body)
+    if parsed is None:
+        return None
+    tokens, alpha_token, legacy = parsed
+    h = _hue(tokens[0])
+    s = _fraction(tokens[1], 100)
+    l = _fraction(tokens[2], 100)
+    if h is None or s is None or l is None:
+        return None
+    if legacy and not (s[1] and l[1]):
+        # Legacy hsl() requires percentages for saturation and lightness.
+        return None
+    a = _alpha(alpha_token, alpha)
+    if a is None:
+        return None
+    r, g, b = colorsys.hls_to_rgb(h, l[0], s[0])
+    return r, g, b, a
+
+
+_FUNCTIONS = {"rgb": _rgb, "rgba": _rgb, "hsl": _hsl, "hsla": _hsl}
+
+
+def parse_css(text, alpha=1.0):
+    """Parse a CSS Color Level 4 string: named color, transparent, rgb()/rgba() or hsl()/hsla().
+
+    Both the modern syntax ("rgb(255 0 0 / 50%)") and the legacy comma syntax
+    ("rgba(255, 0, 0, 0.5)") are accepted. Names, functions and units are
+    case-insensitive. Out-of-range values are clamped, as CSS does.
+    Hex colors are parsed by Colorisator itself.
+
+    Args:
+        text: Color string (leading and trailing whitespace ignored)
+        alpha: Opacity of named colors and of functions without alpha. Defaults to 1.0.
+
+    Raises:
+        ValueError: If text is an rgb(), rgba(), hsl() or hsla() call with invalid arguments
+
+    Returns:
+        Tuple (r, g, b, a) of floats between 0.0 and 1.0, or None if text is not a
+        named color or supported color function
+    """
+    text = text.strip()
+    lower = text.lower()
+    rgb = NAMED_COLORS.get(lower)
+    if rgb is not None:
+        return rgb[0], rgb[1], rgb[2], alpha
+    if lower == "transparent":
+        return 0.0, 0.0, 0.0, 0.0
+    name, paren, body = lower.partition("(")
+    parse = _FUNCTIONS.get(name)
+    if parse is None or not paren:
+        return None
+    result = parse(body[:-1], alpha) if body[-1:] == ")" else None
+    if result is None:
+        raise ValueError(f"Invalid CSS color: {text!r}")
+    return result
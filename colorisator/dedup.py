@@ -0,0 +1,71 @@
+from operator import add
+
+from .colorisator import _quantize
+from .color_array import ColorArray
+
+
+def _keys(colors):
+    """Return the ColorArray of colors and the list of integer equality keys of its colors.
+
+    Each channel is quantized once per distinct value (few with 8-bit sources),
+    then the four integers are packed into one, so hashing stays cheap.
+    """
+    colors = ColorArray._from_any(colors)
+    channels = [colors._data[c::4] for c in range(4)]
+    tables = [{v: _quantize(v) for v in set(channel)} for channel in channels]
+    if not channels[0]:
+        return colors, []
+    low = min(min(t.values()) for t in tables)
+    base = max(max(t.values()) for t in tables) - low + 1
+    tables = [{v: (q - low) * base ** (3 - c) for v, q in t.items()} for c, t in enumerate(tables)]
+    r, g, b, a = (map(t.__getitem__, channel) for t, channel in zip(tables, channels))
+    return colors, list(map(add, map(add, r, g), map(add, b, a)))
+
+
+def group_by_equal(colors):
+    """Group the positions of equal colors (same equality as Colorisator.__eq__).
+
+    Colors are bucketed by a quantized integer key in a dict, so the cost is
+    linear in the number of colors.
+
+    Args:
+        colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+
+    Returns:
+        List of index lists, one per distinct color, in order of first occurrence
+    """
+    groups = {}
+    for i, key in enumerate(_keys(colors)[1]):
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [i]
+        else:
+            group.append(i)
+    return list(groups.values())
+
+
+def unique(colors, output=None):
+    """Remove duplicated colors (same equality as Colorisator.__eq__), in linear time.
+
+    Args:
+        colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+        output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+    Returns:
+        First occurrence of each distinct color, in order, in the specified output format
+    """
+    colors, keys = _keys(colors)
+    data = colors._data
+    seen = set()
+    mark = seen.add
+    kept = [i for i, key in enumerate(keys) if not (key in seen or mark(key))]
+    result = data[:0]
+    for i in kept:
+        result.extend(data[4 * i:4 * i + 4])
+    hls = colors._hls
+    if hls is not None:
+        kept_hls = hls[:0]
+        for i in kept:
+            kept_hls.extend(hls[3 * i:3 * i + 3])
+        hls = kept_hls
+    return ColorArray._from_data(result, hls)._format_output(output)
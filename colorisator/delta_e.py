@@ -0,0 +1,254 @@
+import math
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .colorisator import Colorisator
+from .color_array import ColorArray
+from .spaces import rgb_to_lab, to_space_array
+
+
+# Kernels take two CIELAB colors as (L1, a1, b1, L2, a2, b2).
+def _cie76(l1, a1, b1, l2, a2, b2):
+    return math.sqrt((l1 - l2) ** 2 + (a1 - a2) ** 2 + (b1 - b2) ** 2)
+
+
+def _cie94(l1, a1, b1, l2, a2, b2):
+    # Graphic arts weights; the first color is the reference.
+    c1 = math.sqrt(a1 * a1 + b1 * b1)
+    dc = c1 - math.sqrt(a2 * a2 + b2 * b2)
+    dh2 = max(0.0, (a1 - a2) ** 2 + (b1 - b2) ** 2 - dc * dc)
+    sc = 1 + 0.045 * c1
+    sh = 1 + 0.015 * c1
+    return math.sqrt((l1 - l2) ** 2 + (dc / sc) ** 2 + dh2 / (sh * sh))
+
+
+_POW25_7 = 25 ** 7
+
+
+def _ciede2000(l1, a1, b1, l2, a2, b2):
+    c_bar = (math.sqrt(a1 * a1 + b1 * b1) + math.sqrt(a2 * a2 + b2 * b2)) / 2
+    c_bar7 = c_bar ** 7
+    g = 0.5 * (1 - math.sqrt(c_bar7 / (c_bar7 + _POW25_7)))
+    a1p, a2p = (1 + g) * a1, (1 + g) * a2
+    c1p, c2p = math.sqrt(a1p * a1p + b1 * b1), math.sqrt(a2p * a2p + b2 * b2)
+    h1p = math.degrees(math.atan2(b1, a1p)) % 360 if c1p else 0.0
+    h2p = math.degrees(math.atan2(b2, a2p)) % 360 if c2p else 0.0
+
+    dl = l2 - l1
+    dc = c2p - c1p
+    chroma = c1p * c2p
+    if chroma == 0:
+        dh, h_bar = 0.0, h1p + h2p
+    else:
+        dh = h2p - h1p
+        if dh > 180:
+            dh -= 360
+        elif dh < -180:
+            dh += 360
+        h_bar = (h1p + h2p) / 2
+        if abs(h1p - h2p) > 180:
+            h_bar += 180 if h1p + h2p < 360 else -180
+    dhh = 2 * math.sqrt(chroma) * math.sin(math.radians(dh / 2))
+
+    l_bar50 = ((l1 + l2) / 2 - 50) ** 2
+    cp_bar = (c1p + c2p) / 2
+    cp_bar7 = cp_bar ** 7
+    t = (1 - 0.17 * math.cos(math.radians(h_bar - 30))
+         + 0.24 * math.cos(math.radians(2 * h_bar))
+         + 0.32 * math.cos(math.radians(3 * h_bar + 6))
+         - 0.20 * math.cos(math.radians(4 * h_bar - 63)))
+    d_theta = 30 * math.exp(-(((h_bar - 275) / 25) ** 2))
+    rt = -2 * math.sqrt(cp_bar7 / (cp_bar7 + _POW25_7)) * math.sin(math.radians(2 * d_theta))
+    sl = 1 + 0.015 * l_bar50 / math.sqrt(20 + l_bar50)
+    sc = 1 + 0.045 * cp_bar
+    sh = 1 + 0.015 * cp_bar * t
+    dl, dc, dhh = dl / sl, dc / sc, dhh / sh
+    return math.sqrt(dl * dl + dc * dc + dhh * dhh + rt * dc * dhh)
+
+
+_METHODS = {
+    "cie76": _cie76,
+    "cie94": _cie94,
+    "ciede2000": _ciede2000,
+}
+
+
+def _kernel(method):
+    try:
+        return _METHODS[method.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"Unsupported delta E method: {method!r}") from None
+
+
+def _lab(color):
+    color = Colorisator._from_any(color)
+    return rgb_to_lab(color.r, color.g, color.b)
+
+
+def _lab_array(colors):
+    return to_space_array(ColorArray._from_any(colors)._data, "lab")
+
+
+def delta_e(a, b, method="ciede2000"):
+    """Measure the perceived difference between two colors.
+
+    Colors are compared in CIELAB (D65); alpha is ignored. A difference
+    around 1.0 is the smallest one most observers notice.
+
+    Args:
+        a: Reference color (Colorisator instance or any valid color format)
+        b: Compared color (Colorisator instance or any valid color format)
+        method: "cie76", "cie94" (graphic arts weights, a is the reference) or "ciede2000".
+                Defaults to "ciede2000".
+
+    Raises:
+        ValueError: If the method is unknown
+
+    Returns:
+        Delta E as a float
+    """
+    kernel = _kernel(method)
+    return kernel(*_lab(a), *_lab(b))
+
+
+def delta_e_many(color, colors, method="ciede2000"):
+    """Measure the difference between one color and each color of a batch.
+
+    The reference is converted to CIELAB once and the batch in a single pass.
+
+    Args:
+        color: Reference color (Colorisator instance or any valid color format)
+        colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+        method: "cie76", "cie94" or "ciede2000" (see delta_e). Defaults to "ciede2000".
+
+    Raises:
+        ValueError: If the method is unknown
+
+    Returns:
+        array.array of floats, one per color of the batch
+    """
+    kernel = _kernel(method)
+    l1, a1, b1 = _lab(color)
+    lab = _lab_array(colors)
+    return array("d", [kernel(l1, a1, b1, lab[i], lab[i + 1], lab[i + 2]) for i in range(0, len(lab), 3)])
+
+
+def _block_distances(method, rows, cols):
+    """Return the flat len(rows) x len(cols) block of distances."""
+    kernel = _METHODS[method]
+    out = array("d", bytes(8 * (len(rows) // 3) * (len(cols) // 3)))
+    k = 0
+    for i in range(0, len(rows), 3):
+        l1, a1, b1 = rows[i], rows[i + 1], rows[i + 2]
+        for j in range(0, len(cols), 3):
+            out[k] = kernel(l1, a1, b1, cols[j], cols[j + 1], cols[j + 2])
+            k += 1
+    return out
+
+
+def _block_pairs(method, rows, cols, same, threshold, row_start, col_start):
+    """Return the (i, j, distance) pairs of a block closer than threshold, i < j."""
+    kernel = _METHODS[method]
+    pairs = []
+    for i in range(0, len(rows), 3):
+        l1, a1, b1 = rows[i], rows[i + 1], rows[i + 2]
+        for j in range(i + 3 if same else 0, len(cols), 3):
+            d = kernel(l1, a1, b1, cols[j], cols[j + 1], cols[j + 2])
+            if d < threshold:
+                pairs.append((row_start + i // 3, col_start + j // 3, d))
+    return pairs
+
+
+def _map_blocks(func, jobs, workers):
+    """Yield func(*job) for each job in order, keeping at most 2 jobs per worker in flight."""
+    if not workers or workers < 2:
+        for job in jobs:
+            yield func(*job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(func, *job))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _blocks(lab, block_size):
+    step = 3 * block_size
+    return [(start // 3, lab[start:start + step]) for start in range(0, len(lab), step)]
+
+
+def delta_e_matrix(colors, method="ciede2000", block_size=256, workers=None):
+    """Compute the N x N matrix of differences between all colors of a batch.
+
+    The matrix is computed in square blocks. CIE76 and CIEDE2000 are
+    symmetric, so only blocks on or above the diagonal are computed and then
+    mirrored. With CIE94, entry [i][j] uses color i as the reference.
+
+    Args:
+        colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+        method: "cie76", "cie94" or "ciede2000" (see delta_e). Defaults to "ciede2000".
+        block_size: Number of colors per block side. Defaults to 256.
+        workers: Number of worker processes. Defaults to None (current process only).
+
+    Raises:
+        ValueError: If the method is unknown
+
+    Returns:
+        List of N rows, each an array.array of N floats
+    """
+    _kernel(method)
+    method = method.lower()
+    lab = _lab_array(colors)
+    n = len(lab) // 3
+    matrix = [array("d", bytes(8 * n)) for _ in range(n)]
+    symmetric = method != "cie94"
+    blocks = _blocks(lab, block_size)
+    pairs = [(r, c) for r in blocks for c in blocks if not symmetric or c[0] >= r[0]]
+    jobs = ((method, rows, cols) for (_, rows), (_, cols) in pairs)
+    for ((r0, rows), (c0, cols)), block in zip(pairs, _map_blocks(_block_distances, jobs, workers)):
+        width = len(cols) // 3
+        for i in range(len(rows) // 3):
+            values = block[i * width:(i + 1) * width]
+            matrix[r0 + i][c0:c0 + width] = values
+            if symmetric and c0 != r0:
+                for j, d in enumerate(values):
+                    matrix[c0 + j][r0 + i] = d
+    return matrix
+
+
+def close_pairs(colors, threshold, method="ciede2000", block_size=256, workers=None):
+    """Find the pairs of colors of a batch that are closer than a threshold.
+
+    Pairs are checked block by block and only matches are kept, so memory
+    does not grow with N x N. An empty result means every pair is at least
+    threshold apart.
+
+    Args:
+        colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+        threshold: Minimum delta E expected between two colors
+        method: "cie76", "cie94" or "ciede2000" (see delta_e; with CIE94 the color with
+                the lower index is the reference). Defaults to "ciede2000".
+        block_size: Number of colors per block side. Defaults to 256.
+        workers: Number of worker processes. Defaults to None (current process only).
+
+    Raises:
+        ValueError: If the method is unknown
+
+    Returns:
+        List of (i, j, delta E) tuples with i < j, sorted by (i, j)
+    """
+    _kernel(method)
+    method = method.lower()
+    blocks = _blocks(_lab_array(colors), block_size)
+    jobs = (
+        (method, rows, cols, r0 == c0, threshold, r0, c0)
+        for r0, rows in blocks for c0, cols in blocks if c0 >= r0
+    )
+    found = [pair for block in _map_blocks(_block_pairs, jobs, workers) for pair in block]
+    found.sort()
+    return found
@@ -0,0 +1,344 @@
+from array import array
+from enum import Enum
+from itertools import islice
+
+
+class ColorisatorFormat(Enum):
+    RGB = "rgb"
+    RGBA = "rgba"
+    RGB255 = "rgb255"
+    HEX = "hex"
+    HEXALPHA = "hexalpha"
+    HSL = "hsl"
+    WEB = "web"
+    PROCESSING = "processing"
+    UNITY = "unity"
+
+
+# Two-digit uppercase hex string of every 8-bit value.
+_HEX = tuple(f"{i:02X}" for i in range(256))
+
+# Single hex digit of every 8-bit value whose two digits are equal (#RRGGBB -> #RGB).
+_WEB_SHORT = tuple(h[0] if h[0] == h[1] else None for h in _HEX)
+
+
+class ColorFormatter:
+    """Base class of output formats.
+
+    A formatter encodes a whole batch of colors at once from a flat RGBA array
+    (4 floats per color, normalized between 0.0 and 1.0). Subclasses implement
+    encode(); declaration formats (UNITY, PROCESSING) also set head and tail,
+    and override declare() for single colors.
+    """
+
+    #: Set to True when encode() needs the flat HLS array (3 floats per color).
+    needs_hls = False
+    #: Text written before the values of a sequence. None returns a list instead of a string.
+    head = None
+    #: Text written between the values of a sequence.
+    sep = ", "
+    #: Text written after the values of a sequence.
+    tail = None
+    #: Optional method encoding (r, g, b, a) integer tuples between 0 and 255, for formats
+    #: that only depend on 8-bit channels. It lets 8-bit inputs skip floats entirely.
+    encode_bytes = None
+
+    def encode(self, data, hls=None):
+        """Encode a batch of colors.
+
+        Args:
+            data: Flat sequence of RGBA floats (4 per color)
+            hls: Flat sequence of HLS floats (3 per color) when needs_hls is True, else None
+
+        Returns:
+            List with one encoded value per color
+        """
+        raise NotImplementedError
+
+    def declare(self, value):
+        """Turn the encoded value of a single color into the final output."""
+        return value
+
+    def finish(self, values):
+        """Turn the encoded values of a sequence of colors into the final output."""
+        if self.head is None:
+            return values
+        return self.head + self.sep.join(values) + self.tail
+
+    def text(self, value):
+        """Get the text written for one value by write_colors."""
+        return str(value)
+
+
+def _channels255(data):
+    """Yield (r, g, b, a) rounded to integers between 0 and 255, like Colorisator.get_rgb255."""
+    for i in range(0, len(data), 4):
+        yield round(data[i] * 255), round(data[i + 1] * 255), round(data[i + 2] * 255), round(data[i + 3] * 255)
+
+
+class HexFormatter(ColorFormatter):
+    def encode(self, data, hls=None):
+        return self.encode_bytes(_channels255(data))
+
+    def encode_bytes(self, channels):
+        hx = _HEX
+        out = []
+        append = out.append
+        for r, g, b, _ in channels:
+            if (r | g | b) >> 8 == 0:
+                append("#" + hx[r] + hx[g] + hx[b])
+            else:
+                append(f"#{r:02X}{g:02X}{b:02X}")
+        return out
+
+
+class HexAlphaFormatter(ColorFormatter):
+    def encode(self, data, hls=None):
+        return self.encode_bytes(_channels255(data))
+
+    def encode_bytes(self, channels):
+        hx = _HEX
+        out = []
+        append = out.append
+        for r, g, b, a in channels:
+            if (r | g | b | a) >> 8 == 0:
+                append("#" + hx[r] + hx[g] + hx[b] + hx[a])
+            else:
+                append(f"#{r:02X}{g:02X}{b:02X}{a:02X}")
+        return out
+
+
+class WebFormatter(ColorFormatter):
+    def encode(self, data, hls=None):
+        return self.encode_bytes(_channels255(data))
+
+    def encode_bytes(self, channels):
+        hx, short = _HEX, _WEB_SHORT
+        out = []
+        append = out.append
+        for r, g, b, _ in channels:
+            if (r | g | b) >> 8 == 0:
+                sr, sg, sb = short[r], short[g], short[b]
+                if sr and sg and sb:
+                    append("#" + sr + sg + sb)
+                else:
+                    append("#" + hx[r] + hx[g] + hx[b])
+            else:
+                append(f"#{r:02X}{g:02X}{b:02X}")
+        return out
+
+
+class RGBFormatter(ColorFormatter):
+    def encode(self, data, hls=None):
+        return [(round(data[i], 6), round(data[i + 1], 6), round(data[i + 2], 6)) for i in range(0, len(data), 4)]
+
+
+class RGBAFormatter(ColorFormatter):
+    def encode(self, data, hls=None):
+        return [
+            (round(data[i], 6), round(data[i + 1], 6), round(data[i + 2], 6), round(data[i + 3], 6))
+            for i in range(0, len(data), 4)
+        ]
+
+
+class RGB255Formatter(ColorFormatter):
+    def encode(self, data, hls=None):
+        return self.encode_bytes(_channels255(data))
+
+    def encode_bytes(self, channels):
+        return [(r, g, b) for r, g, b, _ in channels]
+
+
+class HSLFormatter(ColorFormatter):
+    needs_hls = True
+
+    def encode(self, data, hls=None):
+        return [(hls[j], hls[j + 2], hls[j + 1]) for j in range(0, len(hls), 3)]
+
+
+class UnityFormatter(ColorFormatter):
+    head = "private List<Color> palette = new() { "
+    tail = " };"
+
+    def encode(self, data, hls=None):
+        return [
+            f"new Color({round(data[i], 6):.3f}f, {round(data[i + 1], 6):.3f}f, {round(data[i + 2], 6):.3f}f)"
+            for i in range(0, len(data), 4)
+        ]
+
+    def declare(self, value):
+        return f"private Color colour = {value};"
+
+
+class ProcessingFormatter(ColorFormatter):
+    head = "color[] palette = { "
+    tail = " };"
+
+    def encode(self, data, hls=None):
+        return self.encode_bytes(_channels255(data))
+
+    def encode_bytes(self, channels):
+        return [f"color({r}, {g}, {b})" for r, g, b, _ in channels]
+
+    def declare(self, value):
+        return f"color colour = {value};"
+
+
+_formatters = {
+    ColorisatorFormat.HEX.value: HexFormatter(),
+    ColorisatorFormat.HEXALPHA.value: HexAlphaFormatter(),
+    ColorisatorFormat.WEB.value: WebFormatter(),
+    ColorisatorFormat.RGB.value: RGBFormatter(),
+    ColorisatorFormat.RGBA.value: RGBAFormatter(),
+    ColorisatorFormat.RGB255.value: RGB255Formatter(),
+    ColorisatorFormat.HSL.value: HSLFormatter(),
+    ColorisatorFormat.UNITY.value: UnityFormatter(),
+    ColorisatorFormat.PROCESSING.value: ProcessingFormatter(),
+}
+
+
+def register_format(name, formatter):
+    """Register an output format, usable as ``output=name`` everywhere.
+
+    Args:
+        name: Format name (case-insensitive string). Registering an existing name replaces it.
+        formatter: ColorFormatter instance
+
+    Raises:
+        TypeError: If formatter is not a ColorFormatter
+    """
+    if not isinstance(formatter, ColorFormatter):
+        raise TypeError("formatter must be a ColorFormatter instance")
+    _formatters[name.lower()] = formatter
+
+
+def get_formatter(output):
+    """Get the formatter of an output format.
+
+    Args:
+        output: Output format (ColorisatorFormat or registered name)
+
+    Raises:
+        ValueError: If the format is unknown
+
+    Returns:
+        ColorFormatter instance
+    """
+    key = output.value if isinstance(output, ColorisatorFormat) else output
+    try:
+        return _formatters[key.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"{output!r} is not a valid output format") from None
+
+
+def _pack(colors, needs_hls=False):
+    """Pack colors into flat RGBA (and HLS when needed) arrays."""
+    data = array("d")
+    for c in colors:
+        data.extend((c.r, c.g, c.b, c.a))
+    if not needs_hls:
+        return data, None
+    hls = array("d")
+    for c in colors:
+        hls.extend((c.h, c.l, c.s))
+    return data, hls
+
+
+def encode_colors(colors, output):
+    """Encode a list of colors with the bulk encoder of a format.
+
+    Args:
+        colors: List of Colorisator instances
+        output: Output format (ColorisatorFormat or registered name)
+
+    Returns:
+        List of encoded values, or a declaration string for UNITY and PROCESSING
+    """
+    formatter = get_formatter(output)
+    return formatter.finish(formatter.encode(*_pack(colors, formatter.needs_hls)))
+
+
+def iter_encode(colors, output, chunk_size=1024):
+    """Lazily encode colors, chunk by chunk.
+
+    Declaration formats (UNITY, PROCESSING) yield string chunks whose
+    concatenation is the declaration returned for the whole sequence.
+
+    Args:
+        colors: Iterable of Colorisator instances, or a ColorArray
+        output: Output format (ColorisatorFormat or registered name). None yields colors unchanged.
+        chunk_size: Number of colors encoded at once. Defaults to 1024.
+
+    Returns:
+        Generator of encoded values
+    """
+    if output is None:
+        return iter(colors)
+    return _iter_encode(colors, get_formatter(output), chunk_size)
+
+
+def _iter_chunks(colors, formatter, chunk_size):
+    from .color_array import ColorArray
+
+    if isinstance(colors, ColorArray):
+        for start in range(0, len(colors), chunk_size):
+            chunk = colors[start:start + chunk_size]
+            yield formatter.encode(chunk._data, chunk._get_hls() if formatter.needs_hls else None)
+        return
+
+    colors = iter(colors)
+    while True:
+        chunk = list(islice(colors, chunk_size))
+        if not chunk:
+            return
+        yield formatter.encode(*_pack(chunk, formatter.needs_hls))
+
+
+def _iter_encode(colors, formatter, chunk_size):
+    if formatter.head is None:
+        for values in _iter_chunks(colors, formatter, chunk_size):
+            yield from values
+        return
+
+    yield formatter.head
+    sep = ""
+    for values in _iter_chunks(colors, formatter, chunk_size):
+        if values:
+            yield sep + formatter.sep.join(values)
+            sep = formatter.sep
+    yield formatter.tail
+
+
+def write_colors(stream, colors, output, chunk_size=4096):
+    """Encode colors straight to a text stream, chunk by chunk.
+
+    List formats write one value per line, declaration formats (UNITY,
+    PROCESSING) write the declaration. Memory use depends on chunk_size only,
+    so colors can be a generator such as Colorisator.iter_gradient(...).
+
+    Args:
+        stream: Object with a write(str) method (text file, io.StringIO,
+                socket.makefile("w"), sys.stdout...)
+        colors: Iterable of Colorisator instances, or a ColorArray
+        output: Output format (ColorisatorFormat or registered name)
+        chunk_size: Number of colors encoded and written at once. Defaults to 4096.
+
+    Returns:
+        Number of colors written
+    """
+    formatter = get_formatter(output)
+    count = 0
+    if formatter.head is not None:
+        stream.write(formatter.head)
+    for values in _iter_chunks(colors, formatter, chunk_size):
+        if formatter.head is None:
+            text = formatter.text
+            stream.write("".join(text(v) + "\n" for v in values))
+        else:
+            if count and values:
+                stream.write(formatter.sep)
+            stream.write(formatter.sep.join(values))
+        count += len(values)
+    if formatter.head is not None:
+        stream.write(formatter.tail)
+    return count
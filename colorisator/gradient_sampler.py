@@ -0,0 +1,122 @@
+from array import array
+from bisect import bisect_right
+
+from .colorisator import Colorisator
+from .color_array import ColorArray
+
+
+class GradientSampler:
+    def __init__(self, stops, positions=None):
+        """Initialize a GradientSampler from a list of color stops.
+
+        Segment start colors, channel deltas and widths are computed once, so
+        sampling at any ``t`` is a binary search plus one interpolation.
+
+        Args:
+            stops: List of colors (Colorisator instances or any valid color formats)
+            positions: Optional list of stop positions between 0.0 and 1.0, in increasing
+                       order, one per stop. Defaults to None (evenly spaced stops).
+
+        Raises:
+            ValueError: If less than 2 colors are provided, or if positions are invalid
+        """
+        colors = [Colorisator._from_any(c) for c in stops]
+        n = len(colors)
+        if n < 2:
+            raise ValueError("At least two colors are needed for a GradientSampler")
+
+        if positions is None:
+            positions = [i / (n - 1) for i in range(n)]
+        else:
+            positions = [float(p) for p in positions]
+            if len(positions) != n:
+                raise ValueError("positions must contain one value per stop")
+            if any(b < a for a, b in zip(positions, positions[1:])):
+                raise ValueError("positions must be in increasing order")
+
+        self.colors = colors
+        self.positions = positions
+        self._starts = []
+        self._deltas = []
+        self._inv_widths = []
+        for i in range(n - 1):
+            start, end = colors[i], colors[i + 1]
+            self._starts.append((start.r, start.g, start.b, start.a))
+            self._deltas.append((end.r - start.r, end.g - start.g, end.b - start.b, end.a - start.a))
+            width = positions[i + 1] - positions[i]
+            self._inv_widths.append(1 / width if width else 0.0)
+
+    def __repr__(self):
+        return f"GradientSampler({[c.get_hex() for c in self.colors]!r}, positions={self.positions!r})"
+
+    def _locate(self, t):
+        """Return the segment index and the local interpolation factor for t."""
+        positions = self.positions
+        if t <= positions[0]:
+            return 0, 0.0
+        if t >= positions[-1]:
+            return len(positions) - 2, 1.0
+        i = bisect_right(positions, t) - 1
+        return i, (t - positions[i]) * self._inv_widths[i]
+
+    def sample(self, t, output=None):
+        """Sample the gradient at a single position.
+
+        Args:
+            t: Position between 0.0 and 1.0 (clamped to the first and last stops)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns Colorisator).
+
+        Returns:
+            Color at position t in the specified output format
+        """
+        i, u = self._locate(t)
+        r, g, b, a = self._starts[i]
+        dr, dg, db, da = self._deltas[i]
+        color = Colorisator._from_normalized(r + dr * u, g + dg * u, b + db * u, a + da * u)
+        return Colorisator._format_output(color, output)
+
+    def sample_many(self, ts, output=None):
+        """Sample the gradient at many positions.
+
+        Args:
+            ts: Iterable of positions between 0.0 and 1.0 (clamped to the first and last stops)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Colors at every position in the specified output format
+        """
+        locate = self._locate
+        starts, deltas = self._starts, self._deltas
+        data = array("d")
+        for t in ts:
+            i, u = locate(t)
+            r, g, b, a = starts[i]
+            dr, dg, db, da = deltas[i]
+            data.extend((r + dr * u, g + dg * u, b + db * u, a + da * u))
+        return ColorArray._from_data(data)._format_output(output)
+
+    def gradient(self, steps=10, output=None):
+        """Generate evenly spaced samples, exactly as Colorisator.gradient_stops does.
+
+        Stops are spread over the steps the same way gradient_stops does it, so
+        explicit positions are ignored here.
+
+        Args:
+            steps: Total number of color steps in the gradient. Defaults to 10.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Colors forming a smooth gradient through all color stops
+        """
+        n = len(self.colors)
+        starts, deltas = self._starts, self._deltas
+        data = array("d")
+        for i in range(n - 1):
+            count = int(round((steps - 1) * (i + 1) / (n - 1))) - int(round((steps - 1) * i / (n - 1)))
+            r, g, b, a = starts[i]
+            dr, dg, db, da = deltas[i]
+            # Each segment but the last drops its end color, which starts the next one.
+            for j in range(count if i < n - 2 else count + 1):
+                u = j / count
+                data.extend((r + dr * u, g + dg * u, b + db * u, a + da * u))
+        return ColorArray._from_data(data)._format_output(output)
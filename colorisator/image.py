@@ -0,0 +1,94 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .color_array import ColorArray
+from .colorisator import _buffer_layout
+
+
+def _recolor_tile(pipeline, tile, layout):
+    return pipeline.apply_many(ColorArray.frombuffer(tile, layout)).tobytes(layout)
+
+
+def _map_tiles(pipeline, tiles, layout, workers):
+    """Yield recolored tiles in order, keeping at most 2 tiles per worker in flight."""
+    if not workers or workers < 2:
+        for tile in tiles:
+            yield _recolor_tile(pipeline, tile, layout)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for tile in tiles:
+            pending.append(pool.submit(_recolor_tile, pipeline, tile, layout))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def recolor_buffer(buffer, pipeline, layout="rgba", tile_pixels=65536, workers=None):
+    """Apply a color pipeline to a packed 8-bit pixel buffer, in place.
+
+    Pixels are processed in tiles, so extra memory depends on tile_pixels (and
+    workers), not on the buffer size. Each pixel gets the same 8-bit result as
+    running the equivalent Colorisator calls on it.
+
+    Args:
+        buffer: Writable object supporting the buffer protocol (bytearray, memoryview,
+                array.array...) holding packed 8-bit channels
+        pipeline: Pipeline to apply (see Colorisator.pipeline())
+        layout: Channel order: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+        tile_pixels: Number of pixels processed at once. Defaults to 65536.
+        workers: Number of worker processes. Defaults to None (current process only).
+
+    Raises:
+        ValueError: If the layout is unknown or the buffer size is not a multiple of the pixel size
+
+    Returns:
+        The buffer
+    """
+    _, size = _buffer_layout(layout)
+    view = memoryview(buffer).cast("B")
+    if len(view) % size:
+        raise ValueError(f"Buffer size must be a multiple of {size} bytes for layout {layout!r}")
+    step = tile_pixels * size
+    starts = range(0, len(view), step)
+    tiles = (bytes(view[start:start + step]) for start in starts)
+    for start, tile in zip(starts, _map_tiles(pipeline, tiles, layout, workers)):
+        view[start:start + len(tile)] = tile
+    return buffer
+
+
+def recolor_image(image, pipeline, tile_rows=64, workers=None):
+    """Apply a color pipeline to a Pillow image.
+
+    The image is processed in horizontal bands of tile_rows rows. RGB and RGBA
+    images keep their mode, other modes are converted to RGBA.
+
+    Args:
+        image: PIL.Image.Image instance
+        pipeline: Pipeline to apply (see Colorisator.pipeline())
+        tile_rows: Height of each processed band, in pixels. Defaults to 64.
+        workers: Number of worker processes. Defaults to None (current process only).
+
+    Raises:
+        ImportError: If Pillow is not installed
+
+    Returns:
+        New PIL.Image.Image instance
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Pillow is required for recolor_image()") from None
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA")
+    mode = image.mode
+    width, height = image.size
+    result = Image.new(mode, image.size)
+    boxes = [(0, top, width, min(height, top + tile_rows)) for top in range(0, height, tile_rows)]
+    tiles = (image.crop(box).tobytes() for box in boxes)
+    for box, tile in zip(boxes, _map_tiles(pipeline, tiles, mode.lower(), workers)):
+        result.paste(Image.frombytes(mode, (box[2] - box[0], box[3] - box[1]), tile), box[:2])
+    return result
@@ -0,0 +1,280 @@
+import logging
+import os
+import tempfile
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+from . import colorisator as _colorisator_module, css, formats, pipeline, spaces
+from .colorisator import Colorisator, _ParseCache
+from .color_array import ColorArray
+
+
+InstrumentSnapshot = namedtuple("InstrumentSnapshot", ["counters", "timings"])
+
+_lock = threading.Lock()
+_counters = {}
+_timings = {}
+
+# (owner, attribute name, original value) of every patched attribute, while enabled.
+_patches = []
+_MISSING = object()
+
+# Number of open profile() scopes, and whether the first of them enabled instrumentation.
+_scopes = 0
+_scopes_enabled = False
+
+
+def _count(name, n=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def _timed(name, func):
+    """Wrap func to add its calls and cumulative time under name."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                _timings[name] = _timings.get(name, 0.0) + elapsed
+                _counters[name] = _counters.get(name, 0) + 1
+    return wrapper
+
+
+def _counted(name, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        _count(name)
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def _cache_get(get):
+    @wraps(get)
+    def wrapper(self, key):
+        value = get(self, key)
+        _count("parse_cache_misses" if value is None else "parse_cache_hits")
+        return value
+    return wrapper
+
+
+class _Colorsys:
+    """Stand-in for the colorsys module in the colorisator modules, counting HLS conversions."""
+
+    def __init__(self, module):
+        self._module = module
+        self.rgb_to_hls = _timed("rgb_to_hls", module.rgb_to_hls)
+        self.hls_to_rgb = _timed("hls_to_rgb", module.hls_to_rgb)
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+def _patch(owner, name, value):
+    # Originals are read from __dict__, so descriptors (classmethod, staticmethod) are kept as is
+    # and attributes that were only inherited (formatter methods) are deleted again by disable().
+    _patches.append((owner, name, vars(owner).get(name, _MISSING)))
+    setattr(owner, name, value)
+
+
+def is_enabled():
+    """Return True if instrumentation is enabled."""
+    return bool(_patches)
+
+
+def enable():
+    """Start counting and timing the hot paths of the library.
+
+    Instrumented code is swapped in only while enabled, so there is no
+    overhead at all when instrumentation is disabled (the default). Counters:
+
+    - constructions: Colorisator objects created (parsed or derived)
+    - parse_input: values parsed by Colorisator._parse_input
+    - parse_cache_hits, parse_cache_misses: parse cache lookups (see Colorisator.enable_parse_cache)
+    - rgb_to_hls, hls_to_rgb: colorsys conversions made by the library (not the
+      palette_*_many functions, which convert inline)
+    - update_from_hls, format_output: calls of these internal steps
+    - encode.<format>, encode_bytes.<format>: batch encode calls of each output format
+      registered when enabling (encode_bytes is the 8-bit path, see ColorFormatter)
+
+    Timings are cumulative seconds, including nested instrumented calls.
+    Only the current process is instrumented (not worker processes).
+    Calling enable() again while enabled does nothing.
+    """
+    with _lock:
+        _enable()
+
+
+def _enable():
+    if _patches:
+        return
+    init = vars(Colorisator)["__init__"]
+    from_normalized = vars(Colorisator)["_from_normalized"].__func__
+    format_output = vars(Colorisator)["_format_output"].__func__
+    _patch(Colorisator, "__init__", _counted("constructions", init))
+    _patch(Colorisator, "_from_normalized", classmethod(_counted("constructions", from_normalized)))
+    _patch(Colorisator, "_parse_input", _timed("parse_input", vars(Colorisator)["_parse_input"]))
+    _patch(Colorisator, "_update_from_hls", _timed("update_from_hls", vars(Colorisator)["_update_from_hls"]))
+    _patch(Colorisator, "_format_output", staticmethod(_timed("format_output", format_output)))
+    _patch(ColorArray, "_format_output", _timed("format_output", vars(ColorArray)["_format_output"]))
+    _patch(_ParseCache, "get", _cache_get(vars(_ParseCache)["get"]))
+
+    stand_in = _Colorsys(_colorisator_module.colorsys)
+    for module in (_colorisator_module, css, pipeline, spaces):
+        _patch(module, "colorsys", stand_in)
+
+    wrapped = set()
+    for name, formatter in formats._formatters.items():
+        if id(formatter) not in wrapped:
+            wrapped.add(id(formatter))
+            _patch(formatter, "encode", _timed(f"encode.{name}", formatter.encode))
+            if formatter.encode_bytes is not None:
+                _patch(formatter, "encode_bytes", _timed(f"encode_bytes.{name}", formatter.encode_bytes))
+
+
+def disable():
+    """Stop instrumentation and restore the original code paths. Counters are kept."""
+    with _lock:
+        _disable()
+
+
+def _disable():
+    while _patches:
+        owner, name, original = _patches.pop()
+        if original is _MISSING:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+def reset():
+    """Set every counter and timing back to zero."""
+    with _lock:
+        _counters.clear()
+        _timings.clear()
+
+
+def snapshot():
+    """Get a copy of the current counters and timings.
+
+    Returns:
+        InstrumentSnapshot named tuple (counters, timings): dicts mapping names to
+        call counts and to cumulative seconds
+    """
+    with _lock:
+        return InstrumentSnapshot(dict(_counters), dict(_timings))
+
+
+class Profile:
+    """Counters and timings of a profile() scope, filled when the scope exits."""
+
+    def __init__(self):
+        self.counters = {}
+        self.timings = {}
+
+    def __repr__(self):
+        return f"Profile(counters={self.counters!r}, timings={self.timings!r})"
+
+
+@contextmanager
+def profile():
+    """Instrument a block of code and collect what happened inside it.
+
+    Instrumentation is enabled for the block, and disabled again when the
+    last open profile exits if it was disabled before the first one; profiles
+    can be nested or run in several threads at once. Global counters keep
+    running, each scope only records their difference, so a profile also
+    counts the work of other threads during its block.
+
+    Yields:
+        Profile whose counters and timings are set when the block exits
+
+    Example:
+        with instrument.profile() as p:
+            Colorisator("#3543CA").lighten(0.1, output="hex")
+        print(p.counters["constructions"], p.timings["parse_input"])
+    """
+    global _scopes, _scopes_enabled
+    with _lock:
+        if not _scopes:
+            _scopes_enabled = not _patches
+        _scopes += 1
+        _enable()
+    before = snapshot()
+    scope = Profile()
+    try:
+        yield scope
+    finally:
+        after = snapshot()
+        with _lock:
+            _scopes -= 1
+            if not _scopes and _scopes_enabled:
+                _disable()
+        scope.counters = {k: v - before.counters.get(k, 0) for k, v in after.counters.items()
+                          if v != before.counters.get(k, 0)}
+        scope.timings = {k: v - before.timings.get(k, 0.0) for k, v in after.timings.items()
+                         if v != before.timings.get(k, 0.0)}
+
+
+def log_snapshot(logger=None, level=logging.INFO, data=None):
+    """Log counters and timings, one record per name.
+
+    Args:
+        logger: logging.Logger. Defaults to None (the "colorisator" logger).
+        level: Logging level. Defaults to logging.INFO.
+        data: InstrumentSnapshot or Profile. Defaults to None (current snapshot()).
+    """
+    logger = logger or logging.getLogger("colorisator")
+    data = snapshot() if data is None else data
+    for name in sorted(set(data.counters) | set(data.timings)):
+        seconds = data.timings.get(name)
+        if seconds is None:
+            logger.log(level, "%s: %d calls", name, data.counters[name])
+        else:
+            logger.log(level, "%s: %d calls, %.6f s", name, data.counters.get(name, 0), seconds)
+
+
+def _prometheus_text(data, prefix):
+    lines = [
+        f"# HELP {prefix}_calls_total Instrumented colorisator events.",
+        f"# TYPE {prefix}_calls_total counter",
+    ]
+    lines += [f'{prefix}_calls_total{{name="{name}"}} {value}' for name, value in sorted(data.counters.items())]
+    lines += [
+        f"# HELP {prefix}_seconds_total Cumulative time spent in instrumented colorisator code.",
+        f"# TYPE {prefix}_seconds_total counter",
+    ]
+    lines += [f'{prefix}_seconds_total{{name="{name}"}} {value!r}' for name, value in sorted(data.timings.items())]
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(target, data=None, prefix="colorisator"):
+    """Export counters and timings in the Prometheus text exposition format.
+
+    Files are replaced atomically, so they can be read at any time by the
+    node_exporter textfile collector.
+
+    Args:
+        target: File path, or object with a write(str) method
+        data: InstrumentSnapshot or Profile. Defaults to None (current snapshot()).
+        prefix: Metric name prefix. Defaults to "colorisator".
+    """
+    text = _prometheus_text(snapshot() if data is None else data, prefix)
+    if hasattr(target, "write"):
+        target.write(text)
+        return
+    directory = os.path.dirname(os.path.abspath(target))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".colorisator-", suffix=".prom")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
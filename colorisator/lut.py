@@ -0,0 +1,135 @@
+import struct
+import zlib
+from array import array
+
+from .colorisator import Colorisator
+from .color_array import ColorArray
+from .gradient_sampler import GradientSampler
+from .spaces import _clip, _unwrap_hues, get_space
+
+
+def _png_chunk(kind, payload):
+    return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+
+class GradientLUT:
+    def __init__(self, stops, size=256, positions=None, space="rgb"):
+        """Bake a multi-stop gradient into a fixed-size lookup table.
+
+        Entry ``i`` holds the gradient sampled at ``i / (size - 1)``.
+
+        Args:
+            stops: List of colors (Colorisator instances or any valid color formats)
+            size: Number of entries in the table. Defaults to 256.
+            positions: Optional list of stop positions between 0.0 and 1.0, in increasing
+                       order, one per stop. Defaults to None (evenly spaced stops).
+            space: Interpolation space: "rgb", "hls", "oklab", "oklch" or "lab" (hues take
+                   the shortest way around the color wheel). Defaults to "rgb".
+
+        Raises:
+            ValueError: If size is less than 2, the space is unknown, or the stops are invalid
+        """
+        if size < 2:
+            raise ValueError("A lookup table needs at least 2 entries")
+        to_space, from_space, hue = get_space(space)
+
+        colors = [Colorisator._from_any(c) for c in stops]
+        ts = [i / (size - 1) for i in range(size)]
+        if to_space is None:
+            self.colors = GradientSampler(colors, positions).sample_many(ts)
+        else:
+            channels = [[*to_space(c.r, c.g, c.b), c.a] for c in colors]
+            if hue is not None:
+                _unwrap_hues(channels, hue)
+            # The sampler only interpolates 4 channels: feed it the converted ones.
+            pseudo = [Colorisator._from_normalized(*c) for c in channels]
+            data = GradientSampler(pseudo, positions).sample_many(ts)._data
+            for i in range(0, len(data), 4):
+                r, g, b = from_space(data[i], data[i + 1], data[i + 2])
+                data[i], data[i + 1], data[i + 2] = _clip(r), _clip(g), _clip(b)
+            self.colors = ColorArray._from_data(data)
+        self.size = size
+        self.space = space.lower()
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return self.colors[index]
+
+    def __repr__(self):
+        return f"GradientLUT(size={self.size}, space={self.space!r})"
+
+    def lookup(self, t, output=None):
+        """Get the table entry nearest to a position.
+
+        Args:
+            t: Position between 0.0 and 1.0 (clamped)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns Colorisator).
+
+        Returns:
+            Color in the specified output format
+        """
+        i = min(self.size - 1, max(0, int(t * (self.size - 1) + 0.5)))
+        return Colorisator._format_output(self.colors[i], output)
+
+    def tobytes(self, dtype="uint8", layout="rgba"):
+        """Export the table as packed bytes.
+
+        Args:
+            dtype: "uint8" (one byte per channel) or "float32" (native-endian floats
+                   between 0.0 and 1.0, RGBA only). Defaults to "uint8".
+            layout: Channel order for uint8 tables: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+
+        Raises:
+            ValueError: If dtype is unknown
+
+        Returns:
+            Bytes object
+        """
+        if dtype == "uint8":
+            return self.colors.tobytes(layout)
+        if dtype == "float32":
+            return array("f", self.colors._data).tobytes()
+        raise ValueError(f"Unsupported dtype: {dtype!r}")
+
+    def to_numpy(self, dtype="uint8"):
+        """Export the table as a NumPy array of shape (size, 4).
+
+        Args:
+            dtype: "uint8" or "float32". Defaults to "uint8".
+
+        Raises:
+            ImportError: If NumPy is not installed
+
+        Returns:
+            numpy.ndarray
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("NumPy is required for GradientLUT.to_numpy()") from None
+        return np.frombuffer(self.tobytes(dtype), dtype=np.dtype(dtype)).reshape(self.size, 4).copy()
+
+    def save_raw(self, path, dtype="uint8", layout="rgba"):
+        """Write the table as a raw binary file (see tobytes)."""
+        with open(path, "wb") as f:
+            f.write(self.tobytes(dtype, layout))
+
+    def save_png(self, path, height=1):
+        """Write the table as an 8-bit RGBA PNG strip, one pixel per entry.
+
+        Args:
+            path: Destination file path
+            height: Height of the strip in pixels. Defaults to 1.
+        """
+        row = b"\x00" + self.tobytes("uint8", "rgba")
+        header = struct.pack(">IIBBBBB", self.size, height, 8, 6, 0, 0, 0)
+        png = (
+            b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(row * height))
+            + _png_chunk(b"IEND", b"")
+        )
+        with open(path, "wb") as f:
+            f.write(png)
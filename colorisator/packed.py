@@ -0,0 +1,245 @@
+from array import array
+
+from .byte_kernels import _clamped, _shade_table, _tint_table
+from .colorisator import Colorisator, _BYTE_VALUES, _to_byte
+from .color_array import ColorArray
+from .formats import _HEX
+
+
+def _pack(r, g, b, a):
+    """Pack 4 normalized channels into a 0xRRGGBBAA integer."""
+    return _to_byte(r) << 24 | _to_byte(g) << 16 | _to_byte(b) << 8 | _to_byte(a)
+
+
+def _unpack(v):
+    """Return the normalized (r, g, b, a) channels of a 0xRRGGBBAA integer."""
+    return _BYTE_VALUES[v >> 24], _BYTE_VALUES[v >> 16 & 255], _BYTE_VALUES[v >> 8 & 255], _BYTE_VALUES[v & 255]
+
+
+def _map_rgb(v, table):
+    # table is a clamped byte_kernels table, so results match Colorisator.tint/shade exactly.
+    # tint and shade return opaque colors, like their Colorisator counterparts.
+    return table[v >> 24] << 24 | table[v >> 16 & 255] << 16 | table[v >> 8 & 255] << 8 | 255
+
+
+def _lerp_value(v, w, t):
+    r, g, b, a = _unpack(v)
+    r2, g2, b2, a2 = _unpack(w)
+    return _pack(r + (r2 - r) * t, g + (g2 - g) * t, b + (b2 - b) * t, a + (a2 - a) * t)
+
+
+def _value(color):
+    if isinstance(color, PackedColor):
+        return color.value
+    color = Colorisator._from_any(color)
+    return _pack(color.r, color.g, color.b, color.a)
+
+
+class PackedColor:
+    __slots__ = ("value",)
+
+    def __init__(self, value, alpha=1.0):
+        """Initialize a color stored as a single 32-bit integer (8 bits per channel).
+
+        Args:
+            value: Packed integer 0xRRGGBBAA, Colorisator instance, or any valid color
+                   format (channels are rounded to 8 bits)
+            alpha: Opacity between 0.0 and 1.0, for formats without alpha. Defaults to 1.0.
+
+        Raises:
+            ValueError: If value is an integer outside 0 to 0xFFFFFFFF, or an unsupported format
+        """
+        if isinstance(value, int):
+            if not 0 <= value <= 0xFFFFFFFF:
+                raise ValueError("Packed colors must be between 0 and 0xFFFFFFFF")
+            self.value = value
+        else:
+            color = value if isinstance(value, Colorisator) else Colorisator(value, alpha)
+            self.value = _pack(color.r, color.g, color.b, color.a)
+
+    @classmethod
+    def _from_value(cls, value):
+        obj = cls.__new__(cls)
+        obj.value = value
+        return obj
+
+    @classmethod
+    def from_colorisator(cls, color):
+        """Pack a Colorisator, rounding channels to 8 bits (lossless for 8-bit colors)."""
+        return cls._from_value(_pack(color.r, color.g, color.b, color.a))
+
+    def to_colorisator(self):
+        """Unpack to a Colorisator whose channels are exactly i / 255.
+
+        Returns:
+            New Colorisator instance
+        """
+        return Colorisator._from_normalized(*_unpack(self.value))
+
+    def __repr__(self):
+        return f'PackedColor("{self.get_hex_alpha()}")'
+
+    def __eq__(self, other):
+        return isinstance(other, PackedColor) and self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __int__(self):
+        return self.value
+
+    def get_rgb255(self):
+        """Get RGB color values as integers between 0 and 255.
+
+        Returns:
+            Tuple of (red, green, blue) as integers between 0 and 255
+        """
+        v = self.value
+        return v >> 24, v >> 16 & 255, v >> 8 & 255
+
+    def get_hex(self):
+        """Get color as hexadecimal string (without alpha).
+
+        Returns:
+            Hex color string in format #RRGGBB
+        """
+        return f"#{self.value >> 8:06X}"
+
+    def get_hex_alpha(self):
+        """Get color as hexadecimal string including alpha channel.
+
+        Returns:
+            Hex color string in format #RRGGBBAA
+        """
+        return f"#{self.value:08X}"
+
+    def invert(self):
+        """Invert RGB channels, keeping alpha (see Colorisator.invert)."""
+        return PackedColor._from_value(self.value ^ 0xFFFFFF00)
+
+    def tint(self, amount=0.1):
+        """Mix with white (see Colorisator.tint)."""
+        return PackedColor._from_value(_map_rgb(self.value, _clamped(_tint_table, amount)))
+
+    def shade(self, amount=0.1):
+        """Mix with black (see Colorisator.shade)."""
+        return PackedColor._from_value(_map_rgb(self.value, _clamped(_shade_table, amount)))
+
+    def _lerp(self, other, t):
+        return PackedColor._from_value(_lerp_value(self.value, _value(other), t))
+
+
+class PackedArray:
+    def __init__(self, colors=None, alpha=1.0):
+        """Initialize a compact collection of 8-bit colors, 4 bytes per color.
+
+        Colors are stored in an array.array of unsigned 32-bit integers
+        (0xRRGGBBAA), several times smaller than a ColorArray and far smaller
+        than a list of Colorisator objects. Items are returned as PackedColor.
+
+        Args:
+            colors: ColorArray or iterable of colors (PackedColor, Colorisator instances or any
+                    valid color formats). Defaults to None (empty collection).
+            alpha: Opacity applied to colors parsed without alpha. Defaults to 1.0.
+        """
+        self._values = array("I")
+        if isinstance(colors, ColorArray):
+            data = colors._data
+            self._values.extend(_pack(data[i], data[i + 1], data[i + 2], data[i + 3]) for i in range(0, len(data), 4))
+        elif colors is not None:
+            for c in colors:
+                if not isinstance(c, (PackedColor, Colorisator)):
+                    c = Colorisator(c, alpha)
+                self._values.append(_value(c))
+
+    @classmethod
+    def _from_values(cls, values):
+        obj = cls.__new__(cls)
+        obj._values = values
+        return obj
+
+    def to_color_array(self):
+        """Unpack to a ColorArray whose channels are exactly i / 255.
+
+        Returns:
+            New ColorArray
+        """
+        values = self._values
+        data = array("d", bytes(32 * len(values)))
+        for i, v in enumerate(values):
+            data[4 * i], data[4 * i + 1], data[4 * i + 2], data[4 * i + 3] = _unpack(v)
+        return ColorArray._from_data(data)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return map(PackedColor._from_value, self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PackedArray._from_values(self._values[index])
+        return PackedColor._from_value(self._values[index])
+
+    def __repr__(self):
+        return f"PackedArray({len(self)} colors)"
+
+    def __eq__(self, other):
+        return isinstance(other, PackedArray) and self._values == other._values
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @property
+    def nbytes(self):
+        """Size of the color storage in bytes."""
+        return len(self._values) * self._values.itemsize
+
+    def get_rgb255(self):
+        """Get colors as lists of integer RGB values between 0 and 255.
+
+        Returns:
+            List of (red, green, blue) tuples
+        """
+        return [(v >> 24, v >> 16 & 255, v >> 8 & 255) for v in self._values]
+
+    def get_hex(self):
+        """Get colors as hexadecimal strings (without alpha).
+
+        Returns:
+            List of hex color strings in format #RRGGBB
+        """
+        hx = _HEX
+        return [f"#{hx[v >> 24]}{hx[v >> 16 & 255]}{hx[v >> 8 & 255]}" for v in self._values]
+
+    def get_hex_alpha(self):
+        """Get colors as hexadecimal strings including alpha channel.
+
+        Returns:
+            List of hex color strings in format #RRGGBBAA
+        """
+        return [f"#{v:08X}" for v in self._values]
+
+    def invert(self):
+        """Invert RGB channels of every color, keeping alpha (see Colorisator.invert)."""
+        return PackedArray._from_values(array("I", [v ^ 0xFFFFFF00 for v in self._values]))
+
+    def tint(self, amount=0.1):
+        """Mix every color with white (see Colorisator.tint)."""
+        table = _clamped(_tint_table, amount)
+        return PackedArray._from_values(array("I", [_map_rgb(v, table) for v in self._values]))
+
+    def shade(self, amount=0.1):
+        """Mix every color with black (see Colorisator.shade)."""
+        table = _clamped(_shade_table, amount)
+        return PackedArray._from_values(array("I", [_map_rgb(v, table) for v in self._values]))
+
+    def _lerp(self, other, t):
+        if isinstance(other, PackedArray):
+            if len(other) != len(self):
+                raise ValueError("Both arrays must have the same length")
+            pairs = zip(self._values, other._values)
+        else:
+            w = _value(other)
+            pairs = ((v, w) for v in self._values)
+        return PackedArray._from_values(array("I", [_lerp_value(v, w, t) for v, w in pairs]))
@@ -0,0 +1,151 @@
+import heapq
+
+from .colorisator import Colorisator
+from .color_array import ColorArray
+from .spaces import get_space
+
+
+def _build(points, indices, depth=0):
+    """Build a k-d tree node: (index, axis, left, right), or None."""
+    if not indices:
+        return None
+    axis = depth % 3
+    indices = sorted(indices, key=lambda i: points[i][axis])
+    mid = len(indices) // 2
+    return (
+        indices[mid],
+        axis,
+        _build(points, indices[:mid], depth + 1),
+        _build(points, indices[mid + 1:], depth + 1),
+    )
+
+
+class PaletteIndex:
+    def __init__(self, palette, space="rgb"):
+        """Build a nearest-color index over a palette.
+
+        Palette colors are stored in a k-d tree, so a query costs about
+        O(log n) distance computations instead of a scan of the whole palette.
+        Alpha is ignored when comparing colors.
+
+        Args:
+            palette: List of colors (Colorisator instances or any valid color formats), or a ColorArray
+            space: Space in which distances are measured: "rgb", "oklab" or "lab" (perceptual,
+                   distances follow CIE76 Delta E). Defaults to "rgb".
+
+        Raises:
+            ValueError: If the palette is empty, or the space is unknown or has a hue axis
+        """
+        to_space, _, hue = get_space(space)
+        if hue is not None:
+            # Euclidean distances are meaningless on hue angles.
+            raise ValueError(f"Unsupported space for nearest-color search: {space!r}")
+        if to_space is None:
+            self._to_space = lambda c: (c.r, c.g, c.b)
+        else:
+            self._to_space = lambda c: to_space(c.r, c.g, c.b)
+        self.colors = [Colorisator._from_any(c) for c in palette]
+        if not self.colors:
+            raise ValueError("The palette must contain at least one color")
+        self.space = space.lower()
+        self._points = [self._to_space(c) for c in self.colors]
+        self._root = _build(self._points, list(range(len(self._points))))
+
+    def __len__(self):
+        return len(self.colors)
+
+    def __repr__(self):
+        return f"PaletteIndex({len(self.colors)} colors, space={self.space!r})"
+
+    def _search(self, q, k):
+        """Return the k nearest (squared distance, index) pairs, closest first."""
+        points = self._points
+        qx, qy, qz = q
+        heap = []  # max-heap of (-distance, -index) holding the best k so far
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            index, axis, left, right = node
+            px, py, pz = points[index]
+            d = (px - qx) ** 2 + (py - qy) ** 2 + (pz - qz) ** 2
+            if len(heap) < k:
+                heapq.heappush(heap, (-d, -index))
+            elif (-d, -index) > heap[0]:
+                heapq.heapreplace(heap, (-d, -index))
+
+            diff = q[axis] - points[index][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Visit the far side only if the splitting plane is closer than the worst kept match.
+            if far is not None and (len(heap) < k or diff * diff <= -heap[0][0]):
+                stack.append(far)
+            stack.append(near)
+        return sorted((-d, -i) for d, i in heap)
+
+    def nearest_index(self, color):
+        """Get the position in the palette of the color nearest to a query.
+
+        Args:
+            color: Query color (Colorisator instance or any valid color format)
+
+        Returns:
+            Index of the nearest palette color (the first one on ties)
+        """
+        return self._search(self._to_space(Colorisator._from_any(color)), 1)[0][1]
+
+    def nearest(self, color, output=None):
+        """Get the palette color nearest to a query.
+
+        Args:
+            color: Query color (Colorisator instance or any valid color format)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns Colorisator).
+
+        Returns:
+            Nearest palette color in the specified output format
+        """
+        return Colorisator._format_output(self.colors[self.nearest_index(color)], output)
+
+    def k_nearest(self, color, k=3, output=None):
+        """Get the k palette colors nearest to a query, closest first.
+
+        Args:
+            color: Query color (Colorisator instance or any valid color format)
+            k: Number of colors to return. Defaults to 3.
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns list of Colorisator).
+
+        Raises:
+            ValueError: If k is less than 1
+
+        Returns:
+            List of palette colors in the specified output format
+        """
+        if k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        found = self._search(self._to_space(Colorisator._from_any(color)), k)
+        return Colorisator._format_output([self.colors[i] for _, i in found], output)
+
+    def nearest_many(self, colors, output=None):
+        """Snap a batch of colors to the palette.
+
+        Args:
+            colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Nearest palette colors in the specified output format
+        """
+        indices = self.nearest_indices(colors)
+        return ColorArray([self.colors[i] for i in indices])._format_output(output)
+
+    def nearest_indices(self, colors):
+        """Get the palette positions of the colors nearest to a batch of queries.
+
+        Args:
+            colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+
+        Returns:
+            List of palette indexes
+        """
+        search, to_space = self._search, self._to_space
+        return [search(to_space(c), 1)[0][1] for c in ColorArray._from_any(colors)]
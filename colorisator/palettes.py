@@ -0,0 +1,192 @@
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .color_array import ColorArray
+from .formats import get_formatter
+
+
+# Same constants as colorsys, so the inlined conversions below give identical floats.
+_ONE_THIRD = 1.0 / 3.0
+_ONE_SIXTH = 1.0 / 6.0
+_TWO_THIRD = 2.0 / 3.0
+
+
+def _hue_ramp(hue):
+    """Branch of colorsys.hls_to_rgb for the hue of one channel.
+
+    Returns:
+        Ramp factor t (channel m1 + (m2 - m1) * t * 6.0), or True for m2 and False for m1
+    """
+    hue = hue % 1.0
+    if hue < _ONE_SIXTH:
+        return hue
+    if hue < 0.5:
+        return True
+    if hue < _TWO_THIRD:
+        return _TWO_THIRD - hue
+    return False
+
+
+def _hue_ramps(h):
+    return _hue_ramp(h + _ONE_THIRD), _hue_ramp(h), _hue_ramp(h - _ONE_THIRD)
+
+
+def _palette_chunk(kind, params, data, hls, formatter):
+    """Build the palette rows of a chunk of base colors.
+
+    colorsys.hls_to_rgb is inlined: the hue branches of a "lightness" row and
+    the lightness terms of a "hue" row are computed once per base color.
+
+    Args:
+        kind: "hue" (params: hue shifts) or "lightness" (params: (max_delta, offsets),
+              offsets None keeping the base lightness)
+        data: Flat RGBA array of the base colors
+        hls: Flat HLS array of the base colors
+        formatter: ColorFormatter, or None for ColorArray rows
+
+    Returns:
+        List of rows, one per base color
+    """
+    out = []
+    out_hls = array("d")
+    keep_hls = formatter is None or formatter.needs_hls
+    count = len(hls) // 3
+    if kind == "hue":
+        shifts = params
+    else:
+        max_delta, offsets = params
+    for j in range(count):
+        h, l, s = hls[3 * j], hls[3 * j + 1], hls[3 * j + 2]
+        a = data[4 * j + 3]
+        # Same formulas as the single-color palette methods, so results are identical.
+        if kind == "hue":
+            values = [((h + shift) % 1.0, l, s) for shift in shifts]
+            if s == 0.0:
+                for _ in shifts:
+                    out += (l, l, l, a)
+            else:
+                m2 = l * (1.0 + s) if l <= 0.5 else l + s - (l * s)
+                m1 = 2.0 * l - m2
+                d = m2 - m1
+                for vh, _, _ in values:
+                    for t in _hue_ramps(vh):
+                        out.append(m2 if t is True else m1 if t is False else m1 + d * t * 6.0)
+                    out.append(a)
+        else:
+            if offsets is None:
+                values = [(h, l, s)]
+            else:
+                values = [(h, min(1, max(0, l - max_delta + offset)), s) for offset in offsets]
+            ramps = _hue_ramps(h)
+            for _, vl, _ in values:
+                if s == 0.0:
+                    out += (vl, vl, vl, a)
+                    continue
+                m2 = vl * (1.0 + s) if vl <= 0.5 else vl + s - (vl * s)
+                m1 = 2.0 * vl - m2
+                d = m2 - m1
+                for t in ramps:
+                    out.append(m2 if t is True else m1 if t is False else m1 + d * t * 6.0)
+                out.append(a)
+        if keep_hls:
+            for value in values:
+                out_hls.extend(value)
+
+    out = array("d", out)
+    n = len(out) // 4 // count if count else 0
+    if formatter is None:
+        return [ColorArray._from_data(out[4 * n * i:4 * n * (i + 1)], out_hls[3 * n * i:3 * n * (i + 1)])
+                for i in range(count)]
+    values = formatter.encode(out, out_hls if keep_hls else None)
+    return [formatter.finish(values[n * i:n * (i + 1)]) for i in range(count)]
+
+
+def _map_chunks(jobs, workers):
+    """Yield the rows of each job in order, keeping at most 2 jobs per worker in flight."""
+    if not workers or workers < 2:
+        for job in jobs:
+            yield _palette_chunk(*job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(_palette_chunk, *job))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _palettes(colors, kind, params, output, workers, chunk_size):
+    colors = ColorArray._from_any(colors)
+    data, hls = colors._data, colors._get_hls()
+    formatter = None if output is None else get_formatter(output)
+    jobs = (
+        (kind, params, data[4 * start:4 * (start + chunk_size)], hls[3 * start:3 * (start + chunk_size)], formatter)
+        for start in range(0, len(colors), chunk_size)
+    )
+    rows = []
+    for chunk in _map_chunks(jobs, workers):
+        rows.extend(chunk)
+    return rows
+
+
+def palette_hue_shifts_many(colors, shifts, output=None, workers=None, chunk_size=4096):
+    """Generate hue-shift palettes for many base colors (see Colorisator.palette_hue_shifts).
+
+    Args:
+        colors: ColorArray or iterable of base colors (Colorisator instances or any valid color formats)
+        shifts: Number of colors per palette (int) or list of hue shift amounts (list of floats)
+        output: Output format (ColorisatorFormat or string). Defaults to None (ColorArray rows).
+        workers: Number of worker processes. Defaults to None (current process only).
+        chunk_size: Number of base colors handled per job. Defaults to 4096.
+
+    Returns:
+        List with one palette per base color, each in the specified output format
+    """
+    if isinstance(shifts, int):
+        shifts = [i / shifts for i in range(shifts)]
+    return _palettes(colors, "hue", tuple(shifts), output, workers, chunk_size)
+
+
+def palette_monochromatic_many(colors, n=3, max_delta=0.1, output=None, workers=None, chunk_size=4096):
+    """Generate monochromatic palettes for many base colors (see Colorisator.palette_monochromatic).
+
+    Args:
+        colors: ColorArray or iterable of base colors (Colorisator instances or any valid color formats)
+        n: Number of colors per palette. Defaults to 3.
+        max_delta: Maximum lightness variation from each base color. Defaults to 0.1.
+        output: Output format (ColorisatorFormat or string). Defaults to None (ColorArray rows).
+        workers: Number of worker processes. Defaults to None (current process only).
+        chunk_size: Number of base colors handled per job. Defaults to 4096.
+
+    Returns:
+        List with one palette per base color, each in the specified output format
+    """
+    if n == 1:
+        params = (max_delta, None)
+    else:
+        step = 2 * max_delta / (n - 1)
+        params = (max_delta, tuple(i * step for i in range(n)))
+    return _palettes(colors, "lightness", params, output, workers, chunk_size)
+
+
+def palette_material_many(colors, n=5, max_delta=0.2, output=None, workers=None, chunk_size=4096):
+    """Generate Material Design-style palettes for many base colors (see Colorisator.palette_material).
+
+    Args:
+        colors: ColorArray or iterable of base colors (Colorisator instances or any valid color formats)
+        n: Number of shades per palette. Defaults to 5.
+        max_delta: Maximum lightness variation from each base color. Defaults to 0.2.
+        output: Output format (ColorisatorFormat or string). Defaults to None (ColorArray rows).
+        workers: Number of worker processes. Defaults to None (current process only).
+        chunk_size: Number of base colors handled per job. Defaults to 4096.
+
+    Returns:
+        List with one palette per base color, each in the specified output format
+    """
+    step_size = (2 * max_delta) / (n - 1) if n > 1 else 0
+    params = (max_delta, tuple(i * step_size for i in range(n)))
+    return _palettes(colors, "lightness", params, output, workers, chunk_size)
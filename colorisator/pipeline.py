@@ -0,0 +1,188 @@
+import colorsys
+from array import array
+from functools import partial
+
+from .colorisator import Colorisator
+from .color_array import ColorArray
+
+
+# Step functions are module-level and bound with functools.partial, so pipelines can be pickled.
+def _lighten(amount, h, l, s):
+    return h, min(1, l + amount), s
+
+
+def _darken(amount, h, l, s):
+    return h, max(0, l - amount), s
+
+
+def _saturate(amount, h, l, s):
+    return h, l, min(1, s + amount)
+
+
+def _desaturate(amount, h, l, s):
+    return h, l, max(0, s - amount)
+
+
+def _adjust_hue(amount, h, l, s):
+    return (h + amount) % 1.0, l, s
+
+
+def _grayscale(h, l, s):
+    return h, l, 0
+
+
+def _invert(r, g, b, a):
+    return 1 - r, 1 - g, 1 - b, a
+
+
+def _tint(amount, r, g, b, a):
+    return r + (1 - r) * amount, g + (1 - g) * amount, b + (1 - b) * amount, 1.0
+
+
+def _shade(amount, r, g, b, a):
+    return r * (1 - amount), g * (1 - amount), b * (1 - amount), 1.0
+
+
+class Pipeline:
+    def __init__(self, steps=()):
+        """Initialize a lazy chain of color operations.
+
+        Operations are recorded, not applied. When the pipeline runs, consecutive
+        HLS operations (lighten, darken, saturate, desaturate, adjust_hue,
+        grayscale, complement) share a single RGB -> HLS -> RGB round-trip.
+        Results are the same as chaining the Colorisator methods.
+
+        Prefer Colorisator.pipeline() to build one.
+
+        Args:
+            steps: Recorded steps as (kind, function) tuples, kind being "hls" or "rgb".
+                   Defaults to an empty pipeline.
+        """
+        self._steps = tuple(steps)
+        self._stages = None
+
+    def __repr__(self):
+        return f"Pipeline({len(self._steps)} steps)"
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __getstate__(self):
+        return self._steps
+
+    def __setstate__(self, steps):
+        self._steps = steps
+        self._stages = None
+
+    def _then(self, kind, func):
+        return Pipeline(self._steps + ((kind, func),))
+
+    def _compile(self):
+        """Merge consecutive HLS steps into a single stage."""
+        if self._stages is None:
+            stages = []
+            for kind, func in self._steps:
+                if kind == "hls" and stages and stages[-1][0] == "hls":
+                    stages[-1][1].append(func)
+                else:
+                    stages.append((kind, [func]))
+            self._stages = stages
+        return self._stages
+
+    def lighten(self, amount=0.1):
+        """Add a lighten step (see Colorisator.lighten)."""
+        return self._then("hls", partial(_lighten, amount))
+
+    def darken(self, amount=0.1):
+        """Add a darken step (see Colorisator.darken)."""
+        return self._then("hls", partial(_darken, amount))
+
+    def saturate(self, amount=0.1):
+        """Add a saturate step (see Colorisator.saturate)."""
+        return self._then("hls", partial(_saturate, amount))
+
+    def desaturate(self, amount=0.1):
+        """Add a desaturate step (see Colorisator.desaturate)."""
+        return self._then("hls", partial(_desaturate, amount))
+
+    def adjust_hue(self, amount):
+        """Add a hue shift step (see Colorisator.adjust_hue)."""
+        return self._then("hls", partial(_adjust_hue, amount))
+
+    def grayscale(self):
+        """Add a grayscale step (see Colorisator.grayscale)."""
+        return self._then("hls", _grayscale)
+
+    def complement(self):
+        """Add a complement step (see Colorisator.complement)."""
+        return self._then("hls", partial(_adjust_hue, 0.5))
+
+    def invert(self):
+        """Add an invert step (see Colorisator.invert)."""
+        return self._then("rgb", _invert)
+
+    def tint(self, amount=0.1):
+        """Add a tint step (see Colorisator.tint)."""
+        return self._then("rgb", partial(_tint, amount))
+
+    def shade(self, amount=0.1):
+        """Add a shade step (see Colorisator.shade)."""
+        return self._then("rgb", partial(_shade, amount))
+
+    def _run(self, r, g, b, a, hls):
+        rgb_to_hls, hls_to_rgb = colorsys.rgb_to_hls, colorsys.hls_to_rgb
+        for kind, funcs in self._compile():
+            if kind == "hls":
+                h, l, s = rgb_to_hls(r, g, b) if hls is None else hls
+                for func in funcs:
+                    h, l, s = func(h, l, s)
+                r, g, b = hls_to_rgb(h, l, s)
+                hls = (h, l, s)
+            else:
+                r, g, b, a = funcs[0](r, g, b, a)
+                hls = None
+        return r, g, b, a, hls
+
+    def apply(self, color, output=None):
+        """Run the pipeline on a single color.
+
+        Args:
+            color: Color to transform (Colorisator instance or any valid color format)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns Colorisator).
+
+        Returns:
+            Transformed color in the specified output format
+        """
+        color = Colorisator._from_any(color)
+        hls = None if color._h is None else (color._h, color._l, color._s)
+        r, g, b, a, hls = self._run(color.r, color.g, color.b, color.a, hls)
+        return Colorisator._format_output(Colorisator._from_normalized(r, g, b, a, hls), output)
+
+    def apply_many(self, colors, output=None):
+        """Run the pipeline on a batch of colors.
+
+        Args:
+            colors: ColorArray or iterable of colors (Colorisator instances or any valid color formats)
+            output: Output format (ColorisatorFormat or string). Defaults to None (returns ColorArray).
+
+        Returns:
+            Transformed colors in the specified output format
+        """
+        colors = ColorArray._from_any(colors)
+        src, src_hls = colors._data, colors._hls
+        run = self._run
+        data = array("d", bytes(len(src) * 8))
+        out_hls = array("d", bytes(len(src) // 4 * 3 * 8))
+        keep_hls = True
+        j = 0
+        for i in range(0, len(src), 4):
+            hls = None if src_hls is None else (src_hls[j], src_hls[j + 1], src_hls[j + 2])
+            data[i], data[i + 1], data[i + 2], data[i + 3], hls = run(src[i], src[i + 1], src[i + 2], src[i + 3], hls)
+            if hls is None:
+                keep_hls = False
+            elif keep_hls:
+                out_hls[j], out_hls[j + 1], out_hls[j + 2] = hls
+            j += 3
+        return ColorArray._from_data(data, out_hls if keep_hls else None)._format_output(output)
+
+    __call__ = apply
@@ -0,0 +1,188 @@
+import random
+from collections import Counter
+
+from .colorisator import Colorisator, _buffer_layout
+from .color_array import ColorArray
+
+
+def _pixel_view(pixels, layout):
+    """Return (8-bit memoryview, channel offsets, pixel size) for any supported pixel source."""
+    if isinstance(pixels, ColorArray):
+        pixels, layout = pixels.tobytes("rgb"), "rgb"
+    elif hasattr(pixels, "mode") and hasattr(pixels, "tobytes"):  # Pillow image
+        if pixels.mode != "RGB":
+            pixels = pixels.convert("RGB")
+        pixels, layout = pixels.tobytes(), "rgb"
+    offsets, size = _buffer_layout(layout)
+    view = memoryview(pixels).cast("B")
+    if len(view) % size:
+        raise ValueError(f"Buffer size must be a multiple of {size} bytes for layout {layout!r}")
+    return view, offsets, size
+
+
+def _histogram(pixels, layout, bits, max_samples):
+    """Count pixels per (r, g, b) bin of `bits` bits per channel.
+
+    Channels are extracted with strided memoryview slices and reduced with
+    bytes.translate, and Counter does the counting, so no Python code runs per pixel.
+    """
+    view, (ro, go, bo, _), size = _pixel_view(pixels, layout)
+    count = len(view) // size
+    step = max(1, -(-count // max_samples)) if max_samples else 1
+    shift = 8 - bits
+    table = bytes(i >> shift for i in range(256))
+    stride = size * step
+    r = view[ro::stride].tobytes().translate(table)
+    g = view[go::stride].tobytes().translate(table)
+    b = view[bo::stride].tobytes().translate(table)
+    half = (1 << shift) >> 1
+    return [
+        ((rb << shift | half) / 255, (gb << shift | half) / 255, (bb << shift | half) / 255, n)
+        for (rb, gb, bb), n in Counter(zip(r, g, b)).items()
+    ]
+
+
+def _mean(points):
+    total = sum(p[3] for p in points)
+    return (
+        sum(p[0] * p[3] for p in points) / total,
+        sum(p[1] * p[3] for p in points) / total,
+        sum(p[2] * p[3] for p in points) / total,
+        total,
+    )
+
+
+def _median_cut(points, n):
+    boxes = [points]
+    while len(boxes) < n:
+        # Split the box with the widest channel range, weighted by its population.
+        best = None
+        for i, box in enumerate(boxes):
+            if len(box) < 2:
+                continue
+            ranges = [max(p[c] for p in box) - min(p[c] for p in box) for c in range(3)]
+            channel = ranges.index(max(ranges))
+            score = ranges[channel] * sum(p[3] for p in box)
+            if best is None or score > best[0]:
+                best = (score, i, channel)
+        if best is None:
+            break
+        _, i, channel = best
+        box = sorted(boxes.pop(i), key=lambda p: p[channel])
+        half, seen = sum(p[3] for p in box) / 2, 0
+        for cut, p in enumerate(box[:-1], 1):
+            seen += p[3]
+            if seen >= half:
+                break
+        boxes += [box[:cut], box[cut:]]
+    return [_mean(box) for box in boxes]
+
+
+def _nearest(p, centers):
+    x, y, z = p[0], p[1], p[2]
+    best, best_d = 0, float("inf")
+    for i, (cx, cy, cz) in enumerate(centers):
+        d = (cx - x) * (cx - x) + (cy - y) * (cy - y) + (cz - z) * (cz - z)
+        if d < best_d:
+            best, best_d = i, d
+    return best, best_d
+
+
+# Maximum number of histogram bins clustered by k-means; each iteration costs bins * n distances.
+_KMEANS_MAX_BINS = 1024
+
+
+def _coarsen(points, max_bins):
+    """Merge histogram bins, one bit per channel at a time, until at most max_bins remain.
+
+    Merged bins keep the weighted mean color and the total count of their pixels.
+    """
+    shift = 0
+    while len(points) > max_bins:
+        shift += 1
+        bins = {}
+        for r, g, b, w in points:
+            key = (round(r * 255) >> shift, round(g * 255) >> shift, round(b * 255) >> shift)
+            acc = bins.get(key)
+            if acc is None:
+                bins[key] = [r * w, g * w, b * w, w]
+            else:
+                acc[0] += r * w
+                acc[1] += g * w
+                acc[2] += b * w
+                acc[3] += w
+        points = [(sr / w, sg / w, sb / w, w) for sr, sg, sb, w in bins.values()]
+    return points
+
+
+def _kmeans(points, n, iterations, seed):
+    points = _coarsen(points, _KMEANS_MAX_BINS)
+    rng = random.Random(seed)
+    weights = [p[3] for p in points]
+    # k-means++ seeding: pick each new center with probability weight * squared distance.
+    centers = [rng.choices(points, weights)[0][:3]]
+    while len(centers) < min(n, len(points)):
+        scores = [w * _nearest(p, centers)[1] for p, w in zip(points, weights)]
+        if not any(scores):
+            break
+        centers.append(rng.choices(points, scores)[0][:3])
+
+    for _ in range(iterations):
+        means = _assign(points, centers)
+        moved = [m[:3] if m else c for m, c in zip(means, centers)]
+        if moved == centers:
+            break
+        centers = moved
+    return [m for m in _assign(points, centers) if m]
+
+
+def _assign(points, centers):
+    """Return the weighted mean of the points closest to each center (None for empty clusters)."""
+    clusters = [[] for _ in centers]
+    for p in points:
+        clusters[_nearest(p, centers)[0]].append(p)
+    return [_mean(c) if c else None for c in clusters]
+
+
+def quantize(pixels, n=8, method="median_cut", layout="rgba", bits=5, max_samples=1_000_000,
+             iterations=20, seed=0, output=None):
+    """Extract the n dominant colors of an image.
+
+    Pixels are first counted in a histogram of 2**(3*bits) bins, after
+    optional downsampling, so the clustering cost does not depend on the
+    image size. k-means clusters at most 1024 bins: on varied images the
+    histogram is merged to fewer bits per channel first. Alpha is ignored.
+
+    Args:
+        pixels: Packed 8-bit pixel buffer (bytes, bytearray, memoryview, array.array...),
+                ColorArray, or Pillow image
+        n: Number of colors to extract. Defaults to 8.
+        method: "median_cut" or "kmeans" (k-means++ seeding). Defaults to "median_cut".
+        layout: Channel order of buffers: "rgb", "rgba", "argb" or "bgra". Defaults to "rgba".
+        bits: Histogram precision, in bits per channel (1 to 8). Defaults to 5.
+        max_samples: Maximum number of pixels read, evenly strided. None reads every pixel.
+                     Defaults to 1_000_000.
+        iterations: Maximum number of k-means iterations. Defaults to 20.
+        seed: Random seed of k-means++ seeding. Defaults to 0.
+        output: Output format (ColorisatorFormat or string). Defaults to None (returns list of Colorisator).
+
+    Raises:
+        ValueError: If method, bits or layout is invalid
+
+    Returns:
+        List of up to n colors, most frequent first, in the specified output format
+    """
+    if method not in ("median_cut", "kmeans"):
+        raise ValueError(f"Unsupported quantization method: {method!r}")
+    if not 1 <= bits <= 8:
+        raise ValueError("bits must be between 1 and 8")
+
+    points = _histogram(pixels, layout, bits, max_samples)
+    if not points:
+        return Colorisator._format_output([], output)
+    if method == "median_cut":
+        clusters = _median_cut(points, n)
+    else:
+        clusters = _kmeans(points, n, iterations, seed)
+    clusters.sort(key=lambda c: -c[3])
+    return Colorisator._format_output([Colorisator._from_normalized(r, g, b) for r, g, b, _ in clusters], output)
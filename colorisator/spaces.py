@@ -0,0 +1,271 @@
+import colorsys
+import math
+from array import array
+
+from .byte_kernels import _BYTE_VALUES
+
+
+def _srgb_to_linear(c):
+    if c <= 0.04045:
+        return c / 12.92
+    return ((c + 0.055) / 1.055) ** 2.4
+
+
+# Linear value of every 8-bit sRGB channel, and the exact float each one is looked up with.
+_LINEAR = tuple(_srgb_to_linear(c) for c in _BYTE_VALUES)
+
+
+def srgb_to_linear(c):
+    """Convert a gamma-encoded sRGB channel to linear light.
+
+    8-bit channel values (i / 255) are read from a precomputed table.
+    """
+    i = round(c * 255)
+    if 0 <= i <= 255 and _BYTE_VALUES[i] == c:
+        return _LINEAR[i]
+    return _srgb_to_linear(c)
+
+
+def linear_to_srgb(c):
+    """Convert a linear-light channel to gamma-encoded sRGB."""
+    if c <= 0.0031308:
+        return 12.92 * c
+    return 1.055 * c ** (1 / 2.4) - 0.055
+
+
+def _cbrt(x):
+    return math.copysign(abs(x) ** (1 / 3), x)
+
+
+def _clip(c):
+    return 0.0 if c < 0 else 1.0 if c > 1 else c
+
+
+def rgb_to_oklab(r, g, b):
+    """Convert sRGB to OKLab.
+
+    Returns:
+        Tuple of (L, a, b), L between 0.0 and 1.0
+    """
+    r, g, b = srgb_to_linear(r), srgb_to_linear(g), srgb_to_linear(b)
+    l_ = _cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+    m_ = _cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+    s_ = _cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def oklab_to_rgb(L, a, b):
+    """Convert OKLab to sRGB (not clipped: out-of-gamut colors fall outside 0.0-1.0)."""
+    l_ = L + 0.3963377774 * a + 0.2158037573 * b
+    m_ = L - 0.1055613458 * a - 0.0638541728 * b
+    s_ = L - 0.0894841775 * a - 1.2914855480 * b
+    l, m, s = l_ * l_ * l_, m_ * m_ * m_, s_ * s_ * s_
+    return (
+        linear_to_srgb(4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s),
+        linear_to_srgb(-1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s),
+        linear_to_srgb(-0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s),
+    )
+
+
+def oklab_to_oklch(L, a, b):
+    """Convert OKLab to OKLCH (hue in degrees, between 0 and 360)."""
+    return L, math.hypot(a, b), math.degrees(math.atan2(b, a)) % 360
+
+
+def oklch_to_oklab(L, C, h):
+    """Convert OKLCH (hue in degrees) to OKLab."""
+    h = math.radians(h)
+    return L, C * math.cos(h), C * math.sin(h)
+
+
+def rgb_to_oklch(r, g, b):
+    """Convert sRGB to OKLCH (hue in degrees, between 0 and 360)."""
+    return oklab_to_oklch(*rgb_to_oklab(r, g, b))
+
+
+def oklch_to_rgb(L, C, h):
+    """Convert OKLCH (hue in degrees) to sRGB (not clipped)."""
+    return oklab_to_rgb(*oklch_to_oklab(L, C, h))
+
+
+# D65 reference white.
+_XN, _YN, _ZN = 0.95047, 1.0, 1.08883
+_DELTA = 6 / 29
+
+
+def _lab_f(t):
+    if t > _DELTA ** 3:
+        return t ** (1 / 3)
+    return t / (3 * _DELTA * _DELTA) + 4 / 29
+
+
+def _lab_f_inv(t):
+    if t > _DELTA:
+        return t * t * t
+    return 3 * _DELTA * _DELTA * (t - 4 / 29)
+
+
+def rgb_to_lab(r, g, b):
+    """Convert sRGB to CIELAB (D65 white point).
+
+    Returns:
+        Tuple of (L, a, b), L between 0 and 100
+    """
+    r, g, b = srgb_to_linear(r), srgb_to_linear(g), srgb_to_linear(b)
+    fx = _lab_f((0.4124564 * r + 0.3575761 * g + 0.1804375 * b) / _XN)
+    fy = _lab_f((0.2126729 * r + 0.7151522 * g + 0.0721750 * b) / _YN)
+    fz = _lab_f((0.0193339 * r + 0.1191920 * g + 0.9503041 * b) / _ZN)
+    return 116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)
+
+
+def lab_to_rgb(L, a, b):
+    """Convert CIELAB (D65 white point) to sRGB (not clipped)."""
+    fy = (L + 16) / 116
+    x = _XN * _lab_f_inv(fy + a / 500)
+    y = _YN * _lab_f_inv(fy)
+    z = _ZN * _lab_f_inv(fy - b / 200)
+    return (
+        linear_to_srgb(3.2404542 * x - 1.5371385 * y - 0.4985314 * z),
+        linear_to_srgb(-0.9692660 * x + 1.8760108 * y + 0.0415560 * z),
+        linear_to_srgb(0.0556434 * x - 0.2040259 * y + 1.0572252 * z),
+    )
+
+
+def _rgb_to_hls(r, g, b):
+    # colorsys is looked up at call time, so the instrumentation stand-in is used when enabled.
+    return colorsys.rgb_to_hls(r, g, b)
+
+
+def _hls_to_rgb(h, l, s):
+    return colorsys.hls_to_rgb(h % 1.0, l, s)
+
+
+# Interpolation spaces: name -> (from sRGB, to sRGB, hue as (index, period, chroma index) or None).
+_SPACES = {
+    "rgb": (None, None, None),
+    "hls": (_rgb_to_hls, _hls_to_rgb, (0, 1.0, 2)),
+    "oklab": (rgb_to_oklab, oklab_to_rgb, None),
+    "oklch": (rgb_to_oklch, oklch_to_rgb, (2, 360.0, 1)),
+    "lab": (rgb_to_lab, lab_to_rgb, None),
+}
+
+
+def get_space(space):
+    """Get the conversions of a color space.
+
+    Args:
+        space: "rgb", "hls", "oklab", "oklch" or "lab"
+
+    Raises:
+        ValueError: If the space is unknown
+
+    Returns:
+        Tuple (from sRGB, to sRGB, hue) where the conversions are None for "rgb",
+        and hue is (index, period, chroma index) for cylindrical spaces, else None
+    """
+    try:
+        return _SPACES[space.lower()]
+    except (KeyError, AttributeError):
+        raise ValueError(f"Unsupported color space: {space!r}") from None
+
+
+def _unwrap_hues(channels, hue):
+    """Shift hues by whole turns so consecutive stops take the shortest way around the wheel.
+
+    Args:
+        channels: List of per-stop channel lists, modified in place
+        hue: (index, period, chroma index) of the space
+    """
+    index, period, chroma = hue
+    # Achromatic stops have no meaningful hue: borrow the closest previous (or first) chromatic one.
+    hues = [c[index] for c in channels if c[chroma] > 1e-9]
+    if hues:
+        current = hues[0]
+        for c in channels:
+            if c[chroma] > 1e-9:
+                current = c[index]
+            else:
+                c[index] = current
+    half = period / 2
+    for previous, c in zip(channels, channels[1:]):
+        c[index] = previous[index] + ((c[index] - previous[index] + half) % period - half)
+    return channels
+
+
+def interpolate(colors, ts, space="rgb"):
+    """Yield (r, g, b, a) tuples interpolated between pairs of colors, in a color space.
+
+    Args:
+        colors: Sequence of objects with r, g, b, a attributes (Colorisator instances)
+        ts: Iterable of (segment index, t) pairs, t between 0.0 and 1.0 within the segment
+        space: Interpolation space (see get_space). Defaults to "rgb".
+
+    Yields:
+        Interpolated (r, g, b, a), clipped between 0.0 and 1.0 outside of "rgb"
+    """
+    to_space, from_space, hue = get_space(space)
+    if to_space is None:
+        for i, t in ts:
+            start, end = colors[i], colors[i + 1]
+            yield (
+                start.r + (end.r - start.r) * t,
+                start.g + (end.g - start.g) * t,
+                start.b + (end.b - start.b) * t,
+                start.a + (end.a - start.a) * t,
+            )
+        return
+
+    channels = [[*to_space(c.r, c.g, c.b), c.a] for c in colors]
+    if hue is not None:
+        _unwrap_hues(channels, hue)
+    for i, t in ts:
+        x0, y0, z0, a0 = channels[i]
+        x1, y1, z1, a1 = channels[i + 1]
+        r, g, b = from_space(x0 + (x1 - x0) * t, y0 + (y1 - y0) * t, z0 + (z1 - z0) * t)
+        yield _clip(r), _clip(g), _clip(b), a0 + (a1 - a0) * t
+
+
+def to_space_array(data, space):
+    """Convert a flat RGBA array to a flat array of 3 channels per color in a color space.
+
+    Args:
+        data: Flat sequence of RGBA floats (4 per color)
+        space: "hls", "oklab", "oklch" or "lab"
+
+    Returns:
+        array.array of floats (3 per color)
+    """
+    to_space = get_space(space)[0]
+    out = array("d", bytes(8 * 3 * (len(data) // 4)))
+    j = 0
+    for i in range(0, len(data), 4):
+        out[j], out[j + 1], out[j + 2] = to_space(data[i], data[i + 1], data[i + 2])
+        j += 3
+    return out
+
+
+def from_space_array(channels, space, alpha=None):
+    """Convert a flat array of 3 channels per color in a color space back to flat RGBA.
+
+    Args:
+        channels: Flat sequence of floats (3 per color)
+        space: "hls", "oklab", "oklch" or "lab"
+        alpha: Optional sequence of alpha values, one per color. Defaults to None (opaque).
+
+    Returns:
+        array.array of RGBA floats (4 per color), clipped between 0.0 and 1.0
+    """
+    from_space = get_space(space)[1]
+    n = len(channels) // 3
+    out = array("d", bytes(8 * 4 * n))
+    i = 0
+    for j in range(0, len(channels), 3):
+        r, g, b = from_space(channels[j], channels[j + 1], channels[j + 2])
+        out[i], out[i + 1], out[i + 2] = _clip(r), _clip(g), _clip(b)
+        out[i + 3] = 1.0 if alpha is None else alpha[j // 3]
+        i += 4
+    return out
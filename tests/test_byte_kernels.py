@@ -0,0 +1,87 @@
+"""Tests for the 8-bit integer kernels."""
+
+import random
+
+import pytest
+
+from colorisator import Colorisator
+from colorisator import byte_kernels
+
+
+RNG = random.Random(11)
+FORMATS = ["hex", "hexalpha", "web", "rgb255", "processing"]
+
+
+def random_hex():
+    return f"#{RNG.randrange(1 << 32):08X}"
+
+
+@pytest.fixture
+def float_path(monkeypatch):
+    """Run a call with the integer kernels disabled."""
+    def run(func, *args, **kwargs):
+        with monkeypatch.context() as m:
+            m.setattr(Colorisator, "_byte_path", staticmethod(lambda colors, output: None))
+            return func(*args, **kwargs)
+    return run
+
+
+class TestKernels:
+    """Test kernels against the float formulas."""
+
+    def test_exact_bytes(self):
+        """Test detection of 8-bit channels."""
+        assert byte_kernels.exact_bytes(1.0, 0.0, 51 / 255, 1.0) == (255, 0, 51, 255)
+        assert byte_kernels.exact_bytes(0.5, 0.0, 0.0, 1.0) is None
+        assert byte_kernels.exact_bytes(-1 / 255, 0.0, 0.0, 1.0) is None
+        assert byte_kernels.exact_bytes(2.0, 0.0, 0.0, 1.0) is None
+
+    def test_ramp_ties(self):
+        """Test that exact ties round like the float path."""
+        for s, e, count in [(0, 1, 2), (0, 3, 2), (10, 13, 4), (255, 0, 10), (0, 255, 510)]:
+            fs, fd = s / 255, e / 255 - s / 255
+            expected = [round((fs + fd * (j / count)) * 255) for j in range(count + 1)]
+            assert byte_kernels._ramp(s, e, count, count + 1) == expected
+
+    def test_ramp_random(self):
+        """Test random ramps against the float formula."""
+        for _ in range(300):
+            s, e, count = RNG.randrange(256), RNG.randrange(256), RNG.randrange(1, 600)
+            fs, fd = s / 255, e / 255 - s / 255
+            expected = [round((fs + fd * (j / count)) * 255) for j in range(count + 1)]
+            assert byte_kernels._ramp(s, e, count, count + 1) == expected
+
+
+class TestIntegerPaths:
+    """Test that Colorisator methods give the same output with and without the kernels."""
+
+    @pytest.mark.parametrize("output", FORMATS)
+    def test_gradient(self, float_path, output):
+        """Test two-color gradients."""
+        for _ in range(20):
+            start, end, steps = random_hex(), random_hex(), RNG.randrange(2, 200)
+            expected = float_path(Colorisator.gradient, start, end, steps, output=output)
+            assert Colorisator.gradient(start, end, steps, output=output) == expected
+
+    @pytest.mark.parametrize("output", FORMATS)
+    def test_gradient_stops(self, float_path, output):
+        """Test multi-stop gradients."""
+        for _ in range(20):
+            stops = [random_hex() for _ in range(RNG.randrange(2, 6))]
+            steps = RNG.randrange(2 * len(stops), 200)
+            expected = float_path(Colorisator.gradient_stops, stops, steps=steps, output=output)
+            assert Colorisator.gradient_stops(stops, steps=steps, output=output) == expected
+
+    @pytest.mark.parametrize("output", FORMATS)
+    def test_tint_shade_mix(self, float_path, output):
+        """Test tint, shade and mix, including amounts outside 0.0-1.0."""
+        for _ in range(50):
+            a, b, amount = random_hex(), random_hex(), RNG.uniform(-0.5, 1.5)
+            assert Colorisator.tint(a, amount, output=output) == float_path(Colorisator.tint, a, amount, output=output)
+            assert Colorisator.shade(a, amount, output=output) == float_path(Colorisator.shade, a, amount, output=output)
+            assert Colorisator.mix(a, b, amount, output=output) == float_path(Colorisator.mix, a, b, amount, output=output)
+
+    def test_non_byte_inputs(self):
+        """Test that colors that are not 8-bit still take the float path."""
+        assert Colorisator.gradient((0.5, 0.5, 0.5), "#FFFFFF", 3, output="hex") == ["#808080", "#BFBFBF", "#FFFFFF"]
+        assert Colorisator.tint((0.5, 0.5, 0.5), 0.5, output="rgb255") == (191, 191, 191)
@@ -0,0 +1,178 @@
+"""Tests for the command-line converter."""
+
+import io
+import json
+
+import pytest
+
+from colorisator import ColorArray, Colorisator, ColorisatorFormat, palette_material_many, write_colors
+from colorisator.cli import main
+
+
+COLORS = ["#FF0000", "#00FF00", "#336699", "#12345678"]
+
+
+def written(output):
+    stream = io.StringIO()
+    write_colors(stream, ColorArray(COLORS), output)
+    return stream.getvalue()
+
+
+def run(argv, capsys, stdin=None, monkeypatch=None):
+    if stdin is not None:
+        monkeypatch.setattr("sys.stdin", io.StringIO(stdin))
+    status = main(argv)
+    out, err = capsys.readouterr()
+    return status, out, err
+
+
+class TestInput:
+    """Test the supported input formats."""
+
+    def test_lines_from_stdin(self, capsys, monkeypatch):
+        """Test one color per line read from stdin, blank lines ignored."""
+        status, out, _ = run(["-t", "rgb255"], capsys, "#FF0000\n\n  #336699  \n", monkeypatch)
+        assert status == 0
+        assert out == "(255, 0, 0)\n(51, 102, 153)\n"
+
+    def test_files(self, tmp_path, capsys):
+        """Test several input files processed in order."""
+        first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+        first.write_text("#FF0000\n")
+        second.write_text("#00FF00\n#0000FF\n")
+        status, out, _ = run([str(first), str(second)], capsys)
+        assert status == 0
+        assert out == "#FF0000\n#00FF00\n#0000FF\n"
+
+    def test_jsonl(self, capsys, monkeypatch):
+        """Test JSON lines holding objects, arrays and strings."""
+        lines = [{"color": "#FF0000"}, [0, 255, 0], "#00F", {"hex": "#FFFFFF", "color": "#000000"}]
+        stdin = "\n".join(json.dumps(line) for line in lines) + "\n"
+        status, out, _ = run(["-f", "jsonl"], capsys, stdin, monkeypatch)
+        assert status == 0
+        assert out == "#FF0000\n#00FF00\n#0000FF\n#000000\n"
+
+    def test_jsonl_field(self, capsys, monkeypatch):
+        """Test the JSON object key selected with --field."""
+        stdin = '{"hex": "#FFFFFF", "color": "#000000"}\n'
+        _, out, _ = run(["-f", "jsonl", "--field", "hex"], capsys, stdin, monkeypatch)
+        assert out == "#FFFFFF\n"
+
+    def test_csv(self, tmp_path, capsys):
+        """Test CSV columns selected by index (no header) or by header name."""
+        plain = tmp_path / "plain.csv"
+        plain.write_text("red,#FF0000\nblue,#0000FF\n")
+        _, out, _ = run([str(plain), "-f", "csv", "--field", "1"], capsys)
+        assert out == "#FF0000\n#0000FF\n"
+
+        named = tmp_path / "named.csv"
+        named.write_text("name,hex\nred,#FF0000\nblue,#0000FF\n")
+        _, out, _ = run([str(named), "-f", "csv", "--field", "hex"], capsys)
+        assert out == "#FF0000\n#0000FF\n"
+
+    def test_csv_missing_column(self, tmp_path, capsys):
+        """Test that a --field name missing from the CSV header is reported without a traceback."""
+        named = tmp_path / "named.csv"
+        named.write_text("name,hex\nred,#FF0000\n")
+        status, _, err = run([str(named), "-f", "csv", "--field", "color"], capsys)
+        assert status == 2
+        assert err == f"colorisator: {named}: no column 'color' in the CSV header\n"
+
+    def test_unreadable_files(self, tmp_path, capsys):
+        """Test that missing inputs and unwritable outputs are reported without a traceback."""
+        missing = tmp_path / "missing.txt"
+        status, _, err = run([str(missing)], capsys)
+        assert status == 2
+        assert err == f"colorisator: {missing}: No such file or directory\n"
+
+        colors = tmp_path / "colors.txt"
+        colors.write_text("#FF0000\n")
+        out = tmp_path / "nope" / "out.txt"
+        status, _, err = run([str(colors), "-o", str(out)], capsys)
+        assert status == 2
+        assert err == f"colorisator: {out}: No such file or directory\n"
+
+
+class TestConversion:
+    """Test operations, output formats and expansions."""
+
+    def test_operations_in_order(self, capsys, monkeypatch):
+        """Test that operations are applied in command-line order."""
+        stdin = "\n".join(COLORS) + "\n"
+        _, out, _ = run(["--lighten", "0.1", "--invert", "--shade", "0.2"], capsys, stdin, monkeypatch)
+        expected = [Colorisator(c).lighten(0.1).invert().shade(0.2).get_hex() for c in COLORS]
+        assert out.splitlines() == expected
+
+    @pytest.mark.parametrize("output", [f for f in ColorisatorFormat if f.value not in ("unity", "processing")])
+    def test_line_formats(self, output, capsys, monkeypatch):
+        """Test one line per color for every value format, as written by write_colors."""
+        _, out, _ = run(["-t", output.value, "--chunk-size", "3"], capsys, "\n".join(COLORS) + "\n", monkeypatch)
+        assert out == written(output)
+
+    @pytest.mark.parametrize("output", ["unity", "processing"])
+    def test_declaration_formats(self, output, capsys, monkeypatch):
+        """Test that declaration formats wrap every color in a single declaration."""
+        _, out, _ = run(["-t", output, "--chunk-size", "1"], capsys, "\n".join(COLORS) + "\n", monkeypatch)
+        assert out == written(output) + "\n"
+
+    def test_palette(self, capsys, monkeypatch):
+        """Test one palette line per input color."""
+        _, out, _ = run(["--palette", "material", "-n", "3"], capsys, "\n".join(COLORS) + "\n", monkeypatch)
+        expected = [" ".join(row) for row in palette_material_many(COLORS, 3, output="hex")]
+        assert out.splitlines() == expected
+
+    def test_named_palette(self, capsys, monkeypatch):
+        """Test palettes with fixed hue shifts."""
+        _, out, _ = run(["--palette", "triadic"], capsys, "#FF0000\n", monkeypatch)
+        assert out.split() == Colorisator("#FF0000").palette_triadic(output="hex")
+
+    def test_gradient(self, capsys, monkeypatch):
+        """Test one gradient line per input color."""
+        _, out, _ = run(["--gradient", "#FFFFFF", "4", "--space", "oklab"], capsys, "#FF0000\n", monkeypatch)
+        assert out.split() == Colorisator.gradient("#FF0000", "#FFFFFF", 4, output="hex", space="oklab")
+
+    def test_workers(self, capsys, monkeypatch):
+        """Test that worker processes give the same output, in input order."""
+        stdin = "\n".join(COLORS * 5) + "\n"
+        argv = ["--palette", "hue_shifts", "-n", "3", "--chunk-size", "3"]
+        _, expected, _ = run(argv, capsys, stdin, monkeypatch)
+        _, out, _ = run(argv + ["--workers", "2"], capsys, stdin, monkeypatch)
+        assert out == expected
+
+    def test_output_file(self, tmp_path, capsys, monkeypatch):
+        """Test writing results to a file."""
+        target = tmp_path / "out.txt"
+        status, out, _ = run(["-o", str(target)], capsys, "#FF0000\n", monkeypatch)
+        assert status == 0
+        assert out == ""
+        assert target.read_text() == "#FF0000\n"
+
+
+class TestErrors:
+    """Test invalid input and arguments."""
+
+    def test_invalid_color(self, capsys, monkeypatch):
+        """Test that an invalid color stops the conversion with its location."""
+        status, _, err = run([], capsys, "#FF0000\nnope\n", monkeypatch)
+        assert status == 1
+        assert "<stdin>:2: invalid color 'nope'" in err
+
+    def test_skip_invalid(self, capsys, monkeypatch):
+        """Test that --skip-invalid drops invalid colors."""
+        status, out, _ = run(["--skip-invalid"], capsys, "#FF0000\nnope\n(1, 2)\n#0000FF\n", monkeypatch)
+        assert status == 0
+        assert out == "#FF0000\n#0000FF\n"
+
+    @pytest.mark.parametrize("argv", [
+        ["-t", "nope"],
+        ["--chunk-size", "0"],
+        ["--gradient", "nope", "3"],
+        ["--gradient", "#FFFFFF", "1"],
+        ["--gradient", "#FFFFFF", "3", "--space", "nope"],
+        ["--palette", "material", "--gradient", "#FFFFFF", "3"],
+    ])
+    def test_invalid_arguments(self, argv, capsys):
+        """Test that invalid arguments exit with a usage error."""
+        with pytest.raises(SystemExit) as exc:
+            main(argv)
+        assert exc.value.code == 2
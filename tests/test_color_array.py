@@ -0,0 +1,145 @@
+"""Tests for the ColorArray class."""
+
+from array import array
+
+import pytest
+
+from colorisator import Colorisator, ColorisatorFormat, ColorArray
+
+
+COLORS = ["#FF0000", "#3543CA", "#808080", "#00FF0080", "#FFE8E0", "#000000"]
+
+
+class TestColorArrayInit:
+    """Test ColorArray initialization and access."""
+
+    def test_init_from_list(self):
+        """Test initialization from a list of hex strings."""
+        colors = ColorArray(COLORS)
+        assert len(colors) == len(COLORS)
+        assert colors[1] == Colorisator("#3543CA")
+
+    def test_init_from_colorisators(self):
+        """Test initialization from Colorisator instances."""
+        colors = ColorArray([Colorisator("#FF0000", alpha=0.5)])
+        assert colors[0].a == 0.5
+
+    def test_slice(self):
+        """Test slicing returns a ColorArray."""
+        colors = ColorArray(COLORS)[1:3]
+        assert isinstance(colors, ColorArray)
+        assert colors.get_hex() == ["#3543CA", "#808080"]
+
+    def test_index_out_of_range(self):
+        """Test out of range indexing."""
+        with pytest.raises(IndexError):
+            ColorArray(COLORS)[len(COLORS)]
+
+
+class TestColorArrayOperations:
+    """Test batch operations match the scalar Colorisator results."""
+
+    @pytest.mark.parametrize("method, args", [
+        ("lighten", (0.2,)),
+        ("darken", (0.2,)),
+        ("saturate", (0.3,)),
+        ("desaturate", (0.3,)),
+        ("adjust_hue", (0.25,)),
+        ("grayscale", ()),
+        ("complement", ()),
+        ("invert", ()),
+        ("tint", (0.3,)),
+        ("shade", (0.3,)),
+    ])
+    def test_matches_scalar(self, method, args):
+        """Test every operation against the scalar implementation."""
+        batch = getattr(ColorArray(COLORS), method)(*args)
+        for color, result in zip(COLORS, batch):
+            expected = getattr(Colorisator(color), method)(*args)
+            assert result == expected
+            assert result.get_hsl() == expected.get_hsl()
+
+    def test_lerp(self):
+        """Test interpolation towards a single color."""
+        batch = ColorArray(COLORS)._lerp("#0000FF", 0.3)
+        for color, result in zip(COLORS, batch):
+            assert result == Colorisator(color)._lerp("#0000FF", 0.3)
+
+    def test_lerp_length_mismatch(self):
+        """Test interpolation between arrays of different lengths."""
+        with pytest.raises(ValueError):
+            ColorArray(COLORS)._lerp(ColorArray(COLORS[:2]), 0.5)
+
+
+class TestColorArrayOutputFormats:
+    """Test bulk output formats."""
+
+    @pytest.mark.parametrize("output", list(ColorisatorFormat))
+    def test_matches_scalar(self, output):
+        """Test every output format against Colorisator._format_output."""
+        batch = ColorArray(COLORS).lighten(0.1, output=output)
+        expected = Colorisator._format_output([Colorisator(c).lighten(0.1) for c in COLORS], output)
+        assert batch == expected
+
+    def test_output_as_string(self):
+        """Test output format given as a string."""
+        assert ColorArray(["#F00"]).invert(output="hex") == ["#00FFFF"]
+
+
+class TestColorArrayBuffers:
+    """Test packed 8-bit buffer import and export."""
+
+    PIXELS = bytes([255, 0, 0, 255, 53, 67, 202, 128])
+
+    @pytest.mark.parametrize("make", [bytes, bytearray, lambda b: memoryview(b), lambda b: array("B", b)])
+    def test_frombuffer_types(self, make):
+        """Test construction from every buffer-protocol type."""
+        colors = ColorArray.frombuffer(make(self.PIXELS))
+        assert colors.get_hex_alpha() == ["#FF0000FF", "#3543CA80"]
+
+    @pytest.mark.parametrize("layout", ["rgb", "rgba", "argb", "bgra"])
+    def test_roundtrip(self, layout):
+        """Test that tobytes reverses frombuffer for every layout."""
+        raw = bytes(range(24))
+        assert ColorArray.frombuffer(raw, layout).tobytes(layout) == raw
+
+    def test_layouts(self):
+        """Test channel order of the different layouts."""
+        colors = ColorArray(["#3543CA80"])
+        assert colors.tobytes("rgb") == bytes([53, 67, 202])
+        assert colors.tobytes("argb") == bytes([128, 53, 67, 202])
+        assert colors.tobytes("bgra") == bytes([202, 67, 53, 128])
+
+    def test_rgb_alpha(self):
+        """Test alpha used for layouts without an alpha channel."""
+        colors = ColorArray.frombuffer(bytes([255, 0, 0]), "rgb", alpha=0.5)
+        assert colors[0].a == 0.5
+
+    def test_into(self):
+        """Test writing results back in place."""
+        buffer = bytearray(self.PIXELS)
+        ColorArray.frombuffer(buffer).invert().into(buffer)
+        assert buffer == bytearray([0, 255, 255, 255, 202, 188, 53, 128])
+
+    def test_into_offset_and_size(self):
+        """Test writing at a pixel offset and buffer size check."""
+        buffer = bytearray(8)
+        ColorArray(["#FF0000"]).into(buffer, offset=1)
+        assert buffer == bytearray([0, 0, 0, 0, 255, 0, 0, 255])
+        with pytest.raises(ValueError):
+            ColorArray(["#FF0000"]).into(buffer, offset=2)
+
+    def test_invalid_buffer(self):
+        """Test unknown layouts and truncated buffers."""
+        with pytest.raises(ValueError):
+            ColorArray.frombuffer(self.PIXELS, "cmyk")
+        with pytest.raises(ValueError):
+            ColorArray.frombuffer(self.PIXELS[:7])
+
+    def test_colorisator_from_buffer(self):
+        """Test reading a single pixel into a Colorisator."""
+        color = Colorisator.from_buffer(self.PIXELS, index=1)
+        assert color.get_hex_alpha() == "#3543CA80"
+        assert color.tobytes("bgra") == bytes([202, 67, 53, 128])
+        with pytest.raises(IndexError):
+            Colorisator.from_buffer(self.PIXELS, index=2)
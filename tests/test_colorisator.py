@@ -1,5 +1,9 @@
 """Tests for the Colorisator class."""
 
+import threading
+
+import pytest
+
 from colorisator import Colorisator, ColorisatorFormat
 
 
@@ -43,6 +47,103 @@ class TestColorisatorInit:
         color = Colorisator("#FF0000", alpha=0.5)
         assert color.a == 0.5
 
+    def test_no_instance_dict(self):
+        """Test that instances use __slots__."""
+        color = Colorisator("#FF0000")
+        assert not hasattr(color, "__dict__")
+
+    def test_lazy_hls(self):
+        """Test that HLS values are computed on first access."""
+        color = Colorisator("#808080")
+        assert color._h is None
+        assert color.get_hsl() == (0.0, 0.0, color.l)
+        assert color._h is not None
+
+    def test_set_single_hls_component(self):
+        """Test that setting one HLS component keeps the others."""
+        color = Colorisator("#FF0000")
+        color.l = 0.25
+        assert (color.h, color.l, color.s) == (0.0, 0.25, 1.0)
+
+
+class TestColorisatorParseCache:
+    """Test the opt-in hex string parse cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        Colorisator.enable_parse_cache(maxsize=2)
+        yield
+        Colorisator.disable_parse_cache()
+
+    def test_disabled_by_default(self):
+        """Test that no cache info is reported when disabled."""
+        Colorisator.disable_parse_cache()
+        assert Colorisator.parse_cache_info() is None
+        assert Colorisator("#FF0000").get_hex() == "#FF0000"
+
+    def test_hits_and_misses(self):
+        """Test that equivalent hex strings share a cache entry."""
+        Colorisator("#ff0000")
+        color = Colorisator(" #FF0000 ")
+        info = Colorisator.parse_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert color.get_hex() == "#FF0000"
+
+    def test_alpha_is_part_of_key(self):
+        """Test that the alpha argument is part of the cache key."""
+        Colorisator("#FF0000")
+        color = Colorisator("#FF0000", alpha=0.5)
+        assert color.a == 0.5
+        assert Colorisator.parse_cache_info().misses == 2
+
+    def test_evictions(self):
+        """Test least recently used eviction."""
+        for value in ("#F00", "#0F0", "#F00", "#00F"):
+            Colorisator(value)
+        info = Colorisator.parse_cache_info()
+        assert (info.evictions, info.currsize) == (1, 2)
+        Colorisator("#F00")
+        assert Colorisator.parse_cache_info().hits == 2
+
+    def test_resize_and_clear(self):
+        """Test runtime resize and clear."""
+        Colorisator("#F00")
+        Colorisator("#0F0")
+        Colorisator.enable_parse_cache(maxsize=1)
+        info = Colorisator.parse_cache_info()
+        assert (info.maxsize, info.currsize, info.evictions) == (1, 1, 1)
+        Colorisator.clear_parse_cache()
+        assert Colorisator.parse_cache_info() == (0, 0, 0, 1, 0)
+
+    def test_invalid_maxsize(self):
+        """Test that maxsize must be positive."""
+        with pytest.raises(ValueError):
+            Colorisator.enable_parse_cache(maxsize=0)
+
+    def test_invalid_hex(self):
+        """Test that invalid hex digits are rejected and not cached."""
+        with pytest.raises(ValueError):
+            Colorisator("#GG0000")
+        assert Colorisator.parse_cache_info().currsize == 0
+
+    def test_threads(self):
+        """Test concurrent construction through the cache."""
+        Colorisator.enable_parse_cache(maxsize=16)
+        values = [f"#{i:02X}{i:02X}{i:02X}" for i in range(32)]
+
+        def work():
+            for value in values * 10:
+                assert Colorisator(value).get_hex() == value
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        info = Colorisator.parse_cache_info()
+        assert info.hits + info.misses == 4 * 320
+        assert info.currsize == 16
+
 
 class TestColorisatorGetters:
     """Test color output methods."""
@@ -128,6 +229,24 @@ class TestColorisatorOperations:
         inverted = color.invert()
         assert inverted.get_hex() == "#00FFFF"
 
+    def test_mix(self):
+        """Test mixing two colors."""
+        color = Colorisator("#FF0000").mix("#0000FF")
+        assert color.get_hex() == "#800080"
+        assert Colorisator.mix("#FF000000", "#0000FF", 0.25, output="hexalpha") == "#BF004040"
+        assert Colorisator.mix((0.5, 0.5, 0.5), "#000000", 0, output="hex") == "#808080"
+
+    def test_derived_color_not_reinterpreted(self):
+        """Test that derived channels slightly above 1.0 stay normalized."""
+        color = Colorisator("#FFFFFF")._lerp("#000000", -0.001)
+        assert color.r > 1
+        assert color.get_hex() == "#FFFFFF"
+
+    def test_derived_color_keeps_hls(self):
+        """Test that HLS-derived colors carry their HLS values."""
+        color = Colorisator("#FF0000").lighten(0.1)
+        assert (color.h, color.l, color.s) == (0.0, 0.6, 1.0)
+
 
 class TestColorisatorComparison:
     """Test color comparison operations."""
@@ -156,6 +275,15 @@ class TestColorisatorComparison:
         assert color != "#FF0000"
         assert not (color == "#FF0000")
 
+    def test_hash_consistent_with_equality(self):
+        """Test that equal colors hash alike and work as set members and dict keys."""
+        color1 = Colorisator("#FF0000")
+        color2 = Colorisator((1.0, 0.00001, 0.0))
+        assert color1 == color2
+        assert hash(color1) == hash(color2)
+        assert len({color1, color2, Colorisator("#00FF00")}) == 2
+        assert {color1: "red"}[color2] == "red"
+
 
 class TestColorisatorPalettes:
     """Test palette generation methods."""
@@ -192,6 +320,32 @@ class TestColorisatorPalettes:
         assert len(palette) == 5
 
 
+class TestColorisatorFastPaths:
+    """Test that formatted outputs match formatting the Colorisator results."""
+
+    @pytest.mark.parametrize("output", list(ColorisatorFormat))
+    @pytest.mark.parametrize("method, args", [
+        ("palette_hue_shifts", (5,)),
+        ("palette_split_complementary", ()),
+        ("palette_monochromatic", (4, 0.2)),
+        ("palette_material", (9, 0.3)),
+    ])
+    def test_palettes(self, method, args, output):
+        """Test palette generators with every output format."""
+        color = Colorisator("#3543CA80")
+        expected = Colorisator._format_output(getattr(color, method)(*args), output)
+        assert getattr(color, method)(*args, output=output) == expected
+
+    @pytest.mark.parametrize("output", list(ColorisatorFormat))
+    def test_gradients(self, output):
+        """Test gradients with every output format."""
+        stops = ["#000091", "#FFF", "#E1000F80"]
+        expected = Colorisator._format_output(Colorisator.gradient("#000091", "#E1000F80", 7), output)
+        assert Colorisator.gradient("#000091", "#E1000F80", 7, output=output) == expected
+        expected = Colorisator._format_output(Colorisator.gradient_stops(stops, steps=8), output)
+        assert Colorisator.gradient_stops(stops, steps=8, output=output) == expected
+
+
 class TestColorisatorGradient:
     """Test gradient generation methods."""
 
@@ -217,6 +371,41 @@ class TestColorisatorGradient:
         gradient = Colorisator.gradient_stops(colors, steps=7)
         assert len(gradient) == 7
 
+    @pytest.mark.parametrize("space", ["rgb", "oklab"])
+    def test_gradient_stops_empty_segment(self, space):
+        """Test fewer steps than stops, where a middle segment has no step of its own."""
+        colors = ["#F00", "#0F0", "#00F", "#FFF"]
+        hexes = Colorisator.gradient_stops(colors, steps=3, output="hex", space=space)
+        assert [c.get_hex() for c in Colorisator.gradient_stops(colors, steps=3, space=space)] == hexes
+        assert len(hexes) == 3
+
+    @pytest.mark.parametrize("output", [None] + list(ColorisatorFormat))
+    def test_iter_gradient_matches_list(self, output):
+        """Test that iter_gradient yields the same values as gradient."""
+        expected = Colorisator.gradient("#FF000080", "#0000FF", steps=9, output=output)
+        result = Colorisator.iter_gradient("#FF000080", "#0000FF", steps=9, output=output)
+        if isinstance(expected, str):
+            assert "".join(result) == expected
+        else:
+            assert list(result) == expected
+
+    @pytest.mark.parametrize("steps", [4, 5, 7, 10, 11])
+    @pytest.mark.parametrize("output", [None] + list(ColorisatorFormat))
+    def test_iter_gradient_stops_matches_list(self, steps, output):
+        """Test that iter_gradient_stops yields the same values as gradient_stops."""
+        colors = ["#000091", "#FFF", "#E1000F", "#00FF00"]
+        expected = Colorisator.gradient_stops(colors, steps=steps, output=output)
+        result = Colorisator.iter_gradient_stops(colors, steps=steps, output=output)
+        if isinstance(expected, str):
+            assert "".join(result) == expected
+        else:
+            assert list(result) == expected
+
+    def test_iter_gradient_is_lazy(self):
+        """Test that iter_gradient does not build the whole gradient."""
+        result = Colorisator("#FF0000").iter_gradient("#0000FF", steps=10**9, output="hex")
+        assert next(result) == "#FF0000"
+
 
 class TestColorisatorOutputFormats:
     """Test different output formats."""
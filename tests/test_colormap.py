@@ -0,0 +1,86 @@
+"""Tests for the Colormap class."""
+
+import math
+from array import array
+
+import pytest
+
+from colorisator import Colorisator, Colormap
+
+
+STOPS = ["#000000", "#FFFFFF"]
+
+
+class TestColormap:
+    """Test scalar data colorization."""
+
+    def test_linear(self):
+        """Test linear normalization with explicit limits."""
+        cmap = Colormap(STOPS, vmin=0, vmax=10)
+        assert cmap.apply(array("d", [0, 5, 10])) == bytearray([0, 0, 0, 255, 128, 128, 128, 255, 255, 255, 255, 255])
+
+    def test_auto_limits(self):
+        """Test limits computed from the data, ignoring NaN."""
+        cmap = Colormap(STOPS)
+        pixels = cmap.apply([math.nan, 2.0, 4.0])
+        assert pixels == bytearray([0, 0, 0, 0, 0, 0, 0, 255, 255, 255, 255, 255])
+
+    def test_infinite_values(self):
+        """Test that infinities are left out of auto limits and use the under/over colors."""
+        cmap = Colormap(["#000", "#fff"])
+        assert cmap.apply([0.0, 1.0, math.inf]) == bytearray([0, 0, 0, 255] + [255] * 8)
+        assert cmap.apply([-math.inf, 1, 2]) == bytearray([0, 0, 0, 255, 0, 0, 0, 255, 255, 255, 255, 255])
+        cmap = Colormap(STOPS, clip=False, under="#0000FF", over="#FF0000")
+        assert cmap.apply([-math.inf, 0, 10, math.inf])[:4] == bytearray([0, 0, 255, 255])
+        assert cmap.apply([-math.inf, 0, 10, math.inf])[12:] == bytearray([255, 0, 0, 255])
+        assert cmap.apply([math.inf]) == bytearray([255, 0, 0, 255])
+
+    def test_log(self):
+        """Test log normalization and non-positive values."""
+        cmap = Colormap(STOPS, norm="log", vmin=1, vmax=100, bad="#FF0000")
+        pixels = cmap.apply(array("f", [1, 10, 100, 0]))
+        assert list(pixels[4:8]) == [128, 128, 128, 255]
+        assert list(pixels[12:16]) == [255, 0, 0, 255]
+
+    def test_clip_and_out_of_range(self):
+        """Test end colors when clipping, under/over colors otherwise."""
+        values = [-1, 11]
+        assert Colormap(STOPS, vmin=0, vmax=10).apply(values) == bytearray([0, 0, 0, 255, 255, 255, 255, 255])
+        cmap = Colormap(STOPS, vmin=0, vmax=10, clip=False, under="#0000FF", over="#FF0000")
+        assert cmap.apply(values) == bytearray([0, 0, 255, 255, 255, 0, 0, 255])
+
+    def test_invalid(self):
+        """Test norm and limit checks."""
+        with pytest.raises(ValueError):
+            Colormap(STOPS, norm="sqrt")
+        with pytest.raises(ValueError):
+            Colormap(STOPS, norm="log", vmin=0)
+        with pytest.raises(ValueError, match="finite"):
+            Colormap(STOPS, vmax=math.inf)
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_chunks_and_workers(self, workers):
+        """Test that chunked encoding in the current process and in worker processes give the same pixels."""
+        values = array("d", [(i % 97) / 96 for i in range(5000)])
+        cmap = Colormap(["#000091", "#FFF", "#E1000F"], vmin=0, vmax=1)
+        expected = b"".join(cmap.lut.lookup(v).tobytes() for v in values)
+        assert cmap.apply(values, workers=workers, chunk_size=333) == expected
+
+    def test_out_buffer(self):
+        """Test writing into an existing buffer."""
+        out = bytearray(12)
+        Colormap(STOPS, vmin=0, vmax=1).apply([1], out=out)
+        assert out == bytearray([255] * 4 + [0] * 8)
+        with pytest.raises(ValueError):
+            Colormap(STOPS).apply([1, 2, 3, 4], out=out)
+
+    def test_multidimensional_buffer(self):
+        """Test 2-D buffers are read without a copy."""
+        data = memoryview(array("d", [0, 1, 2, 3])).cast("B").cast("d", (2, 2))
+        assert len(Colormap(STOPS).apply(data)) == 16
+
+    def test_single_value(self):
+        """Test colorizing a single value."""
+        cmap = Colormap(STOPS, vmin=0, vmax=2)
+        assert cmap(1, output="hex") == "#808080"
+        assert cmap(math.nan) == Colorisator("#00000000")
@@ -0,0 +1,159 @@
+"""Tests for CSS color string parsing."""
+
+import colorsys
+
+import pytest
+
+from colorisator import Colorisator
+from colorisator.css import NAMED_COLORS, parse_css
+
+
+class TestNamedColors:
+    """Test named colors and transparent."""
+
+    def test_table(self):
+        """Test the size and read-only table of named colors."""
+        assert len(NAMED_COLORS) == 148
+        assert NAMED_COLORS["rebeccapurple"] == Colorisator("#663399").get_rgb()
+        with pytest.raises(TypeError):
+            NAMED_COLORS["red"] = (0, 0, 0)
+
+    def test_names_are_not_hex(self):
+        """Test that no name could be read as a hex color without "#"."""
+        for name in NAMED_COLORS:
+            assert not (len(name) in (3, 4, 6, 8) and all(c in "0123456789abcdef" for c in name))
+
+    @pytest.mark.parametrize("value, expected", [
+        ("red", "#FF0000"),
+        ("Red", "#FF0000"),
+        (" NAVY ", "#000080"),
+        ("grey", "#808080"),
+        ("rebeccapurple", "#663399"),
+    ])
+    def test_names(self, value, expected):
+        """Test case-insensitive names, equal to their hex value."""
+        assert Colorisator(value) == Colorisator(expected)
+
+    def test_alpha(self):
+        """Test that named colors take the alpha argument and transparent is fully transparent."""
+        assert Colorisator("red", 0.5).a == 0.5
+        assert parse_css("transparent") == (0.0, 0.0, 0.0, 0.0)
+        assert Colorisator("transparent", 0.5).a == 0.0
+
+    def test_unknown(self):
+        """Test that unknown names are not CSS colors."""
+        assert parse_css("notacolor") is None
+        with pytest.raises(ValueError, match="Unsupported format"):
+            Colorisator("notacolor")
+
+
+class TestRGB:
+    """Test rgb() and rgba()."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("rgb(255 0 0)", (1.0, 0.0, 0.0, 1.0)),
+        ("rgb(255, 0, 0)", (1.0, 0.0, 0.0, 1.0)),
+        ("RGB( 255 ,0,0 )", (1.0, 0.0, 0.0, 1.0)),
+        ("rgba(255, 0, 0, 0.5)", (1.0, 0.0, 0.0, 0.5)),
+        ("rgba(255 0 0)", (1.0, 0.0, 0.0, 1.0)),
+        ("rgb(255 0 0 / 50%)", (1.0, 0.0, 0.0, 0.5)),
+        ("rgb(255 0 0/.25)", (1.0, 0.0, 0.0, 0.25)),
+        ("rgb(100% 50% 0%)", (1.0, 0.5, 0.0, 1.0)),
+        ("rgb(127.5 +0 1e2)", (0.5, 0.0, 100 / 255, 1.0)),
+        ("rgb(100% 0 none)", (1.0, 0.0, 0.0, 1.0)),
+        ("rgb(300 -5 0 / 2)", (1.0, 0.0, 0.0, 1.0)),
+    ])
+    def test_valid(self, value, expected):
+        """Test modern and legacy syntax, percentages, none and clamping."""
+        assert parse_css(value) == pytest.approx(expected)
+
+    def test_same_as_hex(self):
+        """Test that integer channels give exactly the floats of the hex parser."""
+        for i in range(256):
+            assert Colorisator(f"rgb({i} {255 - i} {i // 2})") == Colorisator((i, 255 - i, i // 2))
+            assert parse_css(f"rgb({i}, 0, 0)")[0] == Colorisator(f"#{i:02X}0000").r
+
+    def test_alpha_argument(self):
+        """Test that the alpha argument is used when the function has no alpha."""
+        assert Colorisator("rgb(255 0 0)", 0.3).a == 0.3
+        assert Colorisator("rgb(255 0 0 / 0.6)", 0.3).a == 0.6
+
+    @pytest.mark.parametrize("value", [
+        "rgb(1 2)",
+        "rgb(1 2 3 4)",
+        "rgb(1, 2 3)",
+        "rgb(1, 2, 3,)",
+        "rgb(1, 2, 3 / 4)",
+        "rgb(1 2 3 /)",
+        "rgb(1 2 / 3 4)",
+        "rgb(1%, 2, 3)",
+        "rgb(a b c)",
+        "rgb(1_0 2 3)",
+        "rgb(inf 2 3)",
+        "rgb(1 2 3",
+        "rgb(1 2 3))",
+    ])
+    def test_invalid(self, value):
+        """Test that malformed functions raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid CSS color"):
+            Colorisator(value)
+
+
+class TestHSL:
+    """Test hsl() and hsla()."""
+
+    @pytest.mark.parametrize("value, hls", [
+        ("hsl(120 100% 50%)", (1 / 3, 0.5, 1.0)),
+        ("hsl(120, 100%, 25%)", (1 / 3, 0.25, 1.0)),
+        ("hsl(-120 100% 50%)", (2 / 3, 0.5, 1.0)),
+        ("hsl(480deg 100 50)", (1 / 3, 0.5, 1.0)),
+        ("hsl(0.5turn 100% 50%)", (0.5, 0.5, 1.0)),
+        ("hsl(200grad 100% 50%)", (0.5, 0.5, 1.0)),
+        ("hsl(3.141592653589793rad 100% 50%)", (0.5, 0.5, 1.0)),
+        ("hsl(none 0% 100%)", (0.0, 1.0, 0.0)),
+        ("hsla(240, 50%, 40%)", (2 / 3, 0.4, 0.5)),
+    ])
+    def test_valid(self, value, hls):
+        """Test hues in degrees and angle units, modern and legacy syntax."""
+        assert parse_css(value) == pytest.approx((*colorsys.hls_to_rgb(*hls), 1.0))
+
+    def test_alpha(self):
+        """Test hsl alpha as number and percentage."""
+        assert parse_css("hsla(120deg, 100%, 50%, 0.25)")[3] == 0.25
+        assert parse_css("hsl(120 100% 50% / 40%)")[3] == pytest.approx(0.4)
+
+    @pytest.mark.parametrize("value", [
+        "hsl(120, 100, 50)",
+        "hsl(120foo 100% 50%)",
+        "hsl(120 100% 50%, 1)",
+        "hsl()",
+    ])
+    def test_invalid(self, value):
+        """Test that malformed functions raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid CSS color"):
+            Colorisator(value)
+
+
+class TestColorisatorIntegration:
+    """Test CSS strings through Colorisator construction."""
+
+    def test_hex_still_first(self):
+        """Test that bare hex strings keep their meaning and "#" strings are hex only."""
+        assert Colorisator("add") == Colorisator("#AADDDD")
+        with pytest.raises(ValueError, match="Invalid hex color"):
+            Colorisator("#red")
+
+    def test_parse_cache(self):
+        """Test that CSS strings are cached, separately from "#" strings."""
+        Colorisator.enable_parse_cache()
+        try:
+            Colorisator("rgb(255 0 0)")
+            Colorisator("RGB(255 0 0)")
+            assert Colorisator.parse_cache_info().hits == 1
+            with pytest.raises(ValueError):
+                Colorisator("#red")
+            assert Colorisator("red") == Colorisator("#F00")
+            with pytest.raises(ValueError):
+                Colorisator("#red")
+        finally:
+            Colorisator.disable_parse_cache()
@@ -0,0 +1,44 @@
+"""Tests for bulk deduplication."""
+
+from array import array
+
+from colorisator import ColorArray, Colorisator, group_by_equal, unique
+
+
+COLORS = ["#FF0000", "#00FF00", (255, 0, 0), "#ff0000", Colorisator("#FF0000", alpha=0.5), "#00FF00"]
+
+
+class TestDedup:
+    """Test unique and group_by_equal."""
+
+    def test_unique(self):
+        """Test that the first occurrence of each color is kept, in order."""
+        result = unique(COLORS)
+        assert isinstance(result, ColorArray)
+        assert result.get_hex_alpha() == ["#FF0000FF", "#00FF00FF", "#FF000080"]
+        assert unique(COLORS, output="hex") == ["#FF0000", "#00FF00", "#FF0000"]
+
+    def test_unique_matches_equality(self):
+        """Test that unique agrees with Colorisator.__eq__ and __hash__."""
+        colors = [Colorisator((i % 7 / 7, 0.5, 0.00001 * (i % 3))) for i in range(100)]
+        expected = []
+        for c in colors:
+            if c not in expected:
+                expected.append(c)
+        assert list(unique(colors)) == expected
+        assert len(set(colors)) == len(expected)
+
+    def test_unique_keeps_hls(self):
+        """Test that cached HLS values follow the kept colors."""
+        colors = ColorArray(["#336699", "#336699", "#993366"]).lighten(0.1)
+        assert unique(colors).get_hsl() == colors[::2].get_hsl()
+
+    def test_group_by_equal(self):
+        """Test that positions are grouped by color."""
+        assert group_by_equal(COLORS) == [[0, 2, 3], [1, 5], [4]]
+        assert group_by_equal([]) == []
+
+    def test_out_of_range_channels(self):
+        """Test that packed keys stay distinct for channels outside 0.0-1.0."""
+        data = array("d", [2.0, 0.0, 0.0, 1.0, 0.0, 1.0, 0.0, 1.0, -1.0, 0.0, 0.0, 1.0, 2.0, 0.0, 0.0, 1.0])
+        assert group_by_equal(ColorArray._from_data(data)) == [[0, 3], [1], [2]]
@@ -0,0 +1,89 @@
+"""Tests for the delta E functions."""
+
+import random
+
+import pytest
+
+from colorisator import ColorArray, Colorisator, close_pairs, delta_e, delta_e_many, delta_e_matrix
+from colorisator.delta_e import _cie94, _ciede2000
+
+
+# Reference pairs from Sharma, Wu and Dalal, "The CIEDE2000 Color-Difference Formula" (2005).
+SHARMA = [
+    ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+    ((50.0, 3.1571, -77.2803), (50.0, 0.0, -82.7485), 2.8615),
+    ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+    ((50.0, 2.5, 0.0), (50.0, 0.0, -2.5), 4.3065),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((22.7233, 20.0904, -46.694), (23.0331, 14.973, -42.5619), 2.0373),
+]
+
+RNG = random.Random(3)
+COLORS = [(RNG.random(), RNG.random(), RNG.random()) for _ in range(70)]
+
+
+class TestDeltaE:
+    """Test scalar and one-to-many differences."""
+
+    @pytest.mark.parametrize("lab1, lab2, expected", SHARMA)
+    def test_ciede2000_reference(self, lab1, lab2, expected):
+        """Test CIEDE2000 against published reference data."""
+        assert _ciede2000(*lab1, *lab2) == pytest.approx(expected, abs=1e-4)
+        assert _ciede2000(*lab2, *lab1) == pytest.approx(expected, abs=1e-4)
+
+    def test_cie94_reference(self):
+        """Test CIE94 with graphic arts weights."""
+        assert _cie94(50, 20, 0, 50, 0, 20) == pytest.approx(20.0 * 2 ** 0.5 / 1.3, rel=1e-9)
+
+    @pytest.mark.parametrize("method", ["cie76", "cie94", "ciede2000"])
+    def test_identity(self, method):
+        """Test that identical colors have no difference, whatever their alpha."""
+        assert delta_e("#336699", Colorisator("#336699", alpha=0.5), method) == 0
+
+    def test_cie76(self):
+        """Test that CIE76 is the Euclidean distance in CIELAB."""
+        a, b = Colorisator("#FF0000"), Colorisator("#00FF00")
+        expected = sum((x - y) ** 2 for x, y in zip(a.get_lab(), b.get_lab())) ** 0.5
+        assert delta_e(a, b, method="CIE76") == pytest.approx(expected)
+
+    def test_many(self):
+        """Test that one-to-many matches the scalar function."""
+        result = delta_e_many("#808080", ColorArray(COLORS[:10]), method="cie94")
+        assert list(result) == [delta_e("#808080", c, "cie94") for c in COLORS[:10]]
+
+    def test_invalid_method(self):
+        """Test that unknown methods are rejected."""
+        with pytest.raises(ValueError):
+            delta_e("#000000", "#FFFFFF", method="cmc")
+        with pytest.raises(ValueError):
+            close_pairs(COLORS, 1.0, method="cmc")
+
+
+class TestPairwise:
+    """Test blocked pairwise computations."""
+
+    @pytest.mark.parametrize("method", ["cie76", "cie94", "ciede2000"])
+    def test_matrix(self, method):
+        """Test that the blocked matrix matches scalar calls."""
+        matrix = delta_e_matrix(COLORS, method, block_size=16)
+        assert len(matrix) == len(COLORS)
+        for i in (0, 15, 16, 69):
+            for j in (0, 17, 40, 69):
+                assert matrix[i][j] == pytest.approx(delta_e(COLORS[i], COLORS[j], method), abs=1e-12)
+
+    def test_block_size_independent(self):
+        """Test that the block size does not change the matrix."""
+        assert delta_e_matrix(COLORS, block_size=7) == delta_e_matrix(COLORS, block_size=100)
+
+    def test_close_pairs(self):
+        """Test that close pairs match a filtered matrix."""
+        matrix = delta_e_matrix(COLORS)
+        expected = [(i, j, matrix[i][j]) for i in range(70) for j in range(i + 1, 70) if matrix[i][j] < 15]
+        assert expected
+        assert close_pairs(COLORS, 15, block_size=16) == expected
+        assert close_pairs(["#000000", "#FFFFFF"], 1.0) == []
+
+    def test_workers(self):
+        """Test that worker processes give the same results."""
+        assert close_pairs(COLORS, 15, block_size=16, workers=2) == close_pairs(COLORS, 15, block_size=16)
+        assert delta_e_matrix(COLORS, block_size=32, workers=2) == delta_e_matrix(COLORS, block_size=32)
@@ -0,0 +1,89 @@
+"""Tests for the output format registry."""
+
+import io
+
+import pytest
+
+from colorisator import Colorisator, ColorisatorFormat, ColorArray, ColorFormatter, register_format, write_colors
+from colorisator.formats import _formatters
+
+
+COLORS = [Colorisator(c) for c in ("#FF0000", "#3543CA80", "#808080", "#FFE8E0")]
+
+
+class CSSFormatter(ColorFormatter):
+    def encode(self, data, hls=None):
+        return [f"rgb({r} {g} {b})" for r, g, b in ColorArray._from_data(data).get_rgb255()]
+
+
+@pytest.fixture
+def css_format():
+    register_format("CSS", CSSFormatter())
+    yield
+    del _formatters["css"]
+
+
+class TestFormatRegistry:
+    """Test built-in and custom output formats."""
+
+    @pytest.mark.parametrize("output, method", [
+        (ColorisatorFormat.HEX, "get_hex"),
+        (ColorisatorFormat.HEXALPHA, "get_hex_alpha"),
+        (ColorisatorFormat.WEB, "get_web"),
+        (ColorisatorFormat.RGB, "get_rgb"),
+        (ColorisatorFormat.RGBA, "get_rgba"),
+        (ColorisatorFormat.RGB255, "get_rgb255"),
+        (ColorisatorFormat.HSL, "get_hsl"),
+    ])
+    def test_bulk_matches_getters(self, output, method):
+        """Test that bulk encoders give the same values as the getters."""
+        colors = COLORS + [Colorisator("#FFFFFF")._lerp("#000000", -0.01)]
+        assert Colorisator._format_output(colors, output) == [getattr(c, method)() for c in colors]
+
+    def test_declarations(self):
+        """Test UNITY and PROCESSING outputs."""
+        assert Colorisator._format_output(COLORS[0], "unity") == COLORS[0].to_unity()
+        assert Colorisator._format_output(COLORS[:2], "processing") == \
+            "color[] palette = { color(255, 0, 0), color(53, 67, 202) };"
+
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            COLORS[0].lighten(output="cmyk")
+
+    def test_register_requires_formatter(self):
+        """Test that only ColorFormatter instances can be registered."""
+        with pytest.raises(TypeError):
+            register_format("css", str)
+
+    def test_custom_format(self, css_format):
+        """Test a registered format everywhere an output is accepted."""
+        assert COLORS[0].invert(output="css") == "rgb(0 255 255)"
+        assert Colorisator.gradient("#000", "#FFF", 3, output="css")[1] == "rgb(128 128 128)"
+        assert ColorArray(COLORS).get_hex() == ColorArray(COLORS)._format_output(ColorisatorFormat.HEX)
+        assert ColorArray(COLORS[:1])._format_output("css") == ["rgb(255 0 0)"]
+
+
+class TestWriteColors:
+    """Test streaming writers."""
+
+    def test_write_lines(self):
+        """Test list formats, one value per line."""
+        stream = io.StringIO()
+        assert write_colors(stream, COLORS, ColorisatorFormat.HEX, chunk_size=3) == 4
+        assert stream.getvalue() == "#FF0000\n#3543CA\n#808080\n#FFE8E0\n"
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 100])
+    def test_write_declaration(self, chunk_size):
+        """Test declaration formats are written in one piece."""
+        stream = io.StringIO()
+        write_colors(stream, ColorArray(COLORS), ColorisatorFormat.UNITY, chunk_size=chunk_size)
+        assert stream.getvalue() == Colorisator._format_output(COLORS, ColorisatorFormat.UNITY)
+
+    def test_write_generator(self):
+        """Test writing a lazy gradient."""
+        stream = io.StringIO()
+        write_colors(stream, Colorisator.iter_gradient("#000", "#FFF", steps=1000), "hsl", chunk_size=64)
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 1000
+        assert lines[-1] == str(Colorisator("#FFF").get_hsl())
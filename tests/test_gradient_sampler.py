@@ -0,0 +1,78 @@
+"""Tests for the GradientSampler class."""
+
+import pytest
+
+from colorisator import Colorisator, ColorisatorFormat, ColorArray, GradientSampler
+
+
+STOPS = ["#000091", "#FFFFFF", "#E1000F80"]
+
+
+class TestGradientSamplerInit:
+    """Test GradientSampler construction."""
+
+    def test_default_positions(self):
+        """Test evenly spaced default positions."""
+        sampler = GradientSampler(STOPS)
+        assert sampler.positions == [0.0, 0.5, 1.0]
+
+    def test_too_few_stops(self):
+        """Test that at least two stops are required."""
+        with pytest.raises(ValueError):
+            GradientSampler(["#FF0000"])
+
+    def test_invalid_positions(self):
+        """Test position count and order checks."""
+        with pytest.raises(ValueError):
+            GradientSampler(STOPS, positions=[0, 1])
+        with pytest.raises(ValueError):
+            GradientSampler(STOPS, positions=[0, 0.8, 0.5])
+
+
+class TestGradientSamplerSample:
+    """Test sampling at arbitrary positions."""
+
+    def test_sample_stops(self):
+        """Test that stop positions return the stop colors."""
+        sampler = GradientSampler(STOPS, positions=[0, 0.25, 1])
+        assert sampler.sample(0.25) == Colorisator("#FFFFFF")
+        assert sampler.sample(1) == Colorisator("#E1000F80")
+
+    def test_sample_clamped(self):
+        """Test that positions outside the stops are clamped."""
+        sampler = GradientSampler(STOPS, positions=[0.2, 0.5, 0.8])
+        assert sampler.sample(-1, output=ColorisatorFormat.HEX) == "#000091"
+        assert sampler.sample(2, output=ColorisatorFormat.HEXALPHA) == "#E1000F80"
+
+    def test_sample_matches_lerp(self):
+        """Test interpolation inside a segment."""
+        sampler = GradientSampler(STOPS, positions=[0, 0.25, 1])
+        expected = Colorisator("#FFFFFF")._lerp("#E1000F80", 0.5)
+        assert sampler.sample(0.625) == expected
+
+    def test_hard_stop(self):
+        """Test two stops at the same position."""
+        sampler = GradientSampler(["#F00", "#0F0", "#00F"], positions=[0, 0.5, 0.5])
+        assert sampler.sample(0.5, output="hex") == "#0000FF"
+
+    def test_sample_many(self):
+        """Test batched sampling."""
+        sampler = GradientSampler(STOPS, positions=[0, 0.25, 1])
+        ts = [0, 0.1, 0.3, 0.99, 1.5]
+        result = sampler.sample_many(ts)
+        assert isinstance(result, ColorArray)
+        assert list(result) == [sampler.sample(t) for t in ts]
+        assert sampler.sample_many(ts, output="hex") == [sampler.sample(t, "hex") for t in ts]
+
+    def test_evenly_spaced_matches_gradient_stops(self):
+        """Test evenly spaced samples against gradient_stops."""
+        sampler = GradientSampler(STOPS)
+        ts = [k / 8 for k in range(9)]
+        assert list(sampler.sample_many(ts)) == Colorisator.gradient_stops(STOPS, steps=9)
+
+    @pytest.mark.parametrize("steps", [3, 5, 6, 10, 256])
+    @pytest.mark.parametrize("output", list(ColorisatorFormat))
+    def test_gradient_matches_gradient_stops(self, steps, output):
+        """Test gradient against gradient_stops for every format."""
+        sampler = GradientSampler(STOPS)
+        assert sampler.gradient(steps, output) == Colorisator.gradient_stops(STOPS, steps=steps, output=output)
@@ -0,0 +1,64 @@
+"""Tests for image recoloring."""
+
+from array import array
+
+import pytest
+
+from colorisator import Colorisator, recolor_buffer, recolor_image
+
+
+PIXELS = bytes([255, 0, 0, 255, 53, 67, 202, 128, 128, 128, 128, 0, 255, 232, 224, 64] * 5)
+
+
+def steps():
+    return Colorisator.pipeline().lighten(0.1).saturate(0.2).adjust_hue(0.3).invert().grayscale()
+
+
+def expected(pixels, size=4):
+    out = bytearray()
+    for i in range(0, len(pixels), size):
+        color = Colorisator.from_buffer(pixels[i:i + size], "rgba" if size == 4 else "rgb")
+        color = color.lighten(0.1).saturate(0.2).adjust_hue(0.3).invert().grayscale()
+        out += bytes(color.get_rgb255()) + (bytes([round(color.a * 255)]) if size == 4 else b"")
+    return out
+
+
+class TestRecolorBuffer:
+    """Test in-place buffer recoloring."""
+
+    @pytest.mark.parametrize("tile_pixels", [1, 3, 1000])
+    def test_matches_colorisator(self, tile_pixels):
+        """Test that every pixel matches the per-pixel Colorisator result."""
+        buffer = bytearray(PIXELS)
+        assert recolor_buffer(buffer, steps(), tile_pixels=tile_pixels) is buffer
+        assert buffer == expected(PIXELS)
+
+    def test_rgb_layout(self):
+        """Test buffers without alpha."""
+        rgb = bytes(b for i, b in enumerate(PIXELS) if i % 4 != 3)
+        buffer = array("B", rgb)
+        recolor_buffer(buffer, steps(), layout="rgb")
+        assert buffer.tobytes() == expected(rgb, size=3)
+
+    def test_workers(self):
+        """Test recoloring with worker processes."""
+        buffer = bytearray(PIXELS)
+        recolor_buffer(buffer, steps(), tile_pixels=4, workers=2)
+        assert buffer == expected(PIXELS)
+
+    def test_invalid_size(self):
+        """Test truncated buffers."""
+        with pytest.raises(ValueError):
+            recolor_buffer(bytearray(7), steps())
+
+
+class TestRecolorImage:
+    """Test Pillow image recoloring."""
+
+    def test_image(self):
+        """Test that image tiles are recolored and reassembled."""
+        Image = pytest.importorskip("PIL.Image")
+        image = Image.frombytes("RGBA", (4, 5), PIXELS)
+        result = recolor_image(image, steps(), tile_rows=2)
+        assert result.size == (4, 5)
+        assert result.tobytes() == expected(PIXELS)
@@ -0,0 +1,211 @@
+"""Tests for the opt-in instrumentation layer."""
+
+import colorsys
+import io
+import logging
+import threading
+
+import pytest
+
+import colorisator.colorisator as colorisator_module
+from colorisator import ColorArray, ColorFormatter, Colorisator, instrument, register_format
+from colorisator.formats import _formatters, get_formatter
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    instrument.disable()
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+    Colorisator.disable_parse_cache()
+
+
+class TestEnableDisable:
+    """Test that instrumentation is swapped in and out."""
+
+    def test_disabled_by_default(self):
+        """Test that nothing is counted while disabled."""
+        Colorisator("#FF0000").lighten(0.1, output="hex")
+        assert not instrument.is_enabled()
+        assert instrument.snapshot() == ({}, {})
+
+    def test_disable_restores_originals(self):
+        """Test that disabling puts back the original functions."""
+        originals = dict(vars(Colorisator))
+        instrument.enable()
+        instrument.enable()
+        assert vars(Colorisator)["__init__"] is not originals["__init__"]
+        instrument.disable()
+        assert dict(vars(Colorisator)) == originals
+        assert "encode" not in vars(get_formatter("hex"))
+        assert "encode_bytes" not in vars(get_formatter("hex"))
+        assert colorisator_module.colorsys is colorsys
+
+    def test_formatter_instance_attributes_kept(self):
+        """Test that disabling keeps encode functions set on a formatter instance."""
+        formatter = ColorFormatter()
+        formatter.encode = lambda data, hls: ["x"] * (len(data) // 4)
+        register_format("instance_encode", formatter)
+        try:
+            instrument.enable()
+            assert ColorArray(["#FF0000"])._format_output("instance_encode") == ["x"]
+            instrument.disable()
+            assert ColorArray(["#FF0000"])._format_output("instance_encode") == ["x"]
+            assert instrument.snapshot().counters["encode.instance_encode"] == 1
+        finally:
+            del _formatters["instance_encode"]
+
+    def test_results_unchanged(self):
+        """Test that instrumented code returns the same results."""
+        expected = Colorisator.gradient("#FF0000", "#0000FF", 7, output="hsl")
+        instrument.enable()
+        assert Colorisator.gradient("#FF0000", "#0000FF", 7, output="hsl") == expected
+
+
+class TestCounters:
+    """Test counters, snapshot and reset."""
+
+    def test_counters(self):
+        """Test constructions, parsing, HLS conversions and encode calls."""
+        instrument.enable()
+        color = Colorisator("#FF0000")
+        color.lighten(0.1, output="hex")
+        ColorArray(["#00FF00", "#0000FF"])._format_output("rgb")
+        counters = instrument.snapshot().counters
+        assert counters["constructions"] == 4
+        assert counters["parse_input"] == 3
+        assert counters["rgb_to_hls"] == 1
+        assert counters["hls_to_rgb"] == 1
+        assert counters["update_from_hls"] == 1
+        assert counters["format_output"] == 2
+        assert counters["encode.hex"] == 1
+        assert counters["encode.rgb"] == 1
+
+    def test_hls_conversions(self):
+        """Test HLS conversions of the hls gradient space and of CSS hsl() colors."""
+        instrument.enable()
+        Colorisator.gradient("#FF0000", "#0000FF", 5, space="hls", output="hex")
+        Colorisator("hsl(120 100% 50%)")
+        counters = instrument.snapshot().counters
+        assert counters["rgb_to_hls"] == 2
+        assert counters["hls_to_rgb"] == 6
+
+    def test_parse_cache(self):
+        """Test parse cache hits and misses."""
+        Colorisator.enable_parse_cache()
+        instrument.enable()
+        for _ in range(3):
+            Colorisator("#FF0000")
+        counters = instrument.snapshot().counters
+        assert counters["parse_cache_misses"] == 1
+        assert counters["parse_cache_hits"] == 2
+
+    def test_timings(self):
+        """Test that timed steps record cumulative seconds."""
+        instrument.enable()
+        Colorisator("#FF0000")
+        timings = instrument.snapshot().timings
+        assert timings["parse_input"] > 0
+        assert "constructions" not in timings
+
+    def test_reset(self):
+        """Test that reset clears counters but keeps instrumentation enabled."""
+        instrument.enable()
+        Colorisator("#FF0000")
+        instrument.reset()
+        assert instrument.snapshot() == ({}, {})
+        Colorisator("#FF0000")
+        assert instrument.snapshot().counters["constructions"] == 1
+
+    def test_counters_kept_after_disable(self):
+        """Test that disabling keeps the collected data."""
+        instrument.enable()
+        Colorisator("#FF0000")
+        instrument.disable()
+        Colorisator("#FF0000")
+        assert instrument.snapshot().counters["constructions"] == 1
+
+
+class TestProfile:
+    """Test the profile() context manager."""
+
+    def test_scope(self):
+        """Test that a profile records only its block and restores the disabled state."""
+        instrument.enable()
+        Colorisator("#FF0000")
+        instrument.disable()
+        with instrument.profile() as p:
+            assert instrument.is_enabled()
+            Colorisator.gradient("#FF0000", "#0000FF", 10, output="hex")
+        assert not instrument.is_enabled()
+        assert p.counters["parse_input"] == 2
+        assert p.counters["encode_bytes.hex"] == 1
+        assert p.timings["encode_bytes.hex"] > 0
+
+    def test_nested(self):
+        """Test nested profiles, and that an enclosing enable() is kept."""
+        instrument.enable()
+        with instrument.profile() as outer:
+            Colorisator("#FF0000")
+            with instrument.profile() as inner:
+                Colorisator("#00FF00")
+        assert instrument.is_enabled()
+        assert outer.counters["constructions"] == 2
+        assert inner.counters["constructions"] == 1
+
+    def test_threads(self):
+        """Test that overlapping profiles in two threads keep instrumentation until the last one exits."""
+        entered, exited = threading.Event(), threading.Event()
+        enabled_after_other_exit = []
+
+        def second():
+            with instrument.profile():
+                entered.set()
+                exited.wait(5)
+                enabled_after_other_exit.append(instrument.is_enabled())
+
+        with instrument.profile():
+            thread = threading.Thread(target=second)
+            thread.start()
+            entered.wait(5)
+        exited.set()
+        thread.join(5)
+        assert enabled_after_other_exit == [True]
+        assert not instrument.is_enabled()
+
+
+class TestExport:
+    """Test logging and Prometheus export."""
+
+    def test_log_snapshot(self, caplog):
+        """Test one log record per name."""
+        instrument.enable()
+        Colorisator("#FF0000")
+        with caplog.at_level(logging.DEBUG, logger="colorisator"):
+            instrument.log_snapshot(level=logging.DEBUG)
+        messages = [r.getMessage() for r in caplog.records]
+        assert "constructions: 1 calls" in messages
+        assert any(m.startswith("parse_input: 1 calls, ") for m in messages)
+
+    def test_prometheus_stream(self):
+        """Test the Prometheus text exposition format."""
+        with instrument.profile() as p:
+            Colorisator("#FF0000")
+        stream = io.StringIO()
+        instrument.write_prometheus(stream, p, prefix="app_colors")
+        lines = stream.getvalue().splitlines()
+        assert "# TYPE app_colors_calls_total counter" in lines
+        assert 'app_colors_calls_total{name="constructions"} 1' in lines
+        assert any(line.startswith('app_colors_seconds_total{name="parse_input"} ') for line in lines)
+
+    def test_prometheus_file(self, tmp_path):
+        """Test that the file is replaced and no temporary file is left behind."""
+        target = tmp_path / "colorisator.prom"
+        target.write_text("old")
+        instrument.enable()
+        Colorisator("#FF0000")
+        instrument.write_prometheus(str(target))
+        assert 'colorisator_calls_total{name="constructions"} 1' in target.read_text()
+        assert [f.name for f in tmp_path.iterdir()] == ["colorisator.prom"]
@@ -0,0 +1,79 @@
+"""Tests for the GradientLUT class."""
+
+import colorsys
+import struct
+import zlib
+from array import array
+
+import pytest
+
+from colorisator import Colorisator, GradientLUT, GradientSampler
+
+
+STOPS = ["#000091", "#FFFFFF", "#E1000F"]
+
+
+class TestGradientLUT:
+    """Test lookup table baking and export."""
+
+    def test_rgb_matches_sampler(self):
+        """Test that an RGB table holds evenly spaced gradient samples."""
+        lut = GradientLUT(STOPS, size=257)
+        assert len(lut) == 257
+        assert lut.colors == GradientSampler(STOPS).sample_many([i / 256 for i in range(257)])
+        assert lut[128] == Colorisator("#FFFFFF")
+
+    def test_hls_shortest_hue(self):
+        """Test that HLS interpolation goes the short way around the wheel."""
+        lut = GradientLUT(["#FF0066", "#FF6600"], size=3, space="hls")
+        assert lut[1].get_hex() == "#FF0000"
+
+    def test_hls_achromatic_stop(self):
+        """Test that gray stops keep the hue of their neighbour."""
+        lut = GradientLUT(["#FFFFFF", "#FF0000"], size=3, space="HLS")
+        assert lut[1].get_hex() == Colorisator(colorsys.hls_to_rgb(0, 0.75, 0.5)).get_hex()
+
+    def test_invalid(self):
+        """Test size and space checks."""
+        with pytest.raises(ValueError):
+            GradientLUT(STOPS, size=1)
+        with pytest.raises(ValueError):
+            GradientLUT(STOPS, space="cmyk")
+
+    def test_lookup(self):
+        """Test nearest entry lookup."""
+        lut = GradientLUT(["#000", "#FFF"], size=3)
+        assert lut.lookup(0.3, output="hex") == "#808080"
+        assert lut.lookup(2, output="hex") == "#FFFFFF"
+
+    def test_tobytes(self):
+        """Test packed uint8 and float32 exports."""
+        lut = GradientLUT(["#00000000", "#FF0000FF"], size=2)
+        assert lut.tobytes() == bytes([0, 0, 0, 0, 255, 0, 0, 255])
+        assert lut.tobytes(layout="bgra") == bytes([0, 0, 0, 0, 0, 0, 255, 255])
+        assert list(array("f", lut.tobytes("float32"))) == [0, 0, 0, 0, 1, 0, 0, 1]
+        with pytest.raises(ValueError):
+            lut.tobytes("float64")
+
+    def test_to_numpy(self):
+        """Test NumPy export."""
+        pytest.importorskip("numpy")
+        assert GradientLUT(STOPS, size=16).to_numpy().shape == (16, 4)
+
+    def test_save_raw(self, tmp_path):
+        """Test raw file export."""
+        lut = GradientLUT(STOPS, size=16)
+        lut.save_raw(tmp_path / "lut.raw")
+        assert (tmp_path / "lut.raw").read_bytes() == lut.tobytes()
+
+    def test_save_png(self, tmp_path):
+        """Test PNG strip export."""
+        lut = GradientLUT(STOPS, size=16)
+        lut.save_png(tmp_path / "lut.png", height=2)
+        png = (tmp_path / "lut.png").read_bytes()
+        assert png[:8] == b"\x89PNG\r\n\x1a\n"
+        width, height = struct.unpack(">II", png[16:24])
+        assert (width, height) == (16, 2)
+        length = struct.unpack(">I", png[33:37])[0]
+        pixels = zlib.decompress(png[41:41 + length])
+        assert pixels == (b"\x00" + lut.tobytes()) * 2
@@ -0,0 +1,92 @@
+"""Tests for packed 32-bit colors."""
+
+import random
+
+import pytest
+
+from colorisator import ColorArray, Colorisator, PackedArray, PackedColor
+
+
+RNG = random.Random(7)
+HEXES = [f"#{RNG.randrange(1 << 32):08X}" for _ in range(500)]
+
+
+class TestPackedColor:
+    """Test single packed colors against Colorisator."""
+
+    def test_init(self):
+        """Test construction from integers and color formats."""
+        assert PackedColor(0xFF000080).get_hex_alpha() == "#FF000080"
+        assert PackedColor("#FF0000", alpha=0.5).value == 0xFF000080
+        assert PackedColor((0, 255, 0)).value == 0x00FF00FF
+        assert PackedColor(Colorisator("#0000FF")).get_hex() == "#0000FF"
+        with pytest.raises(ValueError):
+            PackedColor(1 << 32)
+
+    def test_lossless(self):
+        """Test round trips with Colorisator for 8-bit colors."""
+        for h in HEXES:
+            packed = PackedColor(h)
+            color = packed.to_colorisator()
+            assert color == Colorisator(h)
+            assert color.get_rgba() == Colorisator(h).get_rgba()
+            assert PackedColor.from_colorisator(color) == packed
+
+    def test_getters(self):
+        """Test that getters match Colorisator."""
+        for h in HEXES:
+            packed, color = PackedColor(h), Colorisator(h)
+            assert packed.get_hex() == color.get_hex()
+            assert packed.get_hex_alpha() == color.get_hex_alpha()
+            assert packed.get_rgb255() == color.get_rgb255()
+
+    def test_operations_match(self):
+        """Test that integer operations give the same 8-bit results as Colorisator."""
+        for h in HEXES:
+            packed, color = PackedColor(h), Colorisator(h)
+            amount, t, other = RNG.random(), RNG.random(), RNG.choice(HEXES)
+            assert packed.invert().get_hex_alpha() == color.invert().get_hex_alpha()
+            assert packed.tint(amount).get_hex_alpha() == color.tint(amount).get_hex_alpha()
+            assert packed.shade(amount).get_hex_alpha() == color.shade(amount).get_hex_alpha()
+            assert packed._lerp(other, t).get_hex_alpha() == color._lerp(other, t).get_hex_alpha()
+
+    def test_hash(self):
+        """Test equality and hashing."""
+        assert len({PackedColor("#FF0000"), PackedColor(0xFF0000FF), PackedColor("#00FF00")}) == 2
+
+
+class TestPackedArray:
+    """Test packed collections."""
+
+    def test_storage(self):
+        """Test that colors take 4 bytes each."""
+        packed = PackedArray(HEXES)
+        assert len(packed) == 500
+        assert packed.nbytes == 4 * 500
+        assert packed.get_hex_alpha() == HEXES
+
+    def test_color_array_round_trip(self):
+        """Test lossless conversion with ColorArray."""
+        colors = ColorArray(HEXES)
+        packed = PackedArray(colors)
+        assert packed == PackedArray(HEXES)
+        assert packed.to_color_array() == colors
+
+    def test_items(self):
+        """Test indexing, slicing and iteration."""
+        packed = PackedArray(HEXES[:5])
+        assert packed[1] == PackedColor(HEXES[1])
+        assert packed[1:3].get_hex_alpha() == HEXES[1:3]
+        assert [c.get_hex_alpha() for c in packed] == HEXES[:5]
+
+    def test_operations_match(self):
+        """Test that batch operations match ColorArray."""
+        packed, colors = PackedArray(HEXES), ColorArray(HEXES)
+        assert packed.get_hex() == colors.get_hex()
+        assert packed.get_rgb255() == colors.get_rgb255()
+        assert packed.invert().get_hex_alpha() == colors.invert().get_hex_alpha()
+        assert packed.tint(0.35).get_hex_alpha() == colors.tint(0.35).get_hex_alpha()
+        assert packed.shade(0.35).get_hex_alpha() == colors.shade(0.35).get_hex_alpha()
+        assert packed._lerp("#808080", 0.25).get_hex_alpha() == colors._lerp("#808080", 0.25).get_hex_alpha()
+        with pytest.raises(ValueError):
+            packed._lerp(packed[:3], 0.5)
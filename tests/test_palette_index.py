@@ -0,0 +1,75 @@
+"""Tests for the PaletteIndex class."""
+
+import random
+
+import pytest
+
+from colorisator import Colorisator, ColorArray, PaletteIndex
+
+
+def brute_force(palette, color, k=1):
+    def distance(i):
+        p = palette[i]
+        return (p.r - color.r) ** 2 + (p.g - color.g) ** 2 + (p.b - color.b) ** 2, i
+    return [i for _, i in sorted(map(distance, range(len(palette))))[:k]]
+
+
+@pytest.fixture
+def palette():
+    rng = random.Random(42)
+    return [Colorisator((rng.random(), rng.random(), rng.random())) for _ in range(500)]
+
+
+@pytest.fixture
+def queries():
+    rng = random.Random(7)
+    return [Colorisator((rng.random(), rng.random(), rng.random())) for _ in range(200)]
+
+
+class TestPaletteIndex:
+    """Test nearest-color queries against a brute force scan."""
+
+    def test_nearest(self, palette, queries):
+        """Test single nearest queries."""
+        index = PaletteIndex(palette)
+        for q in queries:
+            assert index.nearest_index(q) == brute_force(palette, q)[0]
+
+    def test_k_nearest(self, palette, queries):
+        """Test k nearest queries, closest first."""
+        index = PaletteIndex(palette)
+        for q in queries[:50]:
+            assert index.k_nearest(q, k=5) == [palette[i] for i in brute_force(palette, q, 5)]
+
+    def test_k_larger_than_palette(self):
+        """Test k larger than the palette size."""
+        index = PaletteIndex(["#F00", "#0F0"])
+        assert index.k_nearest("#E00", k=5, output="hex") == ["#FF0000", "#00FF00"]
+
+    @pytest.mark.parametrize("k", [0, -1])
+    def test_invalid_k(self, k):
+        """Test that k must be at least 1."""
+        with pytest.raises(ValueError, match="k must be at least 1"):
+            PaletteIndex(["#000"]).k_nearest("#FFF", k=k)
+
+    def test_batch(self, palette, queries):
+        """Test batched queries."""
+        index = PaletteIndex(ColorArray(palette))
+        expected = [brute_force(palette, q)[0] for q in queries]
+        assert index.nearest_indices(queries) == expected
+        assert index.nearest_many(ColorArray(queries), output="hex") == [palette[i].get_hex() for i in expected]
+
+    def test_exact_and_ties(self):
+        """Test exact matches and ties resolved to the first palette color."""
+        index = PaletteIndex(["#000000", "#FFFFFF", "#000000"])
+        assert index.nearest("#010101", output="hex") == "#000000"
+        assert index.nearest_index("#000000") == 0
+
+    def test_invalid(self):
+        """Test empty palettes, unknown spaces and spaces with a hue axis."""
+        with pytest.raises(ValueError):
+            PaletteIndex([])
+        with pytest.raises(ValueError):
+            PaletteIndex(["#F00"], space="cmyk")
+        with pytest.raises(ValueError):
+            PaletteIndex(["#F00"], space="oklch")
@@ -0,0 +1,59 @@
+"""Tests for batch palette generation."""
+
+import random
+
+import pytest
+
+from colorisator import (
+    ColorArray, Colorisator, ColorisatorFormat,
+    palette_hue_shifts_many, palette_material_many, palette_monochromatic_many,
+)
+
+
+RNG = random.Random(4)
+BASES = [f"#{RNG.randrange(1 << 32):08X}" for _ in range(40)]
+
+CASES = [
+    (palette_hue_shifts_many, "palette_hue_shifts", (5,)),
+    (palette_hue_shifts_many, "palette_hue_shifts", ([0, 5 / 12, 0.5],)),
+    (palette_monochromatic_many, "palette_monochromatic", (4, 0.2)),
+    (palette_monochromatic_many, "palette_monochromatic", (1, 0.2)),
+    (palette_material_many, "palette_material", (9, 0.3)),
+    (palette_material_many, "palette_material", (1, 0.3)),
+]
+
+
+class TestBatchPalettes:
+    """Test that batch palettes match the single-color methods."""
+
+    @pytest.mark.parametrize("output", list(ColorisatorFormat))
+    @pytest.mark.parametrize("func, method, args", CASES)
+    def test_formats(self, func, method, args, output):
+        """Test every output format."""
+        expected = [getattr(Colorisator(b), method)(*args, output=output) for b in BASES]
+        assert func(BASES, *args, output=output, chunk_size=16) == expected
+
+    @pytest.mark.parametrize("func, method, args", CASES)
+    def test_color_array_rows(self, func, method, args):
+        """Test that rows are ColorArrays carrying the palette HLS values."""
+        rows = func(ColorArray(BASES), *args)
+        for base, row in zip(BASES, rows):
+            expected = getattr(Colorisator(base), method)(*args)
+            assert isinstance(row, ColorArray)
+            assert list(row) == expected
+            assert row.get_hsl() == [c.get_hsl() for c in expected]
+
+    def test_derived_bases(self):
+        """Test bases with cached HLS values."""
+        bases = ColorArray(BASES).lighten(0.15)
+        expected = [c.palette_material(5, output="hex") for c in bases]
+        assert palette_material_many(bases, 5, output="hex") == expected
+
+    def test_workers(self):
+        """Test that worker processes give the same rows."""
+        expected = palette_material_many(BASES, 9, output="hex")
+        assert palette_material_many(BASES, 9, output="hex", workers=2, chunk_size=8) == expected
+
+    def test_empty(self):
+        """Test an empty batch."""
+        assert palette_material_many([], output="hex") == []
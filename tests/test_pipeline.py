@@ -0,0 +1,73 @@
+"""Tests for the Pipeline class."""
+
+import pytest
+
+from colorisator import Colorisator, ColorisatorFormat, ColorArray, Pipeline
+
+
+COLORS = ["#FF0000", "#3543CA", "#808080", "#00FF0080", "#FFE8E0", "#000000"]
+
+
+def chain(color):
+    return color.lighten(0.1).saturate(0.2).adjust_hue(0.05).invert().darken(0.15).complement().tint(0.2)
+
+
+def pipeline():
+    return (
+        Colorisator.pipeline()
+        .lighten(0.1).saturate(0.2).adjust_hue(0.05)
+        .invert()
+        .darken(0.15).complement()
+        .tint(0.2)
+    )
+
+
+class TestPipeline:
+    """Test recorded operation chains."""
+
+    def test_builder_is_immutable(self):
+        """Test that adding a step returns a new pipeline."""
+        base = Colorisator.pipeline()
+        lighter = base.lighten()
+        assert isinstance(base, Pipeline)
+        assert (len(base), len(lighter)) == (0, 1)
+
+    def test_fuses_hls_steps(self):
+        """Test that consecutive HLS steps share one stage."""
+        assert [kind for kind, _ in pipeline()._compile()] == ["hls", "rgb", "hls", "rgb"]
+
+    @pytest.mark.parametrize("color", COLORS)
+    def test_apply_matches_chain(self, color):
+        """Test that a pipeline gives the same result as chained calls."""
+        expected = chain(Colorisator(color))
+        result = pipeline().apply(color)
+        assert result == expected
+        assert result.get_hsl() == expected.get_hsl()
+
+    def test_apply_carries_hls(self):
+        """Test that HLS values carried by a color are used."""
+        color = Colorisator("#FF0000").lighten(0.1)
+        steps = Colorisator.pipeline().saturate(0.1).grayscale()
+        assert steps(color).get_hsl() == color.saturate(0.1).grayscale().get_hsl()
+
+    def test_apply_output(self):
+        """Test output format."""
+        steps = Colorisator.pipeline().desaturate(0.2).shade(0.1)
+        assert steps.apply("#3543CA", output=ColorisatorFormat.HEX) == Colorisator("#3543CA").desaturate(0.2).shade(0.1).get_hex()
+
+    def test_empty_pipeline(self):
+        """Test that an empty pipeline returns the same color."""
+        assert Colorisator.pipeline().apply("#3543CA80") == Colorisator("#3543CA80")
+
+    def test_apply_many(self):
+        """Test batch application."""
+        result = pipeline().apply_many(COLORS)
+        assert isinstance(result, ColorArray)
+        assert list(result) == [chain(Colorisator(c)) for c in COLORS]
+
+    @pytest.mark.parametrize("output", list(ColorisatorFormat))
+    def test_apply_many_output(self, output):
+        """Test batch application with every output format."""
+        steps = Colorisator.pipeline().lighten(0.1).adjust_hue(0.3)
+        expected = Colorisator._format_output([c.lighten(0.1).adjust_hue(0.3) for c in map(Colorisator, COLORS)], output)
+        assert steps.apply_many(ColorArray(COLORS), output=output) == expected
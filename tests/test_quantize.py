@@ -0,0 +1,62 @@
+"""Tests for palette quantization."""
+
+import pytest
+
+from colorisator import Colorisator, ColorArray, quantize
+
+
+# 60% red, 30% blue, 10% white, with a little noise.
+PIXELS = (
+    bytes([250, 2, 0, 255, 255, 0, 4, 255]) * 300
+    + bytes([0, 0, 250, 255, 3, 5, 255, 255]) * 150
+    + bytes([255, 255, 255, 255]) * 100
+)
+
+
+class TestQuantize:
+    """Test dominant color extraction."""
+
+    def test_kmeans(self):
+        """Test that k-means finds the three clusters, most frequent first."""
+        colors = quantize(PIXELS, n=3, method="kmeans", bits=8)
+        assert [c.get_hex() for c in colors] == ["#FC0102", "#0202FC", "#FFFFFF"]
+
+    def test_median_cut(self):
+        """Test that median cut stops when every bin has its own box."""
+        colors = quantize(PIXELS, n=6, bits=8, output="hex")
+        assert colors == ["#FA0200", "#FF0004", "#0000FA", "#0305FF", "#FFFFFF"]
+        assert len(quantize(PIXELS, n=2, bits=8)) == 2
+
+    def test_output_and_bits(self):
+        """Test histogram bins and output format."""
+        assert quantize(PIXELS, n=3, method="kmeans", output="hex") == ["#FC0404", "#0404FC", "#FCFCFC"]
+
+    def test_fewer_colors_than_requested(self):
+        """Test images with fewer distinct colors than n."""
+        colors = quantize(bytes([255, 0, 0]) * 10, n=5, layout="rgb", bits=8)
+        assert colors == [Colorisator("#FF0000")]
+        assert quantize(bytes([255, 0, 0]) * 10, n=5, method="kmeans", layout="rgb", bits=8) == colors
+
+    def test_sources(self):
+        """Test ColorArray sources, layouts and downsampling."""
+        expected = quantize(PIXELS, n=2, bits=8)
+        assert quantize(ColorArray.frombuffer(PIXELS), n=2, bits=8) == expected
+        bgra = bytes(PIXELS[i + j] for i in range(0, len(PIXELS), 4) for j in (2, 1, 0, 3))
+        assert quantize(bgra, n=2, layout="bgra", bits=8) == expected
+        assert len(quantize(PIXELS, n=2, max_samples=50)) == 2
+        assert quantize(b"", n=2) == []
+
+    def test_image(self):
+        """Test Pillow image sources."""
+        Image = pytest.importorskip("PIL.Image")
+        image = Image.frombytes("RGBA", (len(PIXELS) // 4, 1), PIXELS)
+        assert quantize(image, n=2, bits=8) == quantize(PIXELS, n=2, bits=8)
+
+    def test_invalid(self):
+        """Test argument checks."""
+        with pytest.raises(ValueError):
+            quantize(PIXELS, method="octree")
+        with pytest.raises(ValueError):
+            quantize(PIXELS, bits=9)
+        with pytest.raises(ValueError):
+            quantize(PIXELS[:5])
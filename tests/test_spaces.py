@@ -0,0 +1,121 @@
+"""Tests for the perceptual color spaces."""
+
+import random
+
+import pytest
+
+from colorisator import ColorArray, Colorisator, GradientLUT, PaletteIndex
+from colorisator import spaces
+
+
+def approx(values, rel=1e-4, abs=1e-6):
+    return pytest.approx(values, rel=rel, abs=abs)
+
+
+class TestConversions:
+    """Test scalar conversions against reference values."""
+
+    def test_linear_table(self):
+        """Test that the 8-bit table matches the transfer function."""
+        for i in range(256):
+            assert spaces.srgb_to_linear(i / 255) == spaces._srgb_to_linear(i / 255)
+        assert spaces.srgb_to_linear(0.5) == pytest.approx(0.21404114)
+
+    def test_oklab_reference(self):
+        """Test OKLab values of primaries."""
+        assert Colorisator("#FFFFFF").get_oklab() == approx((1.0, 0.0, 0.0))
+        assert Colorisator("#FF0000").get_oklab() == approx((0.627955, 0.224863, 0.125846))
+        assert Colorisator("#0000FF").get_oklch() == approx((0.452014, 0.313214, 264.052021))
+
+    def test_lab_reference(self):
+        """Test CIELAB values of primaries."""
+        assert Colorisator("#FF0000").get_lab() == approx((53.2408, 80.0925, 67.2032))
+        assert Colorisator("#000000").get_lab() == approx((0.0, 0.0, 0.0))
+
+    @pytest.mark.parametrize("space", ["oklab", "oklch", "lab"])
+    def test_round_trip(self, space):
+        """Test that converting to a space and back keeps the color."""
+        rng = random.Random(0)
+        getter = getattr(Colorisator, f"get_{space}")
+        builder = getattr(Colorisator, f"from_{space}")
+        for _ in range(200):
+            color = Colorisator((rng.random(), rng.random(), rng.random()))
+            assert builder(*getter(color)).get_rgba() == approx(color.get_rgba(), abs=1e-5)
+
+    def test_from_clips_gamut(self):
+        """Test that out-of-gamut colors are clipped."""
+        color = Colorisator.from_oklch(0.7, 0.5, 150, alpha=0.5)
+        assert all(0 <= c <= 1 for c in color.get_rgb())
+        assert color.a == 0.5
+
+    def test_array_kernels(self):
+        """Test that batch conversions match the scalar ones."""
+        colors = ColorArray(["#FF0000", "#336699", "#FFFFFF"])
+        assert colors.get_oklab() == [c.get_oklab() for c in colors]
+        assert colors.get_lab() == [c.get_lab() for c in colors]
+        channels = spaces.to_space_array(colors._data, "oklab")
+        back = spaces.from_space_array(channels, "oklab", alpha=[1.0, 1.0, 1.0])
+        assert ColorArray._from_data(back).get_hex() == colors.get_hex()
+
+    def test_invalid_space(self):
+        """Test that unknown spaces are rejected."""
+        with pytest.raises(ValueError):
+            spaces.get_space("cmyk")
+        with pytest.raises(ValueError):
+            Colorisator.gradient("#000000", "#FFFFFF", space="cmyk")
+
+
+class TestGradientSpaces:
+    """Test gradients interpolated in perceptual spaces."""
+
+    def test_rgb_unchanged(self):
+        """Test that the default space gives the same gradient."""
+        default = Colorisator.gradient("#0000FF", "#FFFF00", 7, output="hex")
+        assert Colorisator.gradient("#0000FF", "#FFFF00", 7, output="hex", space="rgb") == default
+
+    @pytest.mark.parametrize("space", ["hls", "oklab", "oklch", "lab"])
+    def test_ends_and_outputs(self, space):
+        """Test that every path keeps the end colors and agrees with the others."""
+        grad = Colorisator.gradient("#0000FF", "#FFFF00", 9, space=space)
+        assert grad[0].get_hex() == "#0000FF"
+        assert grad[-1].get_hex() == "#FFFF00"
+        hexes = [c.get_hex() for c in grad]
+        assert Colorisator.gradient("#0000FF", "#FFFF00", 9, output="hex", space=space) == hexes
+        assert list(Colorisator.iter_gradient("#0000FF", "#FFFF00", 9, output="hex", space=space)) == hexes
+
+    def test_oklab_midpoint(self):
+        """Test that the midpoint sits halfway in OKLab."""
+        mid = Colorisator.gradient("#000000", "#FFFFFF", 3, space="oklab")[1]
+        assert mid.get_oklab()[0] == pytest.approx(0.5, abs=1e-6)
+
+    def test_oklch_shortest_hue(self):
+        """Test that OKLCH hues take the short way around the wheel."""
+        start, end = Colorisator("#FF0066"), Colorisator("#FF6600")
+        mid = Colorisator.gradient(start, end, 3, space="oklch")[1]
+        h0, h1 = start.get_oklch()[2], end.get_oklch()[2]
+        assert min(h0, h1) < mid.get_oklch()[2] < max(h0, h1)
+
+    def test_stops(self):
+        """Test multi-stop gradients in a perceptual space."""
+        stops = ["#FF0000", "#00FF00", "#0000FF"]
+        grad = Colorisator.gradient_stops(stops, steps=7, output="hex", space="oklab")
+        assert grad[0] == "#FF0000" and grad[3] == "#00FF00" and grad[-1] == "#0000FF"
+        assert [c.get_hex() for c in Colorisator.gradient_stops(stops, steps=7, space="oklab")] == grad
+        assert list(Colorisator.iter_gradient_stops(stops, steps=7, output="hex", space="oklab")) == grad
+
+
+class TestIntegrations:
+    """Test perceptual spaces in lookup tables and palette indexes."""
+
+    def test_lut_matches_gradient(self):
+        """Test that an OKLab table matches the OKLab gradient."""
+        lut = GradientLUT(["#000091", "#E1000F"], size=5, space="oklab")
+        assert lut.colors.get_hex() == Colorisator.gradient("#000091", "#E1000F", 5, output="hex", space="oklab")
+
+    def test_palette_index(self):
+        """Test nearest-color search in perceptual spaces."""
+        palette = ["#000000", "#FFFFFF", "#FF0000", "#0000FF"]
+        for space in ("oklab", "lab"):
+            index = PaletteIndex(palette, space=space)
+            assert index.nearest("#EE1111", output="hex") == "#FF0000"
+            assert index.nearest("#222233", output="hex") == "#000000"